@@ -1,220 +1,575 @@
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, jsonify, request, send_from_directory, make_response, g
 from flask_cors import CORS
 import pandas as pd
 import numpy as np
-import pickle
 import os
 from datetime import datetime
+from functools import wraps
+import threading
+import hashlib
+import time
 import json
 
+from dataset import Dataset
+from columns import category_mask, map_values
+from cube import EXPERIENCE_SCORES
+from response_cache import ResponseCache
+from reloader import ArtifactWatcher, artifact_paths, fingerprint
+from pagination import parse_page_args, page, encode_cursor
+from streaming import ndjson_chunks, json_array_chunks
+from encoding import FastJSONProvider, records, columnar
+from sampling import stratified_sample, scatter_histogram, MAX_BINS
+from memory import process_memory
+import metrics
+import profiling
+
+# Derived frames (row selections, merges, assign) share buffers with the dataset
+# instead of copying them; writes to a derived frame never reach the base tables
+pd.set_option('mode.copy_on_write', True)
+
 app = Flask(__name__, static_folder='../frontend/build', static_url_path='')
-CORS(app)
+# jsonify() through orjson when available; NaN/inf are sent as null everywhere
+app.json = FastJSONProvider(app)
+# Paging headers of the bulk endpoints must be readable by the frontend's origin
+CORS(app, expose_headers=['X-Total-Count', 'X-Next-Cursor', 'X-Sampled-From'])
+# Per-endpoint latency/phase/row metrics at /api/metrics (ENABLE_METRICS=1)
+metrics.init_app(app)
+# cProfile report of a request on demand (ENABLE_PROFILING=1, then profile=1)
+profiling.init_app(app)
 
 # Load data
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DATA_DIR = os.path.join(BASE_DIR, 'data')
+# DASHBOARD_DATA_DIR serves another set of transformed tables (e.g. generated benchmark data)
+DATA_DIR = os.environ.get('DASHBOARD_DATA_DIR', os.path.join(BASE_DIR, 'data'))
+MODEL_PATH = os.path.join(BASE_DIR, 'python', 'salary_model.pkl')
+
+# Current immutable Dataset (None until the first successful load).
+# A reload builds a complete new Dataset and then rebinds this name in one step;
+# requests pin the Dataset they started with (see current_dataset), so in-flight
+# requests finish on the old one.
+dataset = None
+
+# Serializes loads (startup, artifact watcher)
+reload_lock = threading.Lock()
+
+# Seconds between checks for new data/model artifacts (DATA_RELOAD_INTERVAL, 0 disables)
+RELOAD_INTERVAL = float(os.environ.get('DATA_RELOAD_INTERVAL', 5))
 
-# Global data storage
-job_postings = None
-skills = None
-predictions = None
-employer_offers = None
-model_data = None
+# Query parameter -> filterable dimension column
+FILTER_PARAMS = {
+    'industry': 'Industry',
+    'experience_level': 'RoleLevel',
+    'compensation_type': 'CompensationType',
+    'remote_type': 'RemoteType'
+}
 
+# Rendered analytics/filter responses for the current dataset (RESPONSE_CACHE_SIZE entries, 0 disables)
+response_cache = ResponseCache(int(os.environ.get('RESPONSE_CACHE_SIZE', 256)))
+
+# Build a new Dataset from the artifacts on disk and swap it in.
+# On failure the current Dataset keeps serving.
 def load_data():
-    global job_postings, skills, predictions, employer_offers, model_data
-    
-    try:
-        job_postings = pd.read_csv(os.path.join(DATA_DIR, 'transformed_job_postings.csv'))
-        skills = pd.read_csv(os.path.join(DATA_DIR, 'transformed_skills.csv'))
-        predictions = pd.read_csv(os.path.join(DATA_DIR, 'transformed_predictions.csv'))
-        employer_offers = pd.read_csv(os.path.join(DATA_DIR, 'transformed_employer_offers.csv'))
-        
-        # Load model if available
-        model_path = os.path.join(BASE_DIR, 'python', 'salary_model.pkl')
-        if os.path.exists(model_path):
-            with open(model_path, 'rb') as f:
-                model_data = pickle.load(f)
-        
-        print("Data loaded successfully")
+    global dataset
+
+    with reload_lock:
+        previous = dataset
+        # Versions only move forward, even if the clock does not
+        version = int(time.time() * 1000)
+        if previous is not None:
+            version = max(version, previous.version + 1)
+
+        try:
+            started = time.perf_counter()
+            new_dataset = Dataset.load(DATA_DIR, MODEL_PATH, version)
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            return False
+
+        dataset = new_dataset
+        response_cache.clear()
+        print(f"Data loaded successfully (version {version}, {time.perf_counter() - started:.2f}s)")
         return True
-    except Exception as e:
-        print(f"Error loading data: {e}")
-        return False
 
-# Load data on startup
+# Dataset for the current request: the first call pins the live Dataset for the
+# rest of the request, so a reload mid-request cannot mix two versions
+def current_dataset():
+    if 'dataset' not in g:
+        g.dataset = dataset
+    return g.dataset
+
+# Load data on startup (fingerprint first, so changes made during the load are noticed)
+watched_paths = artifact_paths(DATA_DIR, MODEL_PATH)
+loaded_fingerprint = fingerprint(watched_paths)
 load_data()
 
+# Pick up new output of transform_real_data.py / train_and_predict.py without a restart
+artifact_watcher = None
+
+def start_artifact_watcher():
+    global artifact_watcher
+    if RELOAD_INTERVAL > 0 and artifact_watcher is None:
+        artifact_watcher = ArtifactWatcher(watched_paths, load_data, RELOAD_INTERVAL, loaded_fingerprint)
+        artifact_watcher.start()
+
+# Under gunicorn.conf.py each forked worker starts its own watcher instead
+if os.environ.get('PRELOADED_SERVER') != '1':
+    start_artifact_watcher()
+
+# Query parameters in a canonical order; empty filter parameters are the same as absent ones
+def normalized_query():
+    return tuple(sorted(
+        (param, tuple(values)) for param, values in request.args.lists()
+        if not (param in FILTER_PARAMS and not any(values))
+    ))
+
+# Serve a GET endpoint from the response cache.
+# Responses depend only on the dataset and the query, so the ETag is the dataset
+# version plus a digest of the normalized query; a matching If-None-Match gets a
+# 304 without running the handler. Only 200 responses are cached.
+def cached_response(view):
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        ds = current_dataset()
+        # Profiled requests must run the handler
+        if ds is None or profiling.requested():
+            return view(*args, **kwargs)
+
+        query = normalized_query()
+        digest = hashlib.sha1(repr((request.path, query)).encode()).hexdigest()[:16]
+        etag = f'{ds.version}-{digest}'
+
+        if etag in request.if_none_match:
+            response_cache.count_not_modified()
+            response = make_response('', 304)
+        else:
+            key = (ds.version, request.path, query)
+            entry = response_cache.get(key)
+            if entry is None:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                entry = (response.get_data(), response.status_code, response.mimetype)
+                response_cache.put(key, entry)
+            else:
+                body, status, mimetype = entry
+                response = app.response_class(body, status=status, mimetype=mimetype)
+
+        response.set_etag(etag)
+        # Let browsers keep the body but revalidate it on every use
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    return wrapper
+
 # ============================================
 # API ENDPOINTS
 # ============================================
 
+# Error raised while computing a response; becomes {'error': message} with the status
+class ApiError(Exception):
+    def __init__(self, message, status=500):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+@app.errorhandler(ApiError)
+def handle_api_error(e):
+    return jsonify({'error': e.message}), e.status
+
 @app.route('/api/health', methods=['GET'])
 def health():
+    ds = current_dataset()
     return jsonify({
         'status': 'healthy',
-        'data_loaded': job_postings is not None,
-        'model_loaded': model_data is not None
+        'data_loaded': ds is not None,
+        'model_loaded': ds is not None and ds.model_available,
+        # The model is opened by the first prediction after each (re)load
+        'model_in_memory': ds is not None and ds.model_loaded and ds.predictor is not None,
+        'data_version': ds.version if ds is not None else None,
+        'response_cache': response_cache.stats(),
+        # Memory of the worker process that answered
+        'process': process_memory()
     })
 
-# Apply common filters from query parameters (industry, experience_level, compensation_type)
-def apply_filters(df):
-    industry = request.args.get('industry')
-    experience_level = request.args.get('experience_level')
-    compensation_type = request.args.get('compensation_type')
-    
-    if industry:
-        df = df[df['Industry'] == industry]
-    if experience_level:
-        df = df[df['RoleLevel'] == experience_level]
-    if compensation_type:
-        df = df[df['CompensationType'] == compensation_type]
-    
-    return df
+# Prometheus text metrics of this process (enabled with ENABLE_METRICS=1)
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    if not metrics.ENABLED:
+        return jsonify({'error': 'Metrics are disabled (set ENABLE_METRICS=1)'}), 404
+    return app.response_class(metrics.registry.render(), mimetype='text/plain; version=0.0.4')
+
+# Active {column: value} filters from the query parameters
+def request_filters():
+    return {col: request.args.get(param) for param, col in FILTER_PARAMS.items() if request.args.get(param)}
+
+# Apply common filters from query parameters (industry, experience_level, compensation_type, remote_type)
+# When df is an indexed table, pass its BitmapIndex to resolve rows without scanning.
+# Filters on columns df does not have (e.g. remote_type on predictions) are ignored.
+# Returns df itself when no filter applies; otherwise a row selection of it.
+@metrics.timed('filter')
+def apply_filters(df, index=None):
+    filters = {col: value for col, value in request_filters().items() if col in df.columns}
+    if not filters:
+        return df
+
+    # Rows scanned: the index's candidate rows, or the whole table for a mask pass
+    if index is not None:
+        rows = index.select(filters)
+        metrics.count_scanned(0 if rows is None else len(rows))
+        return df if rows is None else df.iloc[rows]
+
+    metrics.count_scanned(len(df))
+    mask = None
+    for col, value in filters.items():
+        col_mask = category_mask(df[col], value)
+        mask = col_mask if mask is None else mask & col_mask
+
+    return df[mask]
+
+# Row positions of job_postings matching the request filters (None = every row).
+# The filter pass runs once per request: the rows, the filtered postings and their
+# predictions are kept on flask.g and shared by everything computed for the request
+# (the dashboard endpoints derive all their widgets from one pass).
+@metrics.timed('filter')
+def filtered_posting_rows(ds):
+    if 'posting_rows' not in g:
+        g.posting_rows = ds.job_postings_index.select(request_filters())
+        # The index's candidate rows; an unfiltered request touches none
+        metrics.count_scanned(0 if g.posting_rows is None else len(g.posting_rows))
+    return g.posting_rows
+
+# Filtered job postings for the current request (or for explicit row positions)
+@metrics.timed('filter')
+def filtered_postings(ds, rows=None):
+    if rows is not None:
+        return ds.job_postings.iloc[rows]
+    if 'postings' not in g:
+        rows = filtered_posting_rows(ds)
+        g.postings = ds.job_postings if rows is None else ds.job_postings.iloc[rows]
+    return g.postings
+
+# Aggregate cube key for the request filters (None when a filter is outside the cube,
+# in which case the endpoint falls back to the filtered rows)
+def cube_key(ds):
+    return ds.cube.key(request_filters())
+
+# exact=true asks for exact medians/quantiles instead of the load-time sketches
+def exact_requested():
+    return request.args.get('exact', '').lower() in ('1', 'true')
+
+# Per-group SalaryMid statistics for the request filters, merged from load-time
+# quantile sketches: median within the sketch's relative error bound, the other
+# columns exact. Columns as in the groupby(...).agg(...) results of the exact path.
+def sketch_breakdown(sketches, group_by, columns=('median', 'average', 'min', 'max', 'count')):
+    stats = sketches.aggregate(request_filters(), group_by)
+    stats = stats.rename(columns={'q50': 'median', 'mean': 'average'})
+    return stats[[group_by] + list(columns)]
+
+# Predictions whose PostingID appears in the filtered postings (all predictions if none do)
+@metrics.timed('filter')
+def predictions_for_postings(ds, df):
+    metrics.count_scanned(len(ds.predictions))
+    filtered_posting_ids = df['PostingID'].unique() if 'PostingID' in df.columns else []
+    if len(filtered_posting_ids) > 0:
+        return ds.predictions[ds.predictions['PostingID'].isin(filtered_posting_ids)]
+    return ds.predictions
+
+# Predictions for the request's filtered postings
+def request_predictions(ds):
+    if 'predictions' not in g:
+        g.predictions = predictions_for_postings(ds, filtered_postings(ds))
+    return g.predictions
+
+# Yearly postings with SalaryMid inside the $20k-$500k sanity range
+def yearly_in_range(df):
+    yearly_df = df[category_mask(df['CompensationType'], 'Yearly')] if 'CompensationType' in df.columns else df
+    return yearly_df[(yearly_df['SalaryMid'] >= 20000) & (yearly_df['SalaryMid'] <= 500000)]
+
+# (industry, mean SalaryMid) of the best-paying known industry in df, or (None, 0)
+def highest_paying_industry(df):
+    if 'Industry' not in df.columns or 'SalaryMid' not in df.columns:
+        return None, 0
+    industry_df = df[df['Industry'].notna() & (df['Industry'] != 'Unknown') & (df['Industry'] != 'nan')]
+    if len(industry_df) == 0:
+        return None, 0
+    industry_salaries = industry_df.groupby('Industry', observed=True)['SalaryMid'].mean().sort_values(ascending=False)
+    if len(industry_salaries) == 0:
+        return None, 0
+    return industry_salaries.index[0], float(industry_salaries.iloc[0])
+
+# JSON-ready form of a table result: a list of row dicts, or with format=columnar
+# {'columns': [...], 'data': {column: [values]}, 'rows': n} (one array per column).
+# Results that are not DataFrames (e.g. a KPI dict) pass through.
+@metrics.timed('serialize')
+def table_payload(df):
+    if not isinstance(df, pd.DataFrame):
+        return df
+    metrics.count_returned(len(df))
+    if request.args.get('format') == 'columnar':
+        return columnar(df)
+    return records(df)
+
+def records_response(df):
+    return jsonify(table_payload(df))
+
+# Streaming mode requested for a bulk endpoint: 'ndjson' (format=ndjson or an
+# Accept: application/x-ndjson header), 'json' (stream=true) or None
+def requested_stream_mode():
+    if request.args.get('format') == 'ndjson' or 'application/x-ndjson' in request.headers.get('Accept', ''):
+        return 'ndjson'
+    if request.args.get('stream', '').lower() in ('1', 'true'):
+        return 'json'
+    return None
+
+# Serialize one page of df for a bulk endpoint (limit/offset/cursor/sort/fields query
+# parameters, see pagination.py). The body stays a JSON array of records; the total
+# row count and the next page's cursor travel in X-Total-Count / X-Next-Cursor.
+# In streaming mode the rows are encoded in batches while the response is sent,
+# so memory stays flat and the first bytes go out immediately.
+def paginated_response(ds, df, headers=None):
+    try:
+        params = parse_page_args(request.args, df.columns, ds.version)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    page_df, total, next_offset = page(df, params)
+    stream_mode = requested_stream_mode()
+    if stream_mode is not None:
+        metrics.count_returned(len(page_df))
+    if stream_mode == 'ndjson':
+        response = app.response_class(ndjson_chunks(page_df), mimetype='application/x-ndjson')
+    elif stream_mode == 'json':
+        response = app.response_class(json_array_chunks(page_df), mimetype='application/json')
+    else:
+        response = records_response(page_df)
+    response.headers['X-Total-Count'] = str(total)
+    if next_offset is not None:
+        response.headers['X-Next-Cursor'] = encode_cursor(ds.version, next_offset, params['sort'])
+    for name, value in (headers or {}).items():
+        response.headers[name] = value
+    return response
 
 @app.route('/api/job-postings', methods=['GET'])
 def get_job_postings():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
+
     # Apply filters
-    df = apply_filters(df)
-    
+    rows = filtered_posting_rows(ds)
+
+    # Date range from the sorted PostedDate index
     date_from = request.args.get('date_from')
     date_to = request.args.get('date_to')
-    
-    if date_from:
-        df = df[pd.to_datetime(df['PostedDate']) >= pd.to_datetime(date_from)]
-    if date_to:
-        df = df[pd.to_datetime(df['PostedDate']) <= pd.to_datetime(date_to)]
-    
-    return jsonify(df.to_dict('records'))
+
+    if date_from or date_to:
+        try:
+            rows = ds.date_index.restrict(rows, date_from or None, date_to or None)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+    return paginated_response(ds, filtered_postings(ds, rows))
+
+# Positive integer query parameter (None when absent); ValueError names the parameter
+def positive_int_arg(name, maximum=None):
+    value = request.args.get(name)
+    if value is None:
+        return None
+    try:
+        value = int(value)
+    except ValueError:
+        raise ValueError(f'{name} must be a positive integer')
+    if value < 1 or (maximum is not None and value > maximum):
+        raise ValueError(f'{name} must be between 1 and {maximum}' if maximum else f'{name} must be a positive integer')
+    return value
+
+# Predictions for the scatter plot: the predictions table (joined to job_postings
+# when it lacks the dimension columns) filtered by the request filters, limited to
+# rows with both salaries in the $10k-$500k range
+def scatter_predictions(ds):
+    df = ds.predictions
+    job_postings = ds.job_postings
+
+    if 'PredictedSalary' not in df.columns or 'ActualSalaryYearly' not in df.columns:
+        raise ApiError('Missing required columns: PredictedSalary or ActualSalaryYearly', 500)
+
+    index = ds.predictions_index
+
+    # Merge with job_postings if Industry/RoleLevel missing from predictions CSV
+    if 'Industry' not in df.columns and 'PostingID' in job_postings.columns:
+        merge_cols = ['PostingID']
+        if 'Industry' in job_postings.columns:
+            merge_cols.append('Industry')
+        if 'RoleLevel' in job_postings.columns:
+            merge_cols.append('RoleLevel')
+        if 'CompensationType' in job_postings.columns:
+            merge_cols.append('CompensationType')
+
+        df = df.merge(
+            job_postings[merge_cols],
+            on='PostingID',
+            how='left'
+        )
+        index = None
+
+    if 'Industry' in df.columns or 'RoleLevel' in df.columns or 'CompensationType' in df.columns:
+        df = apply_filters(df, index)
+
+    # Convert to numeric and filter out invalid salaries (too low or too high)
+    predicted = pd.to_numeric(df['PredictedSalary'], errors='coerce')
+    actual = pd.to_numeric(df['ActualSalaryYearly'], errors='coerce')
+
+    # Filter reasonable salary range: $10k - $500k yearly
+    valid = (
+        predicted.notna() &
+        actual.notna() &
+        (predicted >= 10000) &
+        (actual >= 10000) &
+        (predicted <= 500000) &
+        (actual <= 500000)
+    )
+    df = df[valid].assign(PredictedSalary=predicted[valid], ActualSalaryYearly=actual[valid])
+    return df
 
 # Get individual predictions for scatter plot (PredictedSalary vs ActualSalaryYearly)
 # Returns filtered predictions with Industry, RoleLevel for frontend visualization
+# max_points=N returns a reproducible sample of at most N rows (stratified by
+# Industry/RoleLevel, keeping the largest gaps); bins=N returns an N x N histogram
 @app.route('/api/predictions', methods=['GET'])
 def get_predictions():
-    if predictions is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
+
     try:
-        df = predictions.copy()
-        
-        if 'PredictedSalary' not in df.columns or 'ActualSalaryYearly' not in df.columns:
-            return jsonify({'error': 'Missing required columns: PredictedSalary or ActualSalaryYearly'}), 500
-        
-        # Merge with job_postings if Industry/RoleLevel missing from predictions CSV
-        if 'Industry' not in df.columns and job_postings is not None and 'PostingID' in job_postings.columns:
-            merge_cols = ['PostingID']
-            if 'Industry' in job_postings.columns:
-                merge_cols.append('Industry')
-            if 'RoleLevel' in job_postings.columns:
-                merge_cols.append('RoleLevel')
-            if 'CompensationType' in job_postings.columns:
-                merge_cols.append('CompensationType')
-            
-            df = df.merge(
-                job_postings[merge_cols], 
-                on='PostingID', 
-                how='left'
-            )
-        
-        if 'Industry' in df.columns or 'RoleLevel' in df.columns or 'CompensationType' in df.columns:
-            df = apply_filters(df)
-        
-        # Convert to numeric and filter out invalid salaries (too low or too high)
-        df['PredictedSalary'] = pd.to_numeric(df['PredictedSalary'], errors='coerce')
-        df['ActualSalaryYearly'] = pd.to_numeric(df['ActualSalaryYearly'], errors='coerce')
-        
-        # Filter reasonable salary range: $10k - $500k yearly
-        df = df[
-            df['PredictedSalary'].notna() &
-            df['ActualSalaryYearly'].notna() &
-            (df['PredictedSalary'] >= 10000) & 
-            (df['ActualSalaryYearly'] >= 10000) &
-            (df['PredictedSalary'] <= 500000) &
-            (df['ActualSalaryYearly'] <= 500000)
-        ]
-        
-        return jsonify(df.to_dict('records'))
+        max_points = positive_int_arg('max_points')
+        bins = positive_int_arg('bins', MAX_BINS)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        df = scatter_predictions(ds)
+
+        if bins is not None:
+            return jsonify(scatter_histogram(df, bins))
+
+        if max_points is not None:
+            total = len(df)
+            df = df.iloc[stratified_sample(df, max_points)]
+            return paginated_response(ds, df, {'X-Sampled-From': str(total)})
+
+        return paginated_response(ds, df)
+    except ApiError:
+        raise
     except Exception as e:
         return jsonify({'error': f'Error processing predictions: {str(e)}'}), 500
 
 @app.route('/api/skills', methods=['GET'])
 def get_skills():
-    if skills is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
+
+    skills = ds.skills
     posting_id = request.args.get('posting_id')
     if posting_id:
-        filtered = skills[skills['PostingID'] == int(posting_id)]
-        return jsonify(filtered.to_dict('records'))
-    
-    return jsonify(skills.to_dict('records'))
+        skills = skills[skills['PostingID'] == int(posting_id)]
+
+    return paginated_response(ds, skills)
 
 @app.route('/api/employer-offers', methods=['GET'])
 def get_employer_offers():
-    if employer_offers is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    return jsonify(employer_offers.to_dict('records'))
 
-@app.route('/api/analytics/overview-kpis', methods=['GET'])
-def get_overview_kpis():
-    if job_postings is None:
-        return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
+    return paginated_response(ds, ds.employer_offers)
+
+# Overview KPIs (Home page) for the request filters
+def overview_kpis(ds):
+    key = cube_key(ds)
+    if key is not None:
+        cell = ds.cube.cell(key)
+        highest_industry, highest_paying_salary = ds.cube.highest_paying_industry(key)
+        return {
+            'total_jobs': int(cell['postings']),
+            'highest_paying_industry': highest_industry or 'N/A',
+            'highest_paying_salary': float(highest_paying_salary),
+            'average_salary': float(cell['yearly_sum'] / cell['yearly_count']) if cell['yearly_count'] > 0 else 0,
+            'average_experience_level': float(cell['exp_sum'] / cell['rows']) if cell['rows'] > 0 else 0
+        }
+
     # Apply filters
-    df = apply_filters(df)
-    
+    df = filtered_postings(ds)
+
     total_jobs = int(df['PostingID'].nunique()) if 'PostingID' in df.columns else int(len(df))
-    
-    highest_paying_industry = None
-    highest_paying_salary = 0
-    if 'Industry' in df.columns and 'SalaryMid' in df.columns:
-        industry_df = df[df['Industry'].notna() & (df['Industry'] != 'Unknown') & (df['Industry'] != 'nan')]
-        if len(industry_df) > 0:
-            industry_salaries = industry_df.groupby('Industry')['SalaryMid'].mean().sort_values(ascending=False)
-            if len(industry_salaries) > 0:
-                highest_paying_industry = industry_salaries.index[0]
-                highest_paying_salary = float(industry_salaries.iloc[0])
-    
-    yearly_df = df[df['CompensationType'] == 'Yearly'].copy() if 'CompensationType' in df.columns else df.copy()
-    if 'SalaryMid' in yearly_df.columns:
-        yearly_df = yearly_df[(yearly_df['SalaryMid'] >= 20000) & (yearly_df['SalaryMid'] <= 500000)]
+
+    highest_industry, highest_paying_salary = highest_paying_industry(df)
+
+    if 'SalaryMid' in df.columns:
+        yearly_df = yearly_in_range(df)
         average_salary = float(yearly_df['SalaryMid'].mean()) if len(yearly_df) > 0 else 0
     else:
         average_salary = 0
-    
-    exp_mapping = {'Entry': 1, 'Junior': 1, 'Mid': 3, 'Senior': 4, 'Executive': 5, 'Lead': 4, 'Principal': 5}
+
     if 'RoleLevel' in df.columns:
-        df['exp_numeric'] = df['RoleLevel'].map(exp_mapping).fillna(3)
-        average_experience_level = float(df['exp_numeric'].mean()) if len(df) > 0 else 0
+        exp_numeric = map_values(df['RoleLevel'], EXPERIENCE_SCORES, 3)
+        average_experience_level = float(exp_numeric.mean()) if len(df) > 0 else 0
     else:
         average_experience_level = 0
-    
-    return jsonify({
+
+    return {
         'total_jobs': total_jobs,
-        'highest_paying_industry': highest_paying_industry or 'N/A',
+        'highest_paying_industry': highest_industry or 'N/A',
         'highest_paying_salary': highest_paying_salary,
         'average_salary': average_salary,
         'average_experience_level': average_experience_level
-    })
+    }
+
+@app.route('/api/analytics/overview-kpis', methods=['GET'])
+@cached_response
+def get_overview_kpis():
+    ds = current_dataset()
+    if ds is None:
+        return jsonify({'error': 'Data not loaded'}), 500
+
+    return jsonify(overview_kpis(ds))
 
 @app.route('/api/analytics/salary-summary', methods=['GET'])
+@cached_response
 def get_salary_summary():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
+
+    key = cube_key(ds)
+    if key is not None:
+        cell = ds.cube.cell(key)
+        return jsonify({
+            'median': float(cell['salary_median']),
+            'average': float(cell['salary_sum'] / cell['salary_count']) if cell['salary_count'] > 0 else float('nan'),
+            'min': float(cell['range_min']),
+            'max': float(cell['range_max']),
+            'percentile_25': float(cell['salary_p25']),
+            'percentile_75': float(cell['salary_p75']),
+            'count': int(cell['rows'])
+        })
+
+    # Filters outside the cube (remote_type): merge the sketches of the matching cells
+    if not exact_requested():
+        summary = ds.salary_sketches.aggregate(request_filters()).iloc[0]
+        return jsonify({
+            'median': float(summary['q50']),
+            'average': float(summary['mean']),
+            'min': float(summary['range_min']),
+            'max': float(summary['range_max']),
+            'percentile_25': float(summary['q25']),
+            'percentile_75': float(summary['q75']),
+            'count': int(summary['rows'])
+        })
+
     # Apply filters
-    df = apply_filters(df)
-    
+    df = filtered_postings(ds)
+
     return jsonify({
         'median': float(df['SalaryMid'].median()),
         'average': float(df['SalaryMid'].mean()),
@@ -225,199 +580,201 @@ def get_salary_summary():
         'count': int(len(df))
     })
 
-@app.route('/api/analytics/salary-insights-kpis', methods=['GET'])
-def get_salary_insights_kpis():
-    if job_postings is None or skills is None:
-        return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
+# Salary Insights KPIs, including the best-paying skill from the skill index
+def salary_insights_kpis(ds):
     # Apply filters
-    df = apply_filters(df)
-    
-    yearly_df = df[df['CompensationType'] == 'Yearly'].copy() if 'CompensationType' in df.columns else df.copy()
-    yearly_df = yearly_df[(yearly_df['SalaryMid'] >= 20000) & (yearly_df['SalaryMid'] <= 500000)]
-    
-    median_salary = float(yearly_df['SalaryMid'].median()) if len(yearly_df) > 0 else 0
-    
-    average_salary = float(yearly_df['SalaryMid'].mean()) if len(yearly_df) > 0 else 0
-    
-    highest_paying_industry = None
-    highest_paying_industry_salary = 0
-    if 'Industry' in df.columns and 'SalaryMid' in df.columns:
-        industry_df = df[df['Industry'].notna() & (df['Industry'] != 'Unknown') & (df['Industry'] != 'nan')]
-        if len(industry_df) > 0:
-            industry_salaries = industry_df.groupby('Industry')['SalaryMid'].mean().sort_values(ascending=False)
-            if len(industry_salaries) > 0:
-                highest_paying_industry = industry_salaries.index[0]
-                highest_paying_industry_salary = float(industry_salaries.iloc[0])
-    
+    rows = filtered_posting_rows(ds)
+
+    key = cube_key(ds)
+    if key is not None:
+        cell = ds.cube.cell(key)
+        median_salary = float(cell['yearly_median']) if cell['yearly_count'] > 0 else 0
+        average_salary = float(cell['yearly_sum'] / cell['yearly_count']) if cell['yearly_count'] > 0 else 0
+        highest_industry, highest_paying_industry_salary = ds.cube.highest_paying_industry(key)
+    else:
+        df = filtered_postings(ds)
+        yearly_df = yearly_in_range(df)
+        median_salary = float(yearly_df['SalaryMid'].median()) if len(yearly_df) > 0 else 0
+        average_salary = float(yearly_df['SalaryMid'].mean()) if len(yearly_df) > 0 else 0
+        highest_industry, highest_paying_industry_salary = highest_paying_industry(df)
+
     highest_paying_skill = None
     highest_paying_skill_salary = 0
-    
-    filtered_posting_ids = df['PostingID'].unique() if 'PostingID' in df.columns else []
-    
-    if len(filtered_posting_ids) > 0:
-        filtered_skills = skills[skills['PostingID'].isin(filtered_posting_ids)]
-    else:
-        filtered_skills = skills
-    
-    skill_salaries = {}
-    for skill in filtered_skills['Skills'].unique():
-        skill_postings = filtered_skills[filtered_skills['Skills'] == skill]['PostingID'].unique()
-        avg_salary = df[df['PostingID'].isin(skill_postings)]['SalaryMid'].mean()
-        if not pd.isna(avg_salary):
-            skill_salaries[skill] = float(avg_salary)
-    
-    if skill_salaries:
-        highest_paying_skill = max(skill_salaries, key=skill_salaries.get)
-        highest_paying_skill_salary = skill_salaries[highest_paying_skill]
-    
-    return jsonify({
+
+    # Average salary of every skill in the filtered postings, from the skill index
+    skill_index = ds.skill_index
+    frequency, average = skill_index.skill_stats(rows)
+    candidates = np.flatnonzero((frequency > 0) & ~np.isnan(average))
+
+    if len(candidates) > 0:
+        # Ties go to the skill seen first among the counted skill rows (as the original unique() loop)
+        candidates = candidates[np.argsort(skill_index.first_rows(rows)[candidates], kind='stable')]
+        best = candidates[np.argmax(average[candidates])]
+        highest_paying_skill = skill_index.skill_names[best]
+        highest_paying_skill_salary = float(average[best])
+
+    return {
         'median_salary': median_salary,
         'average_salary': average_salary,
-        'highest_paying_industry': highest_paying_industry or 'N/A',
+        'highest_paying_industry': highest_industry or 'N/A',
         'highest_paying_industry_salary': highest_paying_industry_salary,
         'highest_paying_skill': highest_paying_skill or 'N/A',
         'highest_paying_skill_salary': highest_paying_skill_salary
-    })
+    }
 
-@app.route('/api/analytics/prediction-accuracy', methods=['GET'])
-def get_prediction_accuracy():
-    if predictions is None or job_postings is None:
+@app.route('/api/analytics/salary-insights-kpis', methods=['GET'])
+@cached_response
+def get_salary_insights_kpis():
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    if 'ActualSalaryYearly' not in predictions.columns:
-        return jsonify({'error': 'ActualSalaryYearly column missing from predictions'}), 500
-    
-    df = job_postings.copy()
-    df = apply_filters(df)
-    
-    filtered_posting_ids = df['PostingID'].unique() if 'PostingID' in df.columns else []
-    
-    if len(filtered_posting_ids) > 0:
-        filtered_predictions = predictions[predictions['PostingID'].isin(filtered_posting_ids)].copy()
-    else:
-        filtered_predictions = predictions.copy()
-    
+
+    return jsonify(salary_insights_kpis(ds))
+
+# MAE / MAPE / R2 of the predictions for the filtered postings
+def prediction_accuracy(ds):
+    if 'ActualSalaryYearly' not in ds.predictions.columns:
+        raise ApiError('ActualSalaryYearly column missing from predictions', 500)
+
+    filtered_predictions = request_predictions(ds)
+
     if len(filtered_predictions) == 0:
-        return jsonify({
+        return {
             'mae': 0,
             'mape': 0,
             'r2': 0,
             'count': 0
-        })
-    
+        }
+
     filtered_predictions = filtered_predictions[
         (filtered_predictions['ActualSalaryYearly'] >= 10000) &
         (filtered_predictions['PredictedSalary'] >= 10000)
     ]
-    
+
     if len(filtered_predictions) == 0:
-        return jsonify({
+        return {
             'mae': 0,
             'mape': 0,
             'r2': 0,
             'count': 0
-        })
-    
-    merged = filtered_predictions[['PostingID', 'PredictedSalary', 'ActualSalaryYearly']].copy()
-    merged['Actual'] = merged['ActualSalaryYearly']
-    
-    merged['Error'] = abs(merged['PredictedSalary'] - merged['Actual'])
-    merged['ErrorPct'] = (merged['Error'] / merged['Actual']) * 100
-    
-    mae = float(merged['Error'].mean())
-    mape = float(merged['ErrorPct'].mean())
-    
-    ss_res = ((merged['Actual'] - merged['PredictedSalary']) ** 2).sum()
-    ss_tot = ((merged['Actual'] - merged['Actual'].mean()) ** 2).sum()
+        }
+
+    predicted = filtered_predictions['PredictedSalary']
+    actual = filtered_predictions['ActualSalaryYearly']
+
+    error = abs(predicted - actual)
+    error_pct = (error / actual) * 100
+
+    mae = float(error.mean())
+    mape = float(error_pct.mean())
+
+    ss_res = ((actual - predicted) ** 2).sum()
+    ss_tot = ((actual - actual.mean()) ** 2).sum()
     r2 = float(1 - (ss_res / ss_tot)) if ss_tot > 0 else 0
-    
-    return jsonify({
+
+    return {
         'mae': mae,
         'mape': mape,
         'r2': r2,
-        'count': int(len(merged))
-    })
+        'count': int(len(filtered_predictions))
+    }
 
-@app.route('/api/analytics/prediction-kpis', methods=['GET'])
-def get_prediction_kpis():
-    if job_postings is None or predictions is None:
+@app.route('/api/analytics/prediction-accuracy', methods=['GET'])
+@cached_response
+def get_prediction_accuracy():
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
+
+    return jsonify(prediction_accuracy(ds))
+
+# Prediction page KPIs for the request filters
+def prediction_kpis(ds):
+    key = cube_key(ds)
+    if key is not None:
+        cell = ds.cube.cell(key)
+        highest_industry, highest_paying_industry_salary = ds.cube.highest_paying_industry(key)
+        return {
+            'median_salary': float(cell['yearly_median']) if cell['yearly_count'] > 0 else 0,
+            'average_salary': float(cell['yearly_sum'] / cell['yearly_count']) if cell['yearly_count'] > 0 else 0,
+            'predicted_salary': float(ds.cube.predicted_salary(key)),
+            'highest_paying_industry': highest_industry or 'N/A',
+            'highest_paying_industry_salary': float(highest_paying_industry_salary)
+        }
+
     # Apply filters
-    df = apply_filters(df)
-    
-    yearly_df = df[df['CompensationType'] == 'Yearly'].copy() if 'CompensationType' in df.columns else df.copy()
-    yearly_df = yearly_df[(yearly_df['SalaryMid'] >= 20000) & (yearly_df['SalaryMid'] <= 500000)]
-    
+    df = filtered_postings(ds)
+
+    yearly_df = yearly_in_range(df)
+
     median_salary = float(yearly_df['SalaryMid'].median()) if len(yearly_df) > 0 else 0
-    
+
     average_salary = float(yearly_df['SalaryMid'].mean()) if len(yearly_df) > 0 else 0
-    
-    filtered_posting_ids = df['PostingID'].unique() if 'PostingID' in df.columns else []
-    if len(filtered_posting_ids) > 0:
-        filtered_predictions = predictions[predictions['PostingID'].isin(filtered_posting_ids)].copy()
-    else:
-        filtered_predictions = predictions.copy()
-    
+
+    filtered_predictions = request_predictions(ds)
+
     filtered_predictions = filtered_predictions[
-        (filtered_predictions['PredictedSalary'] >= 20000) & 
+        (filtered_predictions['PredictedSalary'] >= 20000) &
         (filtered_predictions['PredictedSalary'] <= 500000) &
         (filtered_predictions['ActualSalaryYearly'] >= 20000) &
         (filtered_predictions['ActualSalaryYearly'] <= 500000)
     ]
     predicted_salary = float(filtered_predictions['PredictedSalary'].mean()) if len(filtered_predictions) > 0 else 0
-    
-    highest_paying_industry = None
-    highest_paying_industry_salary = 0
-    if 'Industry' in df.columns and 'SalaryMid' in df.columns:
-        industry_df = df[df['Industry'].notna() & (df['Industry'] != 'Unknown') & (df['Industry'] != 'nan')]
-        if len(industry_df) > 0:
-            industry_salaries = industry_df.groupby('Industry')['SalaryMid'].mean().sort_values(ascending=False)
-            if len(industry_salaries) > 0:
-                highest_paying_industry = industry_salaries.index[0]
-                highest_paying_industry_salary = float(industry_salaries.iloc[0])
-    
-    return jsonify({
+
+    highest_industry, highest_paying_industry_salary = highest_paying_industry(df)
+
+    return {
         'median_salary': median_salary,
         'average_salary': average_salary,
         'predicted_salary': predicted_salary,
-        'highest_paying_industry': highest_paying_industry or 'N/A',
+        'highest_paying_industry': highest_industry or 'N/A',
         'highest_paying_industry_salary': highest_paying_industry_salary
-    })
+    }
+
+@app.route('/api/analytics/prediction-kpis', methods=['GET'])
+@cached_response
+def get_prediction_kpis():
+    ds = current_dataset()
+    if ds is None:
+        return jsonify({'error': 'Data not loaded'}), 500
+
+    return jsonify(prediction_kpis(ds))
 
 @app.route('/api/analytics/compensation-distribution', methods=['GET'])
+@cached_response
 def get_compensation_distribution():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
-    distribution = df['CompensationType'].value_counts().to_dict()
+
+    df = ds.job_postings
+
+    counts = df['CompensationType'].value_counts()
+    distribution = counts[counts > 0].to_dict()
     total = len(df)
-    
+
     result = {
         'distribution': {k: int(v) for k, v in distribution.items()},
         'percentages': {k: float((v / total) * 100) for k, v in distribution.items()},
         'total': int(total)
     }
-    
+
     return jsonify(result)
 
 @app.route('/api/analytics/salary-by-role', methods=['GET'])
+@cached_response
 def get_salary_by_role():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
+
+    if not exact_requested():
+        result = sketch_breakdown(ds.title_sketches, 'JobTitle')
+        return records_response(result.sort_values('average', ascending=False))
+
     # Apply filters
-    df = apply_filters(df)
-    
+    df = filtered_postings(ds)
+
     result = df.groupby('JobTitle')['SalaryMid'].agg([
         ('median', 'median'),
         ('average', 'mean'),
@@ -425,172 +782,203 @@ def get_salary_by_role():
         ('max', 'max'),
         ('count', 'count')
     ]).reset_index()
-    
+
     result = result.sort_values('average', ascending=False)
-    
-    return jsonify(result.to_dict('records'))
+
+    return records_response(result)
 
 @app.route('/api/analytics/salary-by-location', methods=['GET'])
+@cached_response
 def get_salary_by_location():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
+
+    if not exact_requested():
+        result = sketch_breakdown(ds.location_sketches, 'Location', ('median', 'average', 'count'))
+        return records_response(result.sort_values('average', ascending=False))
+
     # Apply filters
-    df = apply_filters(df)
-    
+    df = filtered_postings(ds)
+
     result = df.groupby('Location')['SalaryMid'].agg([
         ('median', 'median'),
         ('average', 'mean'),
         ('count', 'count')
     ]).reset_index()
-    
+
     result = result.sort_values('average', ascending=False)
-    
-    return jsonify(result.to_dict('records'))
+
+    return records_response(result)
+
+# SalaryMid statistics per RoleLevel (Junior, Mid, Senior first)
+def salary_by_experience_level(ds):
+    if not exact_requested():
+        result = sketch_breakdown(ds.salary_sketches, 'RoleLevel')
+        result = result[result['RoleLevel'] != 'nan']
+    else:
+        # Apply filters
+        df = filtered_postings(ds)
+
+        df = df[df['RoleLevel'].notna() & (df['RoleLevel'] != 'nan')]
+
+        result = df.groupby('RoleLevel', observed=True)['SalaryMid'].agg([
+            ('median', 'median'),
+            ('average', 'mean'),
+            ('min', 'min'),
+            ('max', 'max'),
+            ('count', 'count')
+        ]).reset_index()
+
+    level_order = {'Junior': 1, 'Mid': 2, 'Senior': 3}
+    result['sort_order'] = map_values(result['RoleLevel'], level_order, 99)
+    result = result.sort_values('sort_order').drop('sort_order', axis=1)
+
+    return result
 
 @app.route('/api/analytics/salary-by-experience-level', methods=['GET'])
+@cached_response
 def get_salary_by_experience_level():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
+
+    return records_response(salary_by_experience_level(ds))
+
+# SalaryMid statistics per known industry, best-paying first
+def salary_by_industry(ds):
+    key = cube_key(ds)
+    if key is not None:
+        result = pd.DataFrame(ds.cube.industry_breakdown(key),
+                              columns=['Industry', 'median', 'average', 'min', 'max', 'count'])
+        result = result.sort_values('average', ascending=False)
+        return result
+
+    # Filters outside the cube (remote_type): merge the sketches of the matching cells
+    if not exact_requested():
+        result = sketch_breakdown(ds.salary_sketches, 'Industry')
+        result = result[(result['Industry'] != 'Unknown') & (result['Industry'] != 'nan')]
+        return result.sort_values('average', ascending=False)
+
     # Apply filters
-    df = apply_filters(df)
-    
-    df = df[df['RoleLevel'].notna() & (df['RoleLevel'] != 'nan')]
-    
-    result = df.groupby('RoleLevel')['SalaryMid'].agg([
+    df = filtered_postings(ds)
+
+    df = df[df['Industry'].notna() & (df['Industry'] != 'Unknown') & (df['Industry'] != 'nan')]
+
+    result = df.groupby('Industry', observed=True)['SalaryMid'].agg([
         ('median', 'median'),
         ('average', 'mean'),
         ('min', 'min'),
         ('max', 'max'),
         ('count', 'count')
     ]).reset_index()
-    
-    level_order = {'Junior': 1, 'Mid': 2, 'Senior': 3}
-    result['sort_order'] = result['RoleLevel'].map(level_order).fillna(99)
-    result = result.sort_values('sort_order').drop('sort_order', axis=1)
-    
-    return jsonify(result.to_dict('records'))
+
+    result = result.sort_values('average', ascending=False)
+
+    return result
 
 @app.route('/api/analytics/salary-by-industry', methods=['GET'])
+@cached_response
 def get_salary_by_industry():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
+
+    return records_response(salary_by_industry(ds))
+
+# Counts of in-range SalaryMid values per salary band
+def salary_distribution(ds):
     # Apply filters
-    df = apply_filters(df)
-    
-    df = df[df['Industry'].notna() & (df['Industry'] != 'Unknown') & (df['Industry'] != 'nan')]
-    
-    result = df.groupby('Industry')['SalaryMid'].agg([
-        ('median', 'median'),
-        ('average', 'mean'),
-        ('min', 'min'),
-        ('max', 'max'),
-        ('count', 'count')
-    ]).reset_index()
-    
-    result = result.sort_values('average', ascending=False)
-    
-    return jsonify(result.to_dict('records'))
+    df = filtered_postings(ds)
+
+    salaries = df['SalaryMid']
+    salaries = salaries[(salaries >= 20000) & (salaries <= 500000)]
+
+    bins = [0, 50000, 75000, 100000, 125000, 150000, 175000, 200000, 250000, 300000, 500000]
+    labels = ['$0-50K', '$50-75K', '$75-100K', '$100-125K', '$125-150K',
+              '$150-175K', '$175-200K', '$200-250K', '$250-300K', '$300K+']
+
+    salary_range = pd.cut(salaries, bins=bins, labels=labels, include_lowest=True)
+
+    # Every range in order, empty ones included
+    distribution = salary_range.value_counts().sort_index()
+
+    return pd.DataFrame({
+        'range': [str(label) for label in distribution.index],
+        'count': distribution.to_numpy(dtype=np.int64)
+    })
 
 @app.route('/api/analytics/salary-distribution', methods=['GET'])
+@cached_response
 def get_salary_distribution():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
-    # Apply filters
-    df = apply_filters(df)
-    
-    df = df[(df['SalaryMid'] >= 20000) & (df['SalaryMid'] <= 500000)]
-    
-    bins = [0, 50000, 75000, 100000, 125000, 150000, 175000, 200000, 250000, 300000, 500000]
-    labels = ['$0-50K', '$50-75K', '$75-100K', '$100-125K', '$125-150K', 
-              '$150-175K', '$175-200K', '$200-250K', '$250-300K', '$300K+']
-    
-    df['SalaryRange'] = pd.cut(df['SalaryMid'], bins=bins, labels=labels, include_lowest=True)
-    
-    distribution = df['SalaryRange'].value_counts().sort_index().to_dict()
-    
-    result = [{'range': str(k), 'count': int(v)} for k, v in distribution.items()]
-    
-    return jsonify(result)
+
+    return records_response(salary_distribution(ds))
 
 @app.route('/api/analytics/salary-trends', methods=['GET'])
+@cached_response
 def get_salary_trends():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
+
     # Apply filters
-    df = apply_filters(df)
-    
-    df['PostedDate'] = pd.to_datetime(df['PostedDate'])
-    df['YearMonth'] = df['PostedDate'].dt.to_period('M').astype(str)
-    
-    trends = df.groupby('YearMonth')['SalaryMid'].agg([
+    rows = filtered_posting_rows(ds)
+    df = filtered_postings(ds)
+
+    # Group by the precomputed integer month codes (chronological; undated rows last)
+    date_index = ds.date_index
+    month_codes = date_index.month_codes if rows is None else date_index.month_codes[rows]
+
+    trends = df['SalaryMid'].groupby(month_codes).agg([
         ('median', 'median'),
         ('average', 'mean'),
         ('count', 'count')
-    ]).reset_index()
-    
-    return jsonify(trends.to_dict('records'))
+    ])
+    trends.insert(0, 'YearMonth', date_index.month_labels(trends.index))
+    trends = trends.reset_index(drop=True)
+
+    return records_response(trends)
+
+# Columns of the prediction gaps table (an empty selection returns them with no rows)
+PREDICTION_GAP_COLUMNS = ['Industry', 'PredictedSalary', 'SalaryMid', 'RoleLevel', 'Gap', 'GapPct', 'Category']
 
 # Get prediction gaps aggregated by Industry (for "Top Prediction Gaps by Industry" table)
 # Groups by Industry, calculates avg PredictedSalary and avg ActualSalaryYearly, computes gap metrics
 # Categories: Overpaying (>+5%), Underpaying (<-5%), Competitive (between -5% and +5%)
-@app.route('/api/analytics/prediction-gaps', methods=['GET'])
-def get_prediction_gaps():
-    if predictions is None or job_postings is None:
-        return jsonify({'error': 'Data not loaded'}), 500
-    
+def prediction_gaps(ds):
     required_cols = ['PostingID', 'PredictedSalary', 'ActualSalaryYearly', 'Industry', 'RoleLevel']
-    missing_cols = [col for col in required_cols if col not in predictions.columns]
+    missing_cols = [col for col in required_cols if col not in ds.predictions.columns]
     if missing_cols:
-        return jsonify({'error': f'Missing required columns in predictions: {missing_cols}'}), 500
-    
+        raise ApiError(f'Missing required columns in predictions: {missing_cols}', 500)
+
     # Apply filters from query params to job_postings, then filter predictions to matching PostingIDs
-    df = job_postings.copy()
-    df = apply_filters(df)
-    
-    filtered_posting_ids = df['PostingID'].unique() if 'PostingID' in df.columns else []
-    
-    if len(filtered_posting_ids) > 0:
-        filtered_predictions = predictions[predictions['PostingID'].isin(filtered_posting_ids)].copy()
-    else:
-        filtered_predictions = predictions.copy()
-    
+    filtered_predictions = request_predictions(ds)
+
     if len(filtered_predictions) == 0:
-        return jsonify([])
-    
+        return pd.DataFrame(columns=PREDICTION_GAP_COLUMNS)
+
     # Filter out rows with invalid Industry values
     filtered_predictions = filtered_predictions[
-        filtered_predictions['Industry'].notna() & 
-        (filtered_predictions['Industry'] != '') & 
+        filtered_predictions['Industry'].notna() &
+        (filtered_predictions['Industry'] != '') &
         (filtered_predictions['Industry'] != 'Unknown')
     ]
-    
+
     if len(filtered_predictions) == 0:
-        return jsonify([])
-    
+        return pd.DataFrame(columns=PREDICTION_GAP_COLUMNS)
+
     # Filter out invalid salaries (< $10k yearly)
     filtered_predictions = filtered_predictions[
         (filtered_predictions['ActualSalaryYearly'] >= 10000) &
         (filtered_predictions['PredictedSalary'] >= 10000)
     ]
-    
+
     if len(filtered_predictions) == 0:
-        return jsonify([])
-    
+        return pd.DataFrame(columns=PREDICTION_GAP_COLUMNS)
+
     # Helper: get most common role level per industry
     def get_most_common_role(x):
         mode_values = x.mode()
@@ -600,171 +988,290 @@ def get_prediction_gaps():
             return x.iloc[0]
         else:
             return 'Unknown'
-    
+
     # Aggregate by Industry: mean PredictedSalary, mean ActualSalaryYearly, most common RoleLevel
-    industry_gaps = filtered_predictions.groupby('Industry').agg({
+    industry_gaps = filtered_predictions.groupby('Industry', observed=True).agg({
         'PredictedSalary': 'mean',
         'ActualSalaryYearly': 'mean',
         'RoleLevel': get_most_common_role
     }).reset_index()
-    
+
     industry_gaps.columns = ['Industry', 'PredictedSalary', 'ActualSalaryYearly', 'RoleLevel']
-    
+
     # Calculate gap metrics: gap = actual - predicted, gapPct = (gap / actual) * 100
     industry_gaps['Gap'] = industry_gaps['ActualSalaryYearly'] - industry_gaps['PredictedSalary']
     industry_gaps['GapPct'] = (industry_gaps['Gap'] / industry_gaps['ActualSalaryYearly']) * 100
-    
+
     # Categorize: >+5% = Overpaying, <-5% = Underpaying, else Competitive
     industry_gaps['Category'] = industry_gaps['GapPct'].apply(
         lambda x: 'Overpaying' if x > 5 else ('Underpaying' if x < -5 else 'Competitive')
     )
-    
+
     # Sort by absolute gap % descending (biggest mismatches first)
     industry_gaps['AbsGapPct'] = industry_gaps['GapPct'].abs()
     industry_gaps = industry_gaps.sort_values(by='AbsGapPct', ascending=False)
     industry_gaps = industry_gaps.drop('AbsGapPct', axis=1)
-    
+
     # Rename for frontend compatibility (frontend expects 'SalaryMid' but it's actually normalized yearly)
     industry_gaps = industry_gaps.rename(columns={'ActualSalaryYearly': 'SalaryMid'})
-    
-    return jsonify(industry_gaps.to_dict('records'))
+
+    return industry_gaps
+
+@app.route('/api/analytics/prediction-gaps', methods=['GET'])
+@cached_response
+def get_prediction_gaps():
+    ds = current_dataset()
+    if ds is None:
+        return jsonify({'error': 'Data not loaded'}), 500
+
+    return records_response(prediction_gaps(ds))
 
 @app.route('/api/analytics/benchmarking', methods=['GET'])
+@cached_response
 def get_benchmarking():
-    if employer_offers is None or job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    market_data = job_postings.groupby(['JobTitle', 'Location'])['SalaryMid'].agg([
-        ('market_median', 'median'),
-        ('market_avg', 'mean'),
-        ('market_p25', lambda x: x.quantile(0.25)),
-        ('market_p75', lambda x: x.quantile(0.75)),
-        ('count', 'count')
-    ]).reset_index()
-    
-    benchmarking = employer_offers.merge(
-        market_data,
+
+    # Market statistics and percentiles per (JobTitle, Location) come from the
+    # market index: statistics precomputed at load, percentiles in one batched search
+    market_index = ds.market_index
+
+    benchmarking = ds.employer_offers.merge(
+        market_index.market_data,
         left_on=['Role', 'Location'],
         right_on=['JobTitle', 'Location'],
         how='left'
     )
-    
+
     benchmarking['Gap'] = benchmarking['SalaryOffer'] - benchmarking['market_median']
     benchmarking['GapPct'] = (benchmarking['Gap'] / benchmarking['market_median']) * 100
-    
-    def calc_percentile(row):
-        if pd.isna(row['market_median']):
-            return None
-        market_salaries = job_postings[
-            (job_postings['JobTitle'] == row['Role']) &
-            (job_postings['Location'] == row['Location'])
-        ]['SalaryMid']
-        if len(market_salaries) == 0:
-            return None
-        percentile = (market_salaries <= row['SalaryOffer']).sum() / len(market_salaries) * 100
-        return float(percentile)
-    
-    benchmarking['MarketPercentile'] = benchmarking.apply(calc_percentile, axis=1)
-    
-    return jsonify(benchmarking.to_dict('records'))
+
+    benchmarking['MarketPercentile'] = market_index.percentile(
+        benchmarking['Role'], benchmarking['Location'], benchmarking['SalaryOffer']
+    )
+
+    return records_response(benchmarking)
+
+# Most frequent skills of the filtered postings with their average salary
+def top_skills(ds):
+    # Number of skills to return (default 20; limit=all returns the full ranking)
+    limit = request.args.get('limit', '20')
+    if limit != 'all':
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ApiError('limit must be an integer or "all"', 400)
+
+    # Apply filters, then rank skills for the filtered postings from the skill index
+    skill_index = ds.skill_index
+    rows = filtered_posting_rows(ds)
+    frequency, average = skill_index.skill_stats(rows)
+    ranked = skill_index.ranking(frequency, rows)
+    if limit != 'all':
+        ranked = ranked[:max(limit, 0)]
+
+    ranked_average = average[ranked]
+    return pd.DataFrame({
+        'skill': np.asarray(skill_index.skill_names, dtype=object)[ranked],
+        'frequency': frequency[ranked].astype(np.int64),
+        'average_salary': np.where(np.isnan(ranked_average), 0, ranked_average)
+    })
 
 @app.route('/api/analytics/top-skills', methods=['GET'])
+@cached_response
 def get_top_skills():
-    if skills is None or job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify({'error': 'Data not loaded'}), 500
-    
-    df = job_postings.copy()
-    
-    # Apply filters
-    df = apply_filters(df)
-    
-    filtered_posting_ids = df['PostingID'].unique() if 'PostingID' in df.columns else []
-    
-    if len(filtered_posting_ids) > 0:
-        filtered_skills = skills[skills['PostingID'].isin(filtered_posting_ids)]
+
+    return records_response(top_skills(ds))
+
+# ============================================
+# DASHBOARD PAGE ENDPOINTS
+# ============================================
+
+# Scatter points in /api/dashboard/predictions unless max_points says otherwise
+DASHBOARD_SCATTER_POINTS = 1000
+
+# One response holding every widget of a dashboard page. The widgets share the
+# request's filter pass (filtered_posting_rows / filtered_postings /
+# request_predictions), so the filters are resolved once for the whole page.
+# A widget that fails is returned as null with its message under 'errors'.
+def dashboard_response(ds, widgets):
+    payload = {}
+    errors = {}
+    for name, build in widgets.items():
+        try:
+            payload[name] = table_payload(build(ds))
+        except ApiError as e:
+            payload[name] = None
+            errors[name] = e.message
+        except Exception as e:
+            payload[name] = None
+            errors[name] = str(e)
+    if errors:
+        payload['errors'] = errors
+    return jsonify(payload)
+
+# Sampled scatter rows for the Predictions page
+def scatter_sample(ds):
+    max_points = positive_int_arg('max_points') or DASHBOARD_SCATTER_POINTS
+    df = scatter_predictions(ds)
+    return df.iloc[stratified_sample(df, max_points)]
+
+# Home page: overview KPIs, top skills, salary by industry, salary distribution
+@app.route('/api/dashboard/home', methods=['GET'])
+@cached_response
+def get_home_dashboard():
+    ds = current_dataset()
+    if ds is None:
+        return jsonify({'error': 'Data not loaded'}), 500
+
+    return dashboard_response(ds, {
+        'kpis': overview_kpis,
+        'top_skills': top_skills,
+        'salary_by_industry': salary_by_industry,
+        'salary_distribution': salary_distribution
+    })
+
+# Salary Insights page: KPIs, salary by industry / experience level, top skills
+@app.route('/api/dashboard/salary-overview', methods=['GET'])
+@cached_response
+def get_salary_overview_dashboard():
+    ds = current_dataset()
+    if ds is None:
+        return jsonify({'error': 'Data not loaded'}), 500
+
+    return dashboard_response(ds, {
+        'kpis': salary_insights_kpis,
+        'salary_by_industry': salary_by_industry,
+        'salary_by_experience_level': salary_by_experience_level,
+        'top_skills': top_skills
+    })
+
+# Predictions page: KPIs, accuracy, gaps by industry and the sampled scatter
+@app.route('/api/dashboard/predictions', methods=['GET'])
+@cached_response
+def get_predictions_dashboard():
+    ds = current_dataset()
+    if ds is None:
+        return jsonify({'error': 'Data not loaded'}), 500
+
+    return dashboard_response(ds, {
+        'kpis': prediction_kpis,
+        'accuracy': prediction_accuracy,
+        'gaps': prediction_gaps,
+        'predictions': scatter_sample
+    })
+
+# Rows accepted by one /api/predict/batch request (PREDICT_BATCH_LIMIT)
+PREDICT_BATCH_LIMIT = int(os.environ.get('PREDICT_BATCH_LIMIT', 10000))
+
+# Predictions for a list of /api/predict bodies: the trained models' when loaded,
+# otherwise the median of the comparable postings +/-15%; either way with the
+# comparables' median, count and matched key level. Returns a dict of columns
+# (one value per row). Raises ValueError on malformed rows.
+def predict_rows(ds, rows):
+    for position, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise ValueError(f'Row {position} is not a JSON object')
+
+    comparables = ds.comparables_index.lookup_many(
+        [row.get('job_title') for row in rows],
+        [row.get('location') for row in rows],
+        [row.get('role_level') for row in rows]
+    )
+    if ds.predictor is not None:
+        result = ds.predictor.predict(rows)
     else:
-        filtered_skills = skills
-    
-    skill_counts = filtered_skills['Skills'].value_counts().head(20) if 'Skills' in filtered_skills.columns else pd.Series()
-    
-    skill_salaries = []
-    for skill in skill_counts.index:
-        skill_postings = filtered_skills[filtered_skills['Skills'] == skill]['PostingID'].unique()
-        avg_salary = df[df['PostingID'].isin(skill_postings)]['SalaryMid'].mean()
-        skill_salaries.append({
-            'skill': skill,
-            'frequency': int(skill_counts[skill]),
-            'average_salary': float(avg_salary) if not pd.isna(avg_salary) else 0
-        })
-    
-    return jsonify(skill_salaries)
+        median = comparables['comparable_median']
+        result = {
+            'predicted_salary': median,
+            'predicted_lower': median * 0.85,
+            'predicted_upper': median * 1.15,
+            'predicted_comp_type': ['Yearly'] * len(rows),
+            'confidence': np.full(len(rows), 0.85)
+        }
+    return {**result, **comparables}
 
+# Predict salary, its interval and compensation type for one posting:
+# {"job_title", "location", "role_level", "industry", "remote_type", "skills"}
 @app.route('/api/predict', methods=['POST'])
 def predict_salary():
-    if model_data is None:
-        return jsonify({'error': 'Model not loaded'}), 500
-    
-    data = request.json
-    
+    ds = current_dataset()
+    if ds is None:
+        return jsonify({'error': 'Data not loaded'}), 500
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Expected a JSON object'}), 400
+
     try:
-        job_title = data.get('job_title')
-        location = data.get('location')
-        role_level = data.get('role_level')
-        
-        similar = job_postings[
-            (job_postings['JobTitle'] == job_title) &
-            (job_postings['Location'] == location) &
-            (job_postings['RoleLevel'] == role_level)
-        ]
-        
-        if len(similar) > 0:
-            pred_salary = float(similar['SalaryMid'].median())
-            pred_lower = float(pred_salary * 0.85)
-            pred_upper = float(pred_salary * 1.15)
-        else:
-            pred_salary = float(job_postings['SalaryMid'].median())
-            pred_lower = float(pred_salary * 0.85)
-            pred_upper = float(pred_salary * 1.15)
-        
-        return jsonify({
-            'predicted_salary': pred_salary,
-            'predicted_lower': pred_lower,
-            'predicted_upper': pred_upper,
-            'predicted_comp_type': 'Yearly',
-            'confidence': 0.85
-        })
-    except Exception as e:
+        result = predict_rows(ds, [data])
+    except ValueError as e:
         return jsonify({'error': str(e)}), 400
 
+    return jsonify({name: values[0] for name, values in result.items()})
+
+# Score many postings in one vectorized pass: a JSON array of /api/predict bodies
+# (or {"rows": [...]}). Returns {"predictions": [...], "count": N} in input order;
+# format=columnar returns the predictions column-wise.
+@app.route('/api/predict/batch', methods=['POST'])
+def predict_salary_batch():
+    ds = current_dataset()
+    if ds is None:
+        return jsonify({'error': 'Data not loaded'}), 500
+
+    data = request.get_json(silent=True)
+    rows = data.get('rows') if isinstance(data, dict) else data
+    if not isinstance(rows, list):
+        return jsonify({'error': 'Expected a JSON array of rows'}), 400
+    if len(rows) > PREDICT_BATCH_LIMIT:
+        return jsonify({'error': f'At most {PREDICT_BATCH_LIMIT} rows per batch'}), 413
+
+    try:
+        result = pd.DataFrame(predict_rows(ds, rows))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify({'predictions': table_payload(result), 'count': int(len(result))})
+
 @app.route('/api/filters/industries', methods=['GET'])
+@cached_response
 def get_industries():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify([])
-    industries = job_postings['Industry'].unique().tolist()
+    industries = ds.job_postings['Industry'].unique().tolist()
     industries = [ind for ind in industries if ind and str(ind) != 'nan' and str(ind) != 'Unknown']
     return jsonify(sorted(industries))
 
 @app.route('/api/filters/experience-levels', methods=['GET'])
+@cached_response
 def get_experience_levels():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify([])
-    levels = job_postings['RoleLevel'].unique().tolist()
+    levels = ds.job_postings['RoleLevel'].unique().tolist()
     levels = [level for level in levels if level and str(level) != 'nan']
     return jsonify(sorted(levels))
 
 @app.route('/api/filters/compensation-types', methods=['GET'])
+@cached_response
 def get_compensation_types():
-    if job_postings is None:
+    ds = current_dataset()
+    if ds is None:
         return jsonify(['Yearly', 'Hourly'])
-    
-    types = job_postings['CompensationType'].unique().tolist()
+
+    types = ds.job_postings['CompensationType'].unique().tolist()
     types = [t for t in types if t and str(t) != 'nan']
-    
+
     if 'Yearly' not in types:
         types.append('Yearly')
     if 'Hourly' not in types:
         types.append('Hourly')
-    
+
     return jsonify(sorted(types))
 
 @app.route('/', defaults={'path': ''})
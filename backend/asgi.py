@@ -0,0 +1,156 @@
+"""
+ASGI Server Adapter
+Serves the Flask app from an asyncio event loop: every request runs in a bounded
+thread pool, heavy endpoints (analytics, dashboards, bulk tables, predictions) in
+their own, so slow aggregations never hold up health checks and filter lists.
+
+    cd backend && uvicorn asgi:application --port 5000
+"""
+
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from app import app
+from encoding import dumps
+
+# Path prefixes whose handlers do the CPU-heavy pandas/NumPy work
+HEAVY_PREFIXES = (
+    '/api/analytics/', '/api/dashboard/', '/api/predict',
+    '/api/job-postings', '/api/predictions', '/api/skills', '/api/employer-offers'
+)
+
+# Threads running heavy requests (ASYNC_HEAVY_WORKERS, default one per CPU) and
+# everything else (ASYNC_LIGHT_WORKERS, default 8)
+HEAVY_WORKERS = int(os.environ.get('ASYNC_HEAVY_WORKERS', os.cpu_count() or 4))
+LIGHT_WORKERS = int(os.environ.get('ASYNC_LIGHT_WORKERS', 8))
+
+# Heavy requests allowed to wait for a thread (ASYNC_HEAVY_QUEUE); beyond that
+# they are answered 503 with Retry-After instead of piling up
+HEAVY_QUEUE = int(os.environ.get('ASYNC_HEAVY_QUEUE', 64))
+
+# PEP 3333 environ of an ASGI HTTP scope and its request body
+def wsgi_environ(scope, body):
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    script_name = scope.get('root_path', '').encode('utf8').decode('latin1')
+    path_info = scope['path'].encode('utf8').decode('latin1')
+    if script_name and path_info.startswith(script_name):
+        path_info = path_info[len(script_name):]
+
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': script_name,
+        'PATH_INFO': path_info,
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin1'),
+        'SERVER_NAME': str(server[0]),
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        # The body is already buffered, so its length is known even when the client
+        # sent it chunked (Werkzeug reads no body without CONTENT_LENGTH)
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False
+    }
+    for name, value in scope.get('headers', []):
+        name = name.decode('latin1')
+        value = value.decode('latin1')
+        if name == 'content-length':
+            continue
+        if name == 'content-type':
+            environ['CONTENT_TYPE'] = value
+        else:
+            key = 'HTTP_' + name.upper().replace('-', '_')
+            environ[key] = f'{environ[key]},{value}' if key in environ else value
+    return environ
+
+class AsyncServer:
+    def __init__(self, wsgi_app, heavy_workers=HEAVY_WORKERS, light_workers=LIGHT_WORKERS, heavy_queue=HEAVY_QUEUE):
+        self.wsgi_app = wsgi_app
+        self.heavy = ThreadPoolExecutor(max_workers=heavy_workers, thread_name_prefix='heavy')
+        self.light = ThreadPoolExecutor(max_workers=light_workers, thread_name_prefix='light')
+        # Heavy requests running or waiting; only touched from the event loop
+        self.heavy_limit = heavy_workers + heavy_queue
+        self.heavy_pending = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self.http(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.heavy.shutdown(wait=False)
+                self.light.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def http(self, scope, receive, send):
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+            body.extend(message.get('body', b''))
+            if not message.get('more_body', False):
+                break
+
+        heavy = scope['path'].startswith(HEAVY_PREFIXES)
+        if heavy and self.heavy_pending >= self.heavy_limit:
+            await send({
+                'type': 'http.response.start',
+                'status': 503,
+                'headers': [(b'content-type', b'application/json'), (b'retry-after', b'1')]
+            })
+            await send({'type': 'http.response.body', 'body': dumps({'error': 'Server busy, retry shortly'})})
+            return
+
+        if heavy:
+            self.heavy_pending += 1
+        try:
+            await self.run_wsgi(self.heavy if heavy else self.light, wsgi_environ(scope, bytes(body)), send)
+        finally:
+            if heavy:
+                self.heavy_pending -= 1
+
+    # Run the WSGI app on the executor and relay its response; every chunk of a
+    # streamed body is produced on the executor too
+    async def run_wsgi(self, executor, environ, send):
+        loop = asyncio.get_running_loop()
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started['status'] = int(status.split(' ', 1)[0])
+            started['headers'] = [(name.lower().encode('latin1'), value.encode('latin1')) for name, value in headers]
+            return lambda data: None
+
+        chunks = await loop.run_in_executor(executor, self.wsgi_app, environ, start_response)
+        try:
+            iterator = iter(chunks)
+            # Streamed responses may call start_response only once iteration begins
+            chunk = await loop.run_in_executor(executor, next, iterator, None)
+            await send({'type': 'http.response.start', 'status': started['status'], 'headers': started['headers']})
+            while chunk is not None:
+                if chunk:
+                    await send({'type': 'http.response.body', 'body': bytes(chunk), 'more_body': True})
+                chunk = await loop.run_in_executor(executor, next, iterator, None)
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        finally:
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                await loop.run_in_executor(executor, close)
+
+application = AsyncServer(app)
@@ -0,0 +1,25 @@
+"""
+Column Helpers
+Vectorized helpers that work on both plain and dictionary-encoded (Categorical) columns.
+"""
+
+import pandas as pd
+import numpy as np
+
+# Boolean mask of rows where series equals value; dictionary-encoded columns
+# compare integer codes (a value missing from the dictionary matches nothing)
+def category_mask(series, value):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        code = series.cat.categories.get_indexer([value])[0]
+        if code < 0:
+            return np.zeros(len(series), dtype=bool)
+        return series.cat.codes.to_numpy() == code
+    return (series == value).to_numpy()
+
+# Map each value of series through mapping (default for unmapped/missing values)
+# Dictionary-encoded columns map their categories once and gather by code
+def map_values(series, mapping, default):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        lookup = np.array([mapping.get(c, default) for c in series.cat.categories] + [default], dtype=float)
+        return pd.Series(lookup[series.cat.codes.to_numpy()], index=series.index)
+    return series.map(mapping).fillna(default)
@@ -0,0 +1,190 @@
+"""
+Aggregate Cube
+Materialized job-posting aggregates for every Industry x RoleLevel x CompensationType
+filter combination, including the "all" rollup of each dimension.
+"""
+
+import pandas as pd
+import numpy as np
+from itertools import product
+
+from columns import category_mask, map_values
+
+# Dimensions the dashboard filters combine; a cell key holds one value per
+# dimension, None meaning "all values" (the dimension is not filtered)
+CUBE_DIMENSIONS = ['Industry', 'RoleLevel', 'CompensationType']
+
+# RoleLevel -> numeric experience score behind average_experience_level (unmapped = 3)
+EXPERIENCE_SCORES = {'Entry': 1, 'Junior': 1, 'Mid': 3, 'Senior': 4, 'Executive': 5, 'Lead': 4, 'Principal': 5}
+
+# Industry values the dashboard treats as "no industry"
+UNKNOWN_INDUSTRIES = ('Unknown', 'nan')
+
+# Statistics of a filter combination with no matching rows
+EMPTY_CELL = {
+    'rows': 0, 'postings': 0,
+    'salary_count': 0, 'salary_sum': 0.0, 'salary_min': np.nan, 'salary_max': np.nan,
+    'salary_median': np.nan, 'salary_p25': np.nan, 'salary_p75': np.nan,
+    'range_min': np.nan, 'range_max': np.nan, 'exp_sum': 0.0,
+    'yearly_count': 0, 'yearly_sum': 0.0, 'yearly_median': np.nan,
+    'pred_count': 0, 'pred_sum': 0.0
+}
+
+# Group df by the given dimension columns (all rows in one group when by is empty)
+def _grouped(frame, by, df=None):
+    df = frame if df is None else df
+    keys = [df[col] for col in by] if by else np.zeros(len(df), dtype=np.int8)
+    return frame.groupby(keys, observed=True, sort=False)
+
+# Full cube key (one entry per CUBE_DIMENSIONS, None = all) for a groupby key over `by`
+def _cell_key(by, group_key):
+    values = group_key if isinstance(group_key, tuple) else (group_key,)
+    named = dict(zip(by, values)) if by else {}
+    return tuple(named.get(dim) for dim in CUBE_DIMENSIONS)
+
+# Each cell holds the sufficient statistics the KPI endpoints need (counts, sums,
+# min/max) plus exact order statistics: every cell is materialized, so medians and
+# quartiles are computed once per cell at build time instead of per request.
+#   rows / postings       - matching rows / distinct PostingIDs
+#   salary_*              - SalaryMid count, sum, min, max, median, p25, p75
+#   range_min / range_max - min SalaryMin / max SalaryMax
+#   exp_sum               - sum of EXPERIENCE_SCORES over the rows
+#   yearly_*              - Yearly postings with SalaryMid in $20k-$500k: count, sum, median
+#   pred_*                - predictions (both salaries in $20k-$500k) whose PostingID is in the cell
+class AggregateCube:
+    def __init__(self, job_postings, predictions):
+        self.cells = {}
+        self.best_industry = {}
+        self.industry_cells = {}
+
+        exp_numeric = map_values(job_postings['RoleLevel'], EXPERIENCE_SCORES, 3)
+        yearly_mask = (
+            category_mask(job_postings['CompensationType'], 'Yearly') &
+            (job_postings['SalaryMid'] >= 20000).to_numpy() &
+            (job_postings['SalaryMid'] <= 500000).to_numpy()
+        )
+        yearly = job_postings[yearly_mask]
+        pred_pairs = self._prediction_pairs(job_postings, predictions)
+
+        # Predictions are only attributed to cells through their postings; the
+        # dashboard falls back to every in-range prediction when no posting matches
+        in_range = self._in_range_predictions(predictions)
+        self.all_predictions = (int(len(in_range)), float(in_range['PredictedSalary'].sum()))
+
+        for used in product([False, True], repeat=len(CUBE_DIMENSIONS)):
+            by = [dim for dim, use in zip(CUBE_DIMENSIONS, used) if use]
+
+            grouped = _grouped(job_postings, by)
+            salary = grouped['SalaryMid']
+            stats = pd.DataFrame({
+                'rows': grouped.size(),
+                'postings': grouped['PostingID'].nunique(),
+                'salary_count': salary.count(),
+                'salary_sum': salary.sum(),
+                'salary_min': salary.min(),
+                'salary_max': salary.max(),
+                'salary_median': salary.median(),
+                'salary_p25': salary.quantile(0.25),
+                'salary_p75': salary.quantile(0.75),
+                'range_min': grouped['SalaryMin'].min(),
+                'range_max': grouped['SalaryMax'].max(),
+                'exp_sum': _grouped(exp_numeric, by, job_postings).sum()
+            })
+            for group_key, values in stats.to_dict('index').items():
+                self.cells[_cell_key(by, group_key)] = dict(EMPTY_CELL, **values)
+
+            yearly_salary = _grouped(yearly, by)['SalaryMid']
+            yearly_stats = pd.DataFrame({
+                'yearly_count': yearly_salary.count(),
+                'yearly_sum': yearly_salary.sum(),
+                'yearly_median': yearly_salary.median()
+            })
+            for group_key, values in yearly_stats.to_dict('index').items():
+                self.cells[_cell_key(by, group_key)].update(values)
+
+            # A prediction counts once per cell even when its PostingID has several rows there
+            pairs = pred_pairs.drop_duplicates(['pred_row'] + by)
+            pred_salary = _grouped(pairs, by)['PredictedSalary']
+            pred_stats = pd.DataFrame({'pred_count': pred_salary.count(), 'pred_sum': pred_salary.sum()})
+            for group_key, values in pred_stats.to_dict('index').items():
+                self.cells[_cell_key(by, group_key)].update(values)
+
+        # Known industries, and the best-paying one, for every (RoleLevel, CompensationType) cell
+        for (industry, role_level, comp_type), cell in self.cells.items():
+            if industry is None or industry in UNKNOWN_INDUSTRIES:
+                continue
+            self.industry_cells.setdefault((role_level, comp_type), []).append((industry, cell))
+            if cell['salary_count'] == 0:
+                continue
+            average = cell['salary_sum'] / cell['salary_count']
+            best = self.best_industry.get((role_level, comp_type))
+            if best is None or average > best[1]:
+                self.best_industry[(role_level, comp_type)] = (industry, average)
+
+    @staticmethod
+    def _in_range_predictions(predictions):
+        required = ('PostingID', 'PredictedSalary', 'ActualSalaryYearly')
+        if len(predictions) == 0 or any(col not in predictions.columns for col in required):
+            return pd.DataFrame({'PostingID': np.empty(0, dtype=np.int64), 'PredictedSalary': np.empty(0)})
+        return predictions[
+            (predictions['PredictedSalary'] >= 20000) &
+            (predictions['PredictedSalary'] <= 500000) &
+            (predictions['ActualSalaryYearly'] >= 20000) &
+            (predictions['ActualSalaryYearly'] <= 500000)
+        ]
+
+    # In-range predictions joined to the dimension values of their postings
+    @classmethod
+    def _prediction_pairs(cls, job_postings, predictions):
+        in_range = cls._in_range_predictions(predictions)
+        pairs = pd.DataFrame({
+            'pred_row': np.arange(len(in_range)),
+            'PostingID': in_range['PostingID'].to_numpy(),
+            'PredictedSalary': in_range['PredictedSalary'].to_numpy()
+        })
+        dims = job_postings[['PostingID'] + CUBE_DIMENSIONS].drop_duplicates()
+        return pairs.merge(dims, on='PostingID', how='inner')
+
+    # Cube key for {column: value} filters, or None if a filter is not a cube dimension
+    @staticmethod
+    def key(filters):
+        if any(col not in CUBE_DIMENSIONS for col in filters):
+            return None
+        return tuple(filters.get(dim) for dim in CUBE_DIMENSIONS)
+
+    def cell(self, key):
+        return self.cells.get(key, EMPTY_CELL)
+
+    # (industry, mean SalaryMid) of the best-paying known industry in the cell, or (None, 0)
+    def highest_paying_industry(self, key):
+        industry, role_level, comp_type = key
+        if industry is None:
+            return self.best_industry.get((role_level, comp_type), (None, 0))
+        cell = self.cell(key)
+        if industry in UNKNOWN_INDUSTRIES or cell['salary_count'] == 0:
+            return None, 0
+        return industry, cell['salary_sum'] / cell['salary_count']
+
+    # Mean in-range PredictedSalary for the cell (every prediction when no posting matches)
+    def predicted_salary(self, key):
+        cell = self.cell(key)
+        count, total = (cell['pred_count'], cell['pred_sum']) if cell['postings'] > 0 else self.all_predictions
+        return total / count if count > 0 else 0
+
+    # Per-industry SalaryMid statistics within the cell's RoleLevel/CompensationType,
+    # as the records of the salary-by-industry endpoint
+    def industry_breakdown(self, key):
+        industry, role_level, comp_type = key
+        records = []
+        for cell_industry, cell in self.industry_cells.get((role_level, comp_type), []):
+            if industry is not None and cell_industry != industry:
+                continue
+            records.append({
+                'Industry': cell_industry,
+                'median': cell['salary_median'],
+                'average': cell['salary_sum'] / cell['salary_count'] if cell['salary_count'] > 0 else np.nan,
+                'min': cell['salary_min'],
+                'max': cell['salary_max'],
+                'count': int(cell['salary_count'])
+            })
+        return records
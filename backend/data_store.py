@@ -0,0 +1,146 @@
+"""
+Columnar Snapshot Store
+Typed binary snapshots of the transformed tables so the backend can start
+without re-parsing the CSVs.
+"""
+
+import pandas as pd
+import numpy as np
+import os
+import json
+import shutil
+from datetime import datetime
+
+# Snapshot layout (one directory per table, one generation directory per write):
+#   data/snapshot/<table>/CURRENT                  - name of the live generation
+#   data/snapshot/<table>/<generation>/manifest.json
+#   data/snapshot/<table>/<generation>/<col>.npy        - numeric column values
+#   data/snapshot/<table>/<generation>/<col>.codes.npy  - dictionary codes for string columns (-1 = missing)
+# Generations are never modified in place, so a running backend that has them
+# memory-mapped is unaffected when the scripts write a new one.
+SNAPSHOT_DIRNAME = 'snapshot'
+FORMAT_VERSION = 1
+
+TABLE_FILES = {
+    'job_postings': 'transformed_job_postings.csv',
+    'skills': 'transformed_skills.csv',
+    'predictions': 'transformed_predictions.csv',
+    'employer_offers': 'transformed_employer_offers.csv'
+}
+
+def snapshot_dir(data_dir, table):
+    return os.path.join(data_dir, SNAPSHOT_DIRNAME, table)
+
+# Path of the live generation's manifest, or None if the table has no snapshot
+def manifest_path(data_dir, table):
+    table_dir = snapshot_dir(data_dir, table)
+    try:
+        with open(os.path.join(table_dir, 'CURRENT')) as f:
+            generation = f.read().strip()
+    except OSError:
+        return None
+    path = os.path.join(table_dir, generation, 'manifest.json')
+    return path if os.path.exists(path) else None
+
+# Write df as a new snapshot generation and point CURRENT at it
+def write_table(data_dir, table, df):
+    table_dir = snapshot_dir(data_dir, table)
+    generation = datetime.now().strftime('%Y%m%d%H%M%S%f')
+    gen_dir = os.path.join(table_dir, generation)
+    os.makedirs(gen_dir, exist_ok=True)
+
+    columns = []
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            values = np.ascontiguousarray(series.to_numpy())
+            np.save(os.path.join(gen_dir, f'{col}.npy'), values)
+            columns.append({'name': col, 'kind': 'numeric', 'dtype': str(values.dtype)})
+        else:
+            # Dictionary-encode everything else (strings, mixed objects) with str categories
+            cat = series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype('category')
+            categories = [str(c) for c in cat.cat.categories]
+            np.save(os.path.join(gen_dir, f'{col}.codes.npy'), np.ascontiguousarray(cat.cat.codes.to_numpy()))
+            columns.append({'name': col, 'kind': 'category', 'categories': categories})
+
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'table': table,
+        'rows': int(len(df)),
+        'columns': columns,
+        'created': datetime.now().isoformat()
+    }
+    with open(os.path.join(gen_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f)
+
+    # Swap the pointer atomically, then drop older generations (best effort:
+    # a generation still memory-mapped by a running process may refuse to go)
+    pointer_tmp = os.path.join(table_dir, f'CURRENT.{os.getpid()}.tmp')
+    with open(pointer_tmp, 'w') as f:
+        f.write(generation)
+    os.replace(pointer_tmp, os.path.join(table_dir, 'CURRENT'))
+
+    for name in os.listdir(table_dir):
+        old_dir = os.path.join(table_dir, name)
+        if name != generation and os.path.isdir(old_dir):
+            shutil.rmtree(old_dir, ignore_errors=True)
+
+    return gen_dir
+
+# Open a table's snapshot with numeric columns memory-mapped (zero-copy).
+# String columns named in `categorical` stay dictionary-encoded (pandas Categorical
+# over the memory-mapped codes); the rest are decoded to object arrays.
+# Returns None when there is no snapshot, or when the CSV is newer than it.
+def load_table(data_dir, table, categorical=()):
+    path = manifest_path(data_dir, table)
+    if path is None:
+        return None
+
+    csv_path = os.path.join(data_dir, TABLE_FILES[table])
+    if os.path.exists(csv_path) and os.path.getmtime(csv_path) > os.path.getmtime(path):
+        print(f"Snapshot for {table} is older than {TABLE_FILES[table]}, ignoring it")
+        return None
+
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != FORMAT_VERSION:
+        return None
+
+    gen_dir = os.path.dirname(path)
+    # Empty files cannot be memory-mapped
+    mmap_mode = 'r' if manifest['rows'] > 0 else None
+
+    data = {}
+    for column in manifest['columns']:
+        name = column['name']
+        if column['kind'] == 'numeric':
+            data[name] = np.load(os.path.join(gen_dir, f'{name}.npy'), mmap_mode=mmap_mode)
+        else:
+            codes = np.load(os.path.join(gen_dir, f'{name}.codes.npy'), mmap_mode=mmap_mode)
+            categories = pd.Index(column['categories'], dtype=object)
+            values = pd.Categorical.from_codes(codes, categories=categories)
+            if name in categorical:
+                data[name] = values
+            else:
+                # Decode through the dictionary in one gather; missing values come back as NaN
+                data[name] = np.asarray(values, dtype=object)
+
+    # copy=False keeps the memory-mapped arrays as the column buffers
+    return pd.DataFrame(data, columns=[c['name'] for c in manifest['columns']], copy=False)
+
+# Rebuild snapshots for every table from the CSVs currently in data_dir
+def build_from_csv(data_dir):
+    for table, filename in TABLE_FILES.items():
+        csv_path = os.path.join(data_dir, filename)
+        if not os.path.exists(csv_path):
+            print(f"   [SKIP] {filename} not found")
+            continue
+        df = pd.read_csv(csv_path)
+        write_table(data_dir, table, df)
+        print(f"   [OK] Snapshot written for {table} ({len(df):,} rows)")
+
+if __name__ == '__main__':
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, 'data')
+    print(f"Building columnar snapshots in {os.path.join(data_dir, SNAPSHOT_DIRNAME)}")
+    build_from_csv(data_dir)
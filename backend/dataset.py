@@ -0,0 +1,94 @@
+"""
+Dataset Snapshot
+One immutable bundle of every table, the model and the indexes built over them.
+"""
+
+import pandas as pd
+import numpy as np
+import os
+import time
+import threading
+
+import data_store
+from indexes import BitmapIndex, SkillIndex, MarketIndex, DateIndex, ComparablesIndex
+from cube import AggregateCube
+from sketches import QuantileSketches
+from predictor import SalaryPredictor
+import forest_engine
+
+# Low-cardinality string columns kept dictionary-encoded (pandas Categorical) in memory,
+# so filters compare small integer codes instead of Python strings
+DIMENSION_COLUMNS = [
+    'Industry', 'RoleLevel', 'CompensationType', 'RemoteType', 'EmploymentType',
+    'Region', 'Country', 'Source', 'Status', 'PredictedCompType'
+]
+
+# Dimension columns covered by the bitmap indexes
+FILTER_COLUMNS = ['Industry', 'RoleLevel', 'CompensationType', 'RemoteType']
+
+# Open the table's columnar snapshot if one exists, otherwise parse the CSV
+def read_table(data_dir, table):
+    df = data_store.load_table(data_dir, table, categorical=DIMENSION_COLUMNS)
+    if df is not None:
+        print(f"Loaded {table} from columnar snapshot ({len(df):,} rows)")
+        return df
+    df = pd.read_csv(os.path.join(data_dir, data_store.TABLE_FILES[table]))
+    for col in DIMENSION_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+# Everything a request reads. Built once per load and never mutated afterwards:
+# handlers select rows (index positions / masks) and compute derived values as
+# standalone Series, so concurrent requests share the same column buffers.
+class Dataset:
+    def __init__(self, job_postings, skills, predictions, employer_offers, model_path=None, version=None):
+        self.job_postings = job_postings
+        self.skills = skills
+        self.predictions = predictions
+        self.employer_offers = employer_offers
+        # Trained model, opened on first use (see predictor)
+        self.model_path = model_path
+        self.model_available = model_path is not None and forest_engine.model_available(model_path)
+        self.model_loaded = False
+        self._predictor = None
+        self._model_lock = threading.Lock()
+        # Load number (millisecond timestamp unless given), used in cache keys and ETags
+        self.version = int(time.time() * 1000) if version is None else version
+
+        self.job_postings_index = BitmapIndex(job_postings, FILTER_COLUMNS)
+        self.predictions_index = BitmapIndex(predictions, FILTER_COLUMNS)
+        self.skill_index = SkillIndex(job_postings, skills)
+        self.market_index = MarketIndex(job_postings)
+        self.comparables_index = ComparablesIndex(job_postings)
+        self.date_index = DateIndex(job_postings)
+        # SalaryMid quantile sketches per filter combination, alone and by title / location
+        self.salary_sketches = QuantileSketches(job_postings, FILTER_COLUMNS)
+        self.title_sketches = QuantileSketches(job_postings, FILTER_COLUMNS + ['JobTitle'])
+        self.location_sketches = QuantileSketches(job_postings, FILTER_COLUMNS + ['Location'])
+        self.cube = AggregateCube(job_postings, predictions)
+
+    # Scorer over the trained models, None without a model. Loaded by the first
+    # prediction rather than at startup, as most requests never need it; the
+    # exported forest arrays are memory-mapped, so worker processes share them.
+    @property
+    def predictor(self):
+        if not self.model_loaded:
+            with self._model_lock:
+                if not self.model_loaded:
+                    try:
+                        model = forest_engine.load_model(self.model_path) if self.model_available else None
+                        self._predictor = SalaryPredictor(model) if model is not None else None
+                    except Exception as e:
+                        print(f"Error loading model: {e}")
+                    self.model_loaded = True
+        return self._predictor
+
+    @classmethod
+    def load(cls, data_dir, model_path, version=None):
+        job_postings = read_table(data_dir, 'job_postings')
+        skills = read_table(data_dir, 'skills')
+        predictions = read_table(data_dir, 'predictions')
+        employer_offers = read_table(data_dir, 'employer_offers')
+
+        return cls(job_postings, skills, predictions, employer_offers, model_path, version)
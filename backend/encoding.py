@@ -0,0 +1,94 @@
+"""
+JSON Encoding
+Fast JSON encoding for API responses: orjson when installed (JSON_ENCODER=json
+forces the standard library), NumPy-aware, with NaN/inf always encoded as null.
+"""
+
+import json
+import math
+import os
+import numpy as np
+import pandas as pd
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ENCODER = os.environ.get('JSON_ENCODER', 'orjson' if orjson is not None else 'json')
+if ENCODER == 'orjson' and orjson is None:
+    print("JSON_ENCODER=orjson but orjson is not installed, using json")
+    ENCODER = 'json'
+
+ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+# Values neither encoder handles natively (NumPy scalars/arrays for json, pandas
+# scalars and dates for both); NaN-like values become null
+def _default(value):
+    if isinstance(value, np.generic):
+        value = value.item()
+        return None if isinstance(value, float) and not math.isfinite(value) else value
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+# Replace non-finite floats with None (json has no null-on-NaN option)
+def _finite(obj):
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+# Encode obj to UTF-8 JSON bytes
+def dumps(obj):
+    if ENCODER == 'orjson':
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+    try:
+        text = json.dumps(obj, default=_default, allow_nan=False)
+    except ValueError:
+        # Only payloads that actually contain NaN/inf pay for the rewrite
+        text = json.dumps(_finite(obj), default=lambda value: _finite(_default(value)), allow_nan=False)
+    return text.encode('utf-8')
+
+# Plain Python values of one column: NumPy arrays for numeric columns (encoded
+# natively by orjson), lists otherwise
+def column_values(series, native_arrays=False):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.array.tolist()
+    values = series.to_numpy()
+    if native_arrays and values.dtype.kind in 'biuf':
+        return np.ascontiguousarray(values)
+    return values.tolist()
+
+# df as a list of row dicts, built by zipping column lists (skips the per-cell
+# boxing of DataFrame.to_dict)
+def records(df):
+    names = [str(col) for col in df.columns]
+    columns = [column_values(df[col]) for col in df.columns]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+# df in columnar shape: {'columns': [...], 'data': {column: [values]}, 'rows': n}
+def columnar(df):
+    native_arrays = ENCODER == 'orjson'
+    return {
+        'columns': [str(col) for col in df.columns],
+        'data': {str(col): column_values(df[col], native_arrays) for col in df.columns},
+        'rows': int(len(df))
+    }
+
+# Flask JSON provider that routes jsonify() through dumps()
+class FastJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        return dumps(obj).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
@@ -0,0 +1,214 @@
+"""
+Forest Engine
+RandomForest models flattened into contiguous NumPy node arrays and evaluated for
+every tree at once, so predictions need neither scikit-learn nor its per-tree
+Python overhead.
+"""
+
+import numpy as np
+import os
+import json
+import pickle
+import shutil
+from datetime import datetime
+
+# Model artifact layout (next to the pickle, one generation directory per export):
+#   python/salary_model_forest/CURRENT                    - name of the live generation
+#   python/salary_model_forest/<generation>/manifest.json - features, encoders, forest shapes
+#   python/salary_model_forest/<generation>/<forest>.<array>.npy
+FORMAT_VERSION = 1
+FORESTS = ('salary_forest', 'comp_forest')
+
+# Node arrays of a flattened forest, all trees concatenated with global node ids:
+#   feature   int32    split feature (0 for leaves)
+#   threshold float64  go left when x[feature] <= threshold (+inf for leaves)
+#   left      int32    left child (the node itself for leaves)
+#   right     int32    right child (the node itself for leaves)
+#   value     float64  leaf output: the regression value, or (n_nodes, n_classes)
+#                      class probabilities for classifiers
+#   roots     int32    root node of every tree
+# Leaves point back at themselves, so a fixed number of steps (the deepest tree's
+# depth) walks every tree to its leaf without checking which ones finished.
+NODE_ARRAYS = ('feature', 'threshold', 'left', 'right', 'value', 'roots')
+
+def model_dir(model_path):
+    return os.path.splitext(model_path)[0] + '_forest'
+
+class TreeEnsemble:
+    def __init__(self, arrays, max_depth, classes=None):
+        for name in NODE_ARRAYS:
+            setattr(self, name, arrays[name])
+        self.max_depth = int(max_depth)
+        self.classes = None if classes is None else np.asarray(classes)
+        self.n_trees = len(self.roots)
+
+    # Flatten a fitted RandomForestRegressor / RandomForestClassifier
+    @classmethod
+    def from_sklearn(cls, model):
+        is_classifier = hasattr(model, 'classes_')
+        parts = {name: [] for name in NODE_ARRAYS}
+        offset = 0
+        max_depth = 0
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            leaf = tree.children_left < 0
+            own_ids = np.arange(tree.node_count) + offset
+            parts['feature'].append(np.where(leaf, 0, tree.feature))
+            parts['threshold'].append(np.where(leaf, np.inf, tree.threshold))
+            parts['left'].append(np.where(leaf, own_ids, tree.children_left + offset))
+            parts['right'].append(np.where(leaf, own_ids, tree.children_right + offset))
+            value = tree.value[:, 0, :]
+            if is_classifier:
+                # Leaf class weights -> probabilities, as DecisionTreeClassifier.predict_proba
+                value = value / value.sum(axis=1, keepdims=True)
+            else:
+                value = value[:, 0]
+            parts['value'].append(value)
+            parts['roots'].append([offset])
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+
+        arrays = {
+            'feature': np.concatenate(parts['feature']).astype(np.int32),
+            'threshold': np.concatenate(parts['threshold']).astype(np.float64),
+            'left': np.concatenate(parts['left']).astype(np.int32),
+            'right': np.concatenate(parts['right']).astype(np.int32),
+            'value': np.ascontiguousarray(np.concatenate(parts['value']), dtype=np.float64),
+            'roots': np.concatenate(parts['roots']).astype(np.int32)
+        }
+        return cls(arrays, max_depth, model.classes_ if is_classifier else None)
+
+    # Output of every tree for every row of X: (n_trees, n_rows) for regressors,
+    # (n_trees, n_rows, n_classes) for classifiers.
+    # Splits compare float32 features against float64 thresholds, like scikit-learn.
+    def tree_outputs(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(len(X))
+        node = np.repeat(self.roots[:, None], len(X), axis=1)
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.value[node]
+
+    # Forest mean over the trees (sums in tree order, like scikit-learn)
+    def predict(self, X):
+        return self.tree_outputs(X).mean(axis=0)
+
+    def predict_proba(self, X):
+        return self.tree_outputs(X).mean(axis=0)
+
+# The pickled model_data of train_and_predict.py reduced to what prediction needs:
+# both forests flattened, plus the feature order and encoder classes as plain lists
+def compile_model(model_data):
+    comp_model = model_data['comp_model']
+    comp_encoder = model_data['comp_encoder']
+    return {
+        'salary_forest': TreeEnsemble.from_sklearn(model_data['salary_model']),
+        'comp_forest': TreeEnsemble.from_sklearn(comp_model),
+        'salary_features': list(model_data['salary_features']),
+        'comp_features': list(model_data.get('comp_features', model_data['salary_features'])),
+        'encoder_classes': {col: [str(c) for c in encoder.classes_] for col, encoder in model_data['encoders'].items()},
+        # Compensation type label of each comp_forest probability column
+        'comp_labels': [str(label) for label in comp_encoder.inverse_transform(comp_model.classes_)],
+        'metrics': model_data.get('metrics', {}),
+        'trained_date': model_data.get('trained_date')
+    }
+
+# Write a compiled model as a new artifact generation and point CURRENT at it
+def save_model(directory, model):
+    generation = datetime.now().strftime('%Y%m%d%H%M%S%f')
+    gen_dir = os.path.join(directory, generation)
+    os.makedirs(gen_dir, exist_ok=True)
+
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'forests': {},
+        'created': datetime.now().isoformat()
+    }
+    for key, value in model.items():
+        if key not in FORESTS:
+            manifest[key] = value
+    for name in FORESTS:
+        forest = model[name]
+        for array in NODE_ARRAYS:
+            np.save(os.path.join(gen_dir, f'{name}.{array}.npy'), getattr(forest, array))
+        manifest['forests'][name] = {
+            'max_depth': forest.max_depth,
+            'classes': None if forest.classes is None else forest.classes.tolist()
+        }
+    with open(os.path.join(gen_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, default=float)
+
+    pointer_tmp = os.path.join(directory, f'CURRENT.{os.getpid()}.tmp')
+    with open(pointer_tmp, 'w') as f:
+        f.write(generation)
+    os.replace(pointer_tmp, os.path.join(directory, 'CURRENT'))
+
+    for name in os.listdir(directory):
+        old_dir = os.path.join(directory, name)
+        if name != generation and os.path.isdir(old_dir):
+            shutil.rmtree(old_dir, ignore_errors=True)
+
+    return gen_dir
+
+# Path of the live generation's manifest, or None if no model was exported
+def manifest_path(directory):
+    try:
+        with open(os.path.join(directory, 'CURRENT')) as f:
+            generation = f.read().strip()
+    except OSError:
+        return None
+    path = os.path.join(directory, generation, 'manifest.json')
+    return path if os.path.exists(path) else None
+
+# Open the exported model (same shape as compile_model's result) with every node
+# array memory-mapped read-only: processes serving the same artifact share one
+# page-cached copy instead of each holding its own.
+# Returns None when there is none or it is older than the pickle at model_path.
+def load_exported(model_path):
+    directory = model_dir(model_path)
+    path = manifest_path(directory)
+    if path is None:
+        return None
+    if os.path.exists(model_path) and os.path.getmtime(model_path) > os.path.getmtime(path):
+        print(f"Exported forest is older than {os.path.basename(model_path)}, ignoring it")
+        return None
+
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != FORMAT_VERSION:
+        return None
+
+    gen_dir = os.path.dirname(path)
+    model = {key: value for key, value in manifest.items() if key not in ('format_version', 'forests', 'created')}
+    for name, shape in manifest['forests'].items():
+        arrays = {array: np.load(os.path.join(gen_dir, f'{name}.{array}.npy'), mmap_mode='r') for array in NODE_ARRAYS}
+        model[name] = TreeEnsemble(arrays, shape['max_depth'], shape['classes'])
+    return model
+
+# The model for model_path: the exported arrays, else the pickle flattened in
+# memory (private to this process), else None
+def load_model(model_path):
+    model = load_exported(model_path)
+    if model is not None:
+        print(f"Memory-mapped exported forest model from {model_dir(model_path)}")
+        return model
+    if not os.path.exists(model_path):
+        return None
+    with open(model_path, 'rb') as f:
+        model_data = pickle.load(f)
+    print(f"Loaded {os.path.basename(model_path)} (run forest_engine.py to export it for memory-mapping)")
+    return compile_model(model_data)
+
+# True when load_model would find a model
+def model_available(model_path):
+    return manifest_path(model_dir(model_path)) is not None or os.path.exists(model_path)
+
+# Export the forests of an existing model pickle (e.g. one trained before the
+# export step existed), so servers can memory-map them
+if __name__ == '__main__':
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    model_path = os.path.join(base_dir, 'python', 'salary_model.pkl')
+    with open(model_path, 'rb') as f:
+        compiled_model = compile_model(pickle.load(f))
+    print(f"Exported forest arrays to {save_model(model_dir(model_path), compiled_model)}")
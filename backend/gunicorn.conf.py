@@ -0,0 +1,49 @@
+"""
+Gunicorn Configuration
+Multi-worker serving: the app and its Dataset are loaded once in the master
+process and inherited by every forked worker, which read the same memory pages
+instead of each loading its own copy.
+
+    cd backend && gunicorn app:app
+"""
+
+import gc
+import os
+
+# Tells app.py not to start the artifact watcher in the master (threads do not
+# survive the fork); every worker starts its own in post_fork
+os.environ.setdefault('PRELOADED_SERVER', '1')
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = 120
+
+# Import app.py (and load the Dataset) in the master before forking
+preload_app = True
+
+# Runs in the master once the app is loaded, before any worker is forked
+def when_ready(server):
+    import app as dashboard
+    # Open the model now so workers inherit it too
+    if dashboard.dataset is not None:
+        dashboard.dataset.predictor
+    # Move everything loaded so far out of the collector's reach: its bookkeeping
+    # writes would otherwise copy the shared pages into every worker
+    gc.collect()
+    gc.freeze()
+    server.log.info(f"Dataset preloaded in master {os.getpid()}")
+
+def post_fork(server, worker):
+    import app as dashboard
+    # A worker that reloads changed artifacts builds a private Dataset; restart the
+    # server to share the new one again
+    dashboard.start_artifact_watcher()
+
+def post_worker_init(worker):
+    from memory import process_memory
+    stats = process_memory()
+    worker.log.info('Worker memory: ' + ', '.join(
+        f"{name}={value / 2 ** 20:.1f}MB" if name != 'pid' else f"pid={value}" for name, value in stats.items()
+    ))
@@ -0,0 +1,359 @@
+"""
+Load-time Indexes
+Read-only lookup structures built once per data load and shared by all requests.
+"""
+
+import pandas as pd
+import numpy as np
+from functools import reduce
+
+# Bitmap index over the dashboard filter dimensions.
+# Each (column, value) entry is stored roaring-style: values covering at least 1/32
+# of the rows keep a packed bitset (1 bit per row), rarer values keep a sorted row
+# list (smaller than the bitset below that density). A filter combination resolves
+# to sorted row positions by intersecting the entries.
+class BitmapIndex:
+    def __init__(self, df, columns):
+        self.n_rows = len(df)
+        self.row_dtype = np.int32 if self.n_rows < 2 ** 31 else np.int64
+        self.columns = {}
+        for col in columns:
+            if col in df.columns:
+                self.columns[col] = self._build_column(df[col])
+
+    def _build_column(self, series):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy().astype(np.intp)
+            values = series.cat.categories
+        else:
+            codes, values = pd.factorize(series)
+
+        # One stable sort groups the rows of every value in ascending row order
+        order = np.argsort(codes, kind='stable').astype(self.row_dtype)
+        counts = np.bincount(codes[codes >= 0], minlength=len(values))
+        pos = int((codes < 0).sum())
+
+        entries = {}
+        for value, count in zip(values, counts):
+            rows = order[pos:pos + count]
+            pos += count
+            if count * 32 < self.n_rows:
+                entries[value] = ('rows', rows)
+            else:
+                bits = np.zeros(self.n_rows, dtype=bool)
+                bits[rows] = True
+                entries[value] = ('bits', np.packbits(bits))
+        return entries
+
+    # Sorted row positions matching every {column: value} filter. Filters on columns
+    # the table does not have are ignored; None when no filter is left (every row).
+    def select(self, filters):
+        filters = {col: value for col, value in filters.items() if col in self.columns}
+        if not filters:
+            return None
+        row_sets = []
+        bitsets = []
+        for col, value in filters.items():
+            entry = self.columns[col].get(value)
+            if entry is None:
+                return np.empty(0, dtype=self.row_dtype)
+            kind, data = entry
+            (row_sets if kind == 'rows' else bitsets).append(data)
+
+        bits = reduce(np.bitwise_and, bitsets) if bitsets else None
+        if not row_sets:
+            return np.flatnonzero(np.unpackbits(bits, count=self.n_rows)).astype(self.row_dtype)
+
+        # Start from the rarest value and probe the rest
+        row_sets.sort(key=len)
+        rows = row_sets[0]
+        for other in row_sets[1:]:
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        if bits is not None:
+            rows = rows[((bits[rows >> 3] >> (7 - (rows & 7))) & 1).astype(bool)]
+        return rows
+
+# Inverted index between postings and skills, in CSR form over dense integer codes:
+#   postings -> skills: pair_offsets[p]:pair_offsets[p + 1] slices pair_skill for posting code p
+#   skills -> postings: skill_offsets[s]:skill_offsets[s + 1] slices skill_postings for skill code s
+# Posting codes number the distinct PostingIDs of job_postings; every (posting, skill)
+# pair is stored once with the number of skill rows behind it and the first of them.
+# Skill codes number the skills in order of first appearance in the skills table.
+class SkillIndex:
+    def __init__(self, job_postings, skills):
+        posting_ids = job_postings['PostingID'].to_numpy()
+        self.salaries = job_postings['SalaryMid'].to_numpy(dtype=float)
+        self.posting_values, self.posting_codes = np.unique(posting_ids, return_inverse=True)
+        n_postings = len(self.posting_values)
+
+        if 'Skills' in skills.columns:
+            skill_codes, self.skill_names = pd.factorize(skills['Skills'])
+            skill_posting_ids = skills['PostingID'].to_numpy()
+        else:
+            skill_codes, self.skill_names = np.empty(0, dtype=np.intp), pd.Index([])
+            skill_posting_ids = posting_ids[:0]
+        n_skills = len(self.skill_names)
+        width = max(n_skills, 1)
+
+        valid = skill_codes >= 0
+        skill_rows = np.flatnonzero(valid)
+        skill_codes = skill_codes[valid]
+        skill_posting_ids = skill_posting_ids[valid]
+
+        # Skill rows of every PostingID, including ones with no posting (used by the
+        # unfiltered fallback, which counts all skill rows)
+        self.total_frequency = np.bincount(skill_codes, minlength=n_skills)
+
+        # Locate each skill row's posting code; drop rows whose PostingID has no posting
+        pos = np.searchsorted(self.posting_values, skill_posting_ids)
+        known = pos < n_postings
+        known[known] = self.posting_values[pos[known]] == skill_posting_ids[known]
+
+        pair_keys, pair_first, pair_rows = np.unique(
+            pos[known].astype(np.int64) * width + skill_codes[known], return_index=True, return_counts=True
+        )
+        self.pair_posting = (pair_keys // width).astype(np.intp)
+        self.pair_skill = (pair_keys % width).astype(np.intp)
+        self.pair_rows = pair_rows
+        self.pair_first_row = skill_rows[known][pair_first]
+        self.pair_offsets = np.concatenate([[0], np.cumsum(np.bincount(self.pair_posting, minlength=n_postings))])
+
+        order = np.argsort(self.pair_skill, kind='stable')
+        self.skill_postings = self.pair_posting[order]
+        self.skill_offsets = np.concatenate([[0], np.cumsum(np.bincount(self.pair_skill, minlength=n_skills))])
+
+    # Skills of one posting code / PostingIDs carrying one skill code
+    def skills_of(self, posting_code):
+        return self.pair_skill[self.pair_offsets[posting_code]:self.pair_offsets[posting_code + 1]]
+
+    def postings_with(self, skill_code):
+        return self.posting_values[self.skill_postings[self.skill_offsets[skill_code]:self.skill_offsets[skill_code + 1]]]
+
+    # Per-skill (frequency, average SalaryMid) over the selected job_postings rows
+    # (None = all rows), in one bincount pass each.
+    # frequency counts skill rows whose PostingID is among the selected postings;
+    # average is the mean SalaryMid of selected rows whose PostingID has the skill.
+    # Mirrors the dashboard's fallback: with no rows selected, frequency covers every
+    # skill row and averages are NaN.
+    def skill_stats(self, posting_rows=None):
+        n_skills = len(self.skill_names)
+        codes = self.posting_codes if posting_rows is None else self.posting_codes[posting_rows]
+        if len(codes) == 0:
+            return self.total_frequency.astype(float), np.full(n_skills, np.nan)
+
+        salaries = self.salaries if posting_rows is None else self.salaries[posting_rows]
+        has_salary = ~np.isnan(salaries)
+        n_postings = len(self.posting_values)
+        posting_sum = np.bincount(codes[has_salary], weights=salaries[has_salary], minlength=n_postings)
+        posting_count = np.bincount(codes[has_salary], minlength=n_postings)
+
+        in_pairs = self._selected_pairs(codes)
+        pair_skill = self.pair_skill[in_pairs]
+        pair_posting = self.pair_posting[in_pairs]
+
+        frequency = np.bincount(pair_skill, weights=self.pair_rows[in_pairs], minlength=n_skills)
+        salary_sum = np.bincount(pair_skill, weights=posting_sum[pair_posting], minlength=n_skills)
+        salary_count = np.bincount(pair_skill, weights=posting_count[pair_posting], minlength=n_skills)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            average = np.where(salary_count > 0, salary_sum / salary_count, np.nan)
+        return frequency, average
+
+    # Pairs whose posting code is among codes
+    def _selected_pairs(self, codes):
+        selected = np.zeros(len(self.posting_values), dtype=bool)
+        selected[codes] = True
+        return selected[self.pair_posting]
+
+    # Skill table row where each skill first occurs among the skill rows skill_stats
+    # counts for the same selection (int64 max for skills it does not count)
+    def first_rows(self, posting_rows=None):
+        n_skills = len(self.skill_names)
+        codes = self.posting_codes if posting_rows is None else self.posting_codes[posting_rows]
+        if len(codes) == 0:
+            # Every skill row is counted, and skill codes follow first appearance
+            return np.arange(n_skills, dtype=np.int64)
+        in_pairs = self._selected_pairs(codes)
+        first = np.full(n_skills, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(first, self.pair_skill[in_pairs], self.pair_first_row[in_pairs])
+        return first
+
+    # Skill codes with non-zero frequency, most frequent first, ordered exactly as
+    # value_counts() of the selection's skill rows would: counts in order of first
+    # appearance, then the descending quicksort of Series.sort_values (reverse,
+    # argsort, reverse), which does not keep ties in their original order
+    def ranking(self, frequency, posting_rows=None):
+        codes = np.flatnonzero(frequency > 0)
+        codes = codes[np.argsort(self.first_rows(posting_rows)[codes], kind='stable')]
+        counts = frequency[codes].astype(np.int64)
+        return codes[::-1][counts[::-1].argsort(kind='quicksort')][::-1]
+
+# Market salaries per (JobTitle, Location), for benchmarking employer offers.
+# Non-missing SalaryMid values are stored sorted by (group, salary) with CSR group
+# offsets; each value is also keyed as group * n_distinct + dense salary rank, so one
+# batched searchsorted over those keys counts, for every offer, the salaries of its
+# group at or below the offer.
+# Groups with a missing JobTitle or Location are left out, as in a pandas groupby.
+class MarketIndex:
+    def __init__(self, job_postings):
+        titles = job_postings['JobTitle']
+        locations = job_postings['Location']
+        keyed = (titles.notna() & locations.notna()).to_numpy()
+        codes, groups = pd.MultiIndex.from_arrays([titles[keyed], locations[keyed]]).factorize()
+        # factorize() drops the level names
+        self.groups = groups.set_names(['JobTitle', 'Location'])
+        salaries = job_postings['SalaryMid'].to_numpy(dtype=float)[keyed]
+        n_groups = len(self.groups)
+
+        # Every posting of a group counts towards its percentile denominator,
+        # only non-missing salaries towards the statistics
+        self.group_rows = np.bincount(codes, minlength=n_groups)
+        valid = ~np.isnan(salaries)
+        codes, salaries = codes[valid], salaries[valid]
+        self.valid_counts = np.bincount(codes, minlength=n_groups)
+        self.offsets = np.concatenate([[0], np.cumsum(self.valid_counts)])
+
+        self.distinct_salaries = np.unique(salaries)
+        ranks = np.searchsorted(self.distinct_salaries, salaries)
+        order = np.lexsort((salaries, codes))
+        self.sorted_salaries = salaries[order]
+        self.keys = codes[order].astype(np.int64) * len(self.distinct_salaries) + ranks[order]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            average = np.bincount(codes, weights=salaries, minlength=n_groups) / self.valid_counts
+        self.market_data = pd.DataFrame({
+            'JobTitle': self.groups.get_level_values('JobTitle'),
+            'Location': self.groups.get_level_values('Location'),
+            'market_median': self.quantile(0.5),
+            'market_avg': average,
+            'market_p25': self.quantile(0.25),
+            'market_p75': self.quantile(0.75),
+            'count': self.valid_counts
+        })
+
+    # q-quantile of every group with linear interpolation (pandas' default), NaN for
+    # groups without salaries; read straight from the sorted group slices
+    def quantile(self, q):
+        n = self.valid_counts
+        result = np.full(len(n), np.nan)
+        if len(self.sorted_salaries) == 0:
+            return result
+        position = q * np.maximum(n - 1, 0)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        last = len(self.sorted_salaries) - 1
+        low_values = self.sorted_salaries[np.minimum(self.offsets[:-1] + lower, last)]
+        high_values = self.sorted_salaries[np.minimum(self.offsets[:-1] + upper, last)]
+        has_values = n > 0
+        result[has_values] = (low_values + (high_values - low_values) * (position - lower))[has_values]
+        return result
+
+    # Percent of each (role, location) group's postings with SalaryMid <= offer;
+    # NaN when the pair has no market salaries
+    def percentile(self, roles, locations, offers):
+        group = self.groups.get_indexer(pd.MultiIndex.from_arrays([roles, locations]))
+        offers = np.asarray(offers, dtype=float)
+        result = np.full(len(offers), np.nan)
+
+        found = group >= 0
+        found[found] = self.valid_counts[group[found]] > 0
+        g = group[found]
+        rank = np.searchsorted(self.distinct_salaries, offers[found], side='right')
+        at_or_below = np.searchsorted(self.keys, g.astype(np.int64) * len(self.distinct_salaries) + rank) - self.offsets[g]
+        # A missing offer compares below nothing
+        at_or_below = np.where(np.isnan(offers[found]), 0, at_or_below)
+        result[found] = at_or_below / self.group_rows[g] * 100
+        return result
+
+# Comparable-posting lookup levels, most specific first: each is a prefix of the
+# (JobTitle, Location, RoleLevel) key, with the name reported for a match
+COMPARABLE_LEVELS = (
+    ('title+location+level', ['JobTitle', 'Location', 'RoleLevel']),
+    ('title+location', ['JobTitle', 'Location']),
+    ('title', ['JobTitle'])
+)
+
+# Median and count of SalaryMid per composite key of every lookup level, in hash
+# tables keyed by value tuples: a lookup is at most one dict probe per level, falling
+# back from the full key to shorter prefixes and finally to the whole table.
+# Keys with a missing value or without any salary are left out.
+class ComparablesIndex:
+    def __init__(self, job_postings):
+        salaries = job_postings['SalaryMid']
+        self.levels = []
+        for name, columns in COMPARABLE_LEVELS:
+            if not all(col in job_postings.columns for col in columns):
+                continue
+            stats = salaries.groupby([job_postings[col] for col in columns], observed=True, sort=False).agg(['median', 'count'])
+            stats = stats[stats['count'] > 0]
+            keys = stats.index if len(columns) > 1 else [(key,) for key in stats.index]
+            table = dict(zip(keys, zip(stats['median'].astype(float), stats['count'].astype(int))))
+            self.levels.append((name, len(columns), table))
+        self.global_stats = (float(salaries.median()), int(salaries.count()))
+
+    # (median, count, level name) of the most specific level holding the key
+    def lookup(self, title, location=None, role_level=None):
+        key = tuple(None if value is None else str(value) for value in (title, location, role_level))
+        for name, width, table in self.levels:
+            stats = table.get(key[:width])
+            if stats is not None:
+                return stats + (name,)
+        return self.global_stats + ('global',)
+
+    # lookup() of every (title, location, role level) triple, as a dict of
+    # comparable_median, comparable_count and comparable_match columns
+    def lookup_many(self, titles, locations, role_levels):
+        found = [self.lookup(*key) for key in zip(titles, locations, role_levels)]
+        medians, counts, matches = zip(*found) if found else ((), (), ())
+        return {
+            'comparable_median': np.array(medians, dtype=float),
+            'comparable_count': np.array(counts, dtype=np.int64),
+            'comparable_match': list(matches)
+        }
+
+# Month code of rows without a PostedDate (sorts after every real month)
+NO_MONTH = np.iinfo(np.int64).max
+
+# PostedDate parsed once to datetime64, with a permutation that sorts the rows by
+# date: a date range is a contiguous slice of it, found by binary search.
+# Month buckets are precomputed as integer codes (months since 1970-01).
+class DateIndex:
+    def __init__(self, job_postings):
+        dates = pd.to_datetime(job_postings['PostedDate'], errors='coerce').to_numpy(dtype='datetime64[ns]')
+        self.n_rows = len(dates)
+        has_date = ~np.isnat(dates)
+
+        # NaT sorts last, so the dated rows are the first n_dated of the permutation
+        self.order = np.argsort(dates, kind='stable')
+        self.n_dated = int(has_date.sum())
+        self.sorted_dates = dates[self.order[:self.n_dated]]
+
+        self.month_codes = np.where(has_date, dates.astype('datetime64[M]').astype(np.int64), NO_MONTH)
+
+    # Rows of `rows` (sorted positions, None = all) with start <= PostedDate <= end;
+    # either bound may be None. Raises ValueError for unparseable bounds.
+    def restrict(self, rows, start=None, end=None):
+        lo = 0 if start is None else np.searchsorted(self.sorted_dates, self._bound(start), side='left')
+        hi = self.n_dated if end is None else np.searchsorted(self.sorted_dates, self._bound(end), side='right')
+
+        in_range = np.zeros(self.n_rows, dtype=bool)
+        in_range[self.order[lo:max(lo, hi)]] = True
+        return np.flatnonzero(in_range) if rows is None else rows[in_range[rows]]
+
+    @staticmethod
+    def _bound(value):
+        bound = pd.Timestamp(value)
+        if bound is pd.NaT:
+            raise ValueError(f'Invalid date: {value}')
+        # Timezone-aware bounds compare in UTC against the naive PostedDate values
+        if bound.tzinfo is not None:
+            bound = bound.tz_convert(None)
+        return bound.to_datetime64()
+
+    # 'YYYY-MM' labels for month codes ('NaT' for NO_MONTH)
+    @staticmethod
+    def month_labels(codes):
+        codes = np.asarray(codes, dtype=np.int64)
+        missing = codes == NO_MONTH
+        labels = np.datetime_as_string(np.where(missing, 0, codes).astype('datetime64[M]'), unit='M').astype(object)
+        labels[missing] = 'NaT'
+        return labels
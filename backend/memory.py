@@ -0,0 +1,43 @@
+"""
+Process Memory
+Resident memory of the current process, split into shared and private pages
+where the platform reports them, for comparing server workers.
+"""
+
+import os
+import sys
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Memory of this process in bytes:
+#   rss     - resident pages, shared ones included
+#   shared  - resident pages also mapped by other processes (fork-shared heap, page cache)
+#   private - resident pages only this process maps
+#   pss     - rss with every shared page divided among the processes sharing it
+# From /proc/self/smaps_rollup on Linux; elsewhere only the peak RSS is known.
+def process_memory():
+    stats = {'pid': os.getpid()}
+    try:
+        kilobytes = {}
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                parts = value.split()
+                if len(parts) == 2 and parts[1] == 'kB':
+                    kilobytes[name] = int(parts[0])
+        stats['rss'] = kilobytes.get('Rss', 0) * 1024
+        stats['shared'] = (kilobytes.get('Shared_Clean', 0) + kilobytes.get('Shared_Dirty', 0)) * 1024
+        stats['private'] = (kilobytes.get('Private_Clean', 0) + kilobytes.get('Private_Dirty', 0)) * 1024
+        stats['pss'] = kilobytes.get('Pss', 0) * 1024
+        return stats
+    except OSError:
+        pass
+
+    if resource is not None:
+        # ru_maxrss is in kilobytes, except on macOS (bytes)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        stats['peak_rss'] = peak if sys.platform == 'darwin' else peak * 1024
+    return stats
@@ -0,0 +1,190 @@
+"""
+Request Metrics
+Per-endpoint latency histograms, filter/aggregate/serialize phase timings and
+row/byte counters, exposed in the Prometheus text format.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from flask import g, has_request_context, request
+
+# ENABLE_METRICS=1 turns the instrumentation on. Otherwise no hooks are installed
+# and the phase decorators return the functions unchanged.
+ENABLED = os.environ.get('ENABLE_METRICS', '').lower() in ('1', 'true')
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Phases a request's time is split into; 'aggregate' is whatever the handler spent
+# outside the timed filter and serialize functions
+PHASES = ('filter', 'aggregate', 'serialize')
+
+class Histogram:
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.buckets[bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+# What one request recorded so far (kept on flask.g)
+class RequestMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        # Set while a timed function runs, so nested timed calls are not counted twice
+        self.active = False
+        self.rows_scanned = 0
+        self.rows_returned = 0
+
+# Totals per endpoint (the route pattern, so path parameters do not add series)
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latency = {}
+        self.phases = {}
+        self.requests = {}
+        self.rows_scanned = {}
+        self.rows_returned = {}
+        self.response_bytes = {}
+
+    def record(self, endpoint, method, status, duration, state):
+        with self.lock:
+            self.latency.setdefault(endpoint, Histogram()).observe(duration)
+            for phase, seconds in state.phases.items():
+                self.phases.setdefault((endpoint, phase), Histogram()).observe(seconds)
+            key = (endpoint, method, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.rows_scanned[endpoint] = self.rows_scanned.get(endpoint, 0) + state.rows_scanned
+            self.rows_returned[endpoint] = self.rows_returned.get(endpoint, 0) + state.rows_returned
+
+    def add_response_bytes(self, endpoint, size):
+        with self.lock:
+            self.response_bytes[endpoint] = self.response_bytes.get(endpoint, 0) + size
+
+    # Prometheus text exposition format (version 0.0.4)
+    def render(self):
+        with self.lock:
+            lines = []
+            _histograms(lines, 'dashboard_request_duration_seconds', 'Request latency by endpoint',
+                        {(('endpoint', endpoint),): h for endpoint, h in self.latency.items()})
+            _histograms(lines, 'dashboard_request_phase_seconds', 'Time per request spent filtering, aggregating and serializing',
+                        {(('endpoint', endpoint), ('phase', phase)): h for (endpoint, phase), h in self.phases.items()})
+            _counters(lines, 'dashboard_requests_total', 'Requests by endpoint, method and status',
+                      {(('endpoint', e), ('method', m), ('status', str(s))): n for (e, m, s), n in self.requests.items()})
+            _counters(lines, 'dashboard_rows_scanned_total', 'Table rows the filter pass touched (index candidates, or every row of a scanned table)',
+                      {(('endpoint', e),): n for e, n in self.rows_scanned.items()})
+            _counters(lines, 'dashboard_rows_returned_total', 'Table rows returned',
+                      {(('endpoint', e),): n for e, n in self.rows_returned.items()})
+            _counters(lines, 'dashboard_response_bytes_total', 'Response body bytes',
+                      {(('endpoint', e),): n for e, n in self.response_bytes.items()})
+        return '\n'.join(lines) + '\n'
+
+def _labels(pairs):
+    escaped = (f'{name}="{_escape(value)}"' for name, value in pairs)
+    return '{' + ','.join(escaped) + '}'
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _histograms(lines, name, help_text, series):
+    lines.append(f'# HELP {name} {help_text}')
+    lines.append(f'# TYPE {name} histogram')
+    for labels, histogram in sorted(series.items()):
+        cumulative = 0
+        for bound, count in zip(BUCKETS + ('+Inf',), histogram.buckets):
+            cumulative += count
+            lines.append(f'{name}_bucket{_labels(labels + (("le", bound),))} {cumulative}')
+        lines.append(f'{name}_sum{_labels(labels)} {histogram.sum}')
+        lines.append(f'{name}_count{_labels(labels)} {histogram.count}')
+
+def _counters(lines, name, help_text, series):
+    lines.append(f'# HELP {name} {help_text}')
+    lines.append(f'# TYPE {name} counter')
+    for labels, value in sorted(series.items()):
+        lines.append(f'{name}{_labels(labels)} {value}')
+
+registry = Registry()
+
+def _state():
+    return g.get('metrics') if has_request_context() else None
+
+# Decorator adding a function's run time to `phase` of the current request
+def timed(phase):
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            state = _state()
+            if state is None or state.active:
+                return func(*args, **kwargs)
+            state.active = True
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                state.phases[phase] += time.perf_counter() - started
+                state.active = False
+        return wrapper
+    return decorate
+
+def count_scanned(rows):
+    if ENABLED:
+        state = _state()
+        if state is not None:
+            state.rows_scanned += rows
+
+def count_returned(rows):
+    if ENABLED:
+        state = _state()
+        if state is not None:
+            state.rows_returned += rows
+
+def _endpoint():
+    return request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
+# Streamed bodies are counted as they are sent, after the request was recorded
+def _count_stream(chunks, endpoint):
+    size = 0
+    try:
+        for chunk in chunks:
+            size += len(chunk)
+            yield chunk
+    finally:
+        registry.add_response_bytes(endpoint, size)
+
+# Install the request hooks and time JSON encoding as serialization
+def init_app(app):
+    if not ENABLED:
+        return
+
+    app.json.response = timed('serialize')(app.json.response)
+
+    @app.before_request
+    def start_request_metrics():
+        g.metrics = RequestMetrics()
+
+    @app.after_request
+    def record_request_metrics(response):
+        state = g.get('metrics')
+        if state is None:
+            return response
+        duration = time.perf_counter() - state.started
+        timed_phases = state.phases['filter'] + state.phases['serialize']
+        state.phases['aggregate'] = max(duration - timed_phases, 0.0)
+
+        endpoint = _endpoint()
+        registry.record(endpoint, request.method, response.status_code, duration, state)
+        if response.is_streamed:
+            response.response = _count_stream(response.response, endpoint)
+        else:
+            registry.add_response_bytes(endpoint, response.calculate_content_length() or 0)
+        return response
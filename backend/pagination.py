@@ -0,0 +1,100 @@
+"""
+Pagination
+Offset/cursor paging, sorting and column projection for the bulk table endpoints.
+"""
+
+import base64
+import json
+
+# Parse the paging query parameters of a bulk endpoint:
+#   limit=N           - page size (absent = every remaining row)
+#   offset=N          - rows to skip (default 0)
+#   cursor=...        - opaque position returned in X-Next-Cursor (instead of offset)
+#   sort=col,-col     - sort columns, "-" for descending
+#   fields=col,col    - columns to return (default all)
+# Raises ValueError with a client-facing message on invalid input.
+def parse_page_args(args, columns, version):
+    columns = list(columns)
+
+    limit = args.get('limit')
+    if limit is not None:
+        limit = _non_negative_int('limit', limit)
+
+    sort = args.get('sort', '')
+    sort_columns, ascending = [], []
+    for name in filter(None, (part.strip() for part in sort.split(','))):
+        descending = name.startswith('-')
+        name = name.lstrip('-')
+        if name not in columns:
+            raise ValueError(f'Unknown sort column: {name}')
+        sort_columns.append(name)
+        ascending.append(not descending)
+
+    fields = args.get('fields')
+    if fields is not None:
+        fields = [name.strip() for name in fields.split(',') if name.strip()]
+        unknown = [name for name in fields if name not in columns]
+        if unknown:
+            raise ValueError(f'Unknown fields: {unknown}')
+
+    cursor = args.get('cursor')
+    if cursor:
+        if args.get('offset'):
+            raise ValueError('Use either offset or cursor, not both')
+        offset = decode_cursor(cursor, version, sort)
+    else:
+        offset = _non_negative_int('offset', args.get('offset', 0))
+
+    return {
+        'offset': offset,
+        'limit': limit,
+        'sort': sort,
+        'sort_columns': sort_columns,
+        'ascending': ascending,
+        'fields': fields
+    }
+
+def _non_negative_int(name, value):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} must be a non-negative integer')
+    if value < 0:
+        raise ValueError(f'{name} must be a non-negative integer')
+    return value
+
+# Cursors pin the dataset version and sort order they were issued for, so a page
+# is never continued against reloaded data or a different ordering
+def encode_cursor(version, offset, sort):
+    payload = json.dumps({'v': version, 'o': offset, 's': sort}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor, version, sort):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        offset = int(payload['o'])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError('Invalid cursor')
+    if payload.get('v') != version:
+        raise ValueError('Cursor expired: the data has been reloaded')
+    if payload.get('s') != sort or offset < 0:
+        raise ValueError('Cursor does not match the sort order')
+    return offset
+
+# (page of df, total row count, offset of the next page or None).
+# Sorting is stable, so rows with equal sort keys keep their table order and
+# pages do not overlap; only the page's rows and fields are left to serialize.
+def page(df, params):
+    total = len(df)
+    if params['sort_columns']:
+        df = df.sort_values(params['sort_columns'], ascending=params['ascending'], kind='stable')
+
+    start = min(params['offset'], total)
+    end = total if params['limit'] is None else min(start + params['limit'], total)
+    df = df.iloc[start:end]
+    if params['fields'] is not None:
+        df = df[params['fields']]
+
+    next_offset = end if end < total else None
+    return df, total, next_offset
@@ -0,0 +1,129 @@
+"""
+Salary Predictor
+Scores job descriptions with the trained salary and compensation type forests
+(flattened by forest_engine), encoding inputs exactly like train_and_predict.py
+did for training.
+"""
+
+import numpy as np
+
+# Request field -> categorical column the model was trained on (as <column>_Encoded)
+INPUT_FIELDS = {
+    'job_title': 'JobTitle',
+    'role_level': 'RoleLevel',
+    'location': 'Location',
+    'industry': 'Industry',
+    'remote_type': 'RemoteType'
+}
+
+# z of the two-sided 95% interval around the forest's mean prediction
+INTERVAL_Z = 1.96
+
+# Wraps a compiled model (forest_engine.compile_model / load_model). predict() takes
+# any number of rows and scores them in one vectorized sweep per forest.
+class SalaryPredictor:
+    def __init__(self, model):
+        self.salary_forest = model['salary_forest']
+        self.comp_forest = model['comp_forest']
+        self.salary_features = list(model['salary_features'])
+        self.comp_features = list(model['comp_features'])
+        self.comp_labels = np.asarray(model['comp_labels'], dtype=object)
+        self.metrics = model.get('metrics', {})
+        self.trained_date = model.get('trained_date')
+
+        # Column of every feature in the feature matrix, and the columns each forest reads
+        feature_names = dict.fromkeys(self.salary_features + self.comp_features)
+        self.feature_names = list(feature_names)
+        position = {name: column for column, name in enumerate(self.feature_names)}
+        self.salary_columns = np.array([position[name] for name in self.salary_features], dtype=np.intp)
+        self.comp_columns = np.array([position[name] for name in self.comp_features], dtype=np.intp)
+
+        # LabelEncoder classes as {value: code} maps, per input field with its feature
+        # column. Training encoded missing values as the string 'nan'; values never
+        # seen in training fall back to that code too (or -1, below every split
+        # threshold, when training had no missing values).
+        self.encoded_inputs = []
+        for field, column in INPUT_FIELDS.items():
+            feature = f'{column}_Encoded'
+            if feature not in position:
+                continue
+            codes = {value: code for code, value in enumerate(model['encoder_classes'].get(column, []))}
+            self.encoded_inputs.append((field, position[feature], codes, codes.get('nan', -1)))
+
+        # Has_<skill> features as (feature column, skill)
+        self.skill_columns = [(position[name], name[len('Has_'):]) for name in self.feature_names if name.startswith('Has_')]
+
+    # Feature matrix (float32, columns in self.feature_names order) of a list of
+    # input dicts, filled in place from the load-time maps, and the input fields of
+    # each row the encoders did not know
+    def features(self, rows):
+        X = np.zeros((len(rows), len(self.feature_names)), dtype=np.float32)
+        unknown_fields = []
+        for i, row in enumerate(rows):
+            unknown = []
+            for field, column, codes, fallback in self.encoded_inputs:
+                code = codes.get(_category_text(row.get(field)))
+                if code is None:
+                    unknown.append(field)
+                    code = fallback
+                X[i, column] = code
+
+            # Has_<skill>: 1 when the skill occurs in the row's comma-joined skill list
+            # (substring match, as when the training features were built)
+            skills = _skill_text(row.get('skills'))
+            if skills:
+                for column, skill in self.skill_columns:
+                    if skill in skills:
+                        X[i, column] = 1
+            unknown_fields.append(unknown)
+        return X, unknown_fields
+
+    # Predictions for a list of input dicts (job_title, role_level, location,
+    # industry, remote_type, skills as a list or comma-separated string).
+    # Returns a dict of columns with one value per input: predicted_salary (yearly),
+    # its 95% interval across the forest's trees, predicted_comp_type with its
+    # probability, the combined confidence and the input fields the model did not
+    # recognize (plain columns rather than a DataFrame, which would cost more than
+    # scoring a single row). Raises ValueError on malformed input.
+    def predict(self, rows):
+        for position, row in enumerate(rows):
+            if not isinstance(row, dict):
+                raise ValueError(f'Row {position} is not a JSON object')
+        X, unknown_fields = self.features(rows)
+
+        # Every tree's prediction at once: their mean is the forest's prediction and
+        # their spread the interval
+        tree_predictions = self.salary_forest.tree_outputs(X[:, self.salary_columns])
+        predicted = tree_predictions.mean(axis=0)
+        spread = tree_predictions.std(axis=0)
+
+        probabilities = self.comp_forest.predict_proba(X[:, self.comp_columns])
+        best = probabilities.argmax(axis=1)
+        comp_types = self.comp_labels[best]
+        comp_confidence = probabilities[np.arange(len(best)), best]
+
+        # Same confidence score as the predictions table
+        salary_confidence = np.clip(1 - spread / np.maximum(predicted, 1), 0.5, 0.95)
+
+        return {
+            'predicted_salary': np.round(predicted, 2),
+            'predicted_lower': np.round(np.maximum(0, predicted - INTERVAL_Z * spread), 2),
+            'predicted_upper': np.round(predicted + INTERVAL_Z * spread, 2),
+            'predicted_comp_type': comp_types,
+            'predicted_comp_type_confidence': np.round(comp_confidence, 3),
+            'confidence': np.round((salary_confidence + comp_confidence) / 2, 3),
+            'unknown_fields': unknown_fields
+        }
+
+# Encoder class of a request value (missing values were encoded as 'nan')
+def _category_text(value):
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return 'nan'
+    return str(value)
+
+def _skill_text(value):
+    if isinstance(value, (list, tuple)):
+        return ','.join(str(skill).strip() for skill in value)
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ''
+    return str(value)
@@ -0,0 +1,109 @@
+"""
+Request Profiling
+On-demand cProfile reports of single requests: with ENABLE_PROFILING=1, a request
+carrying profile=1 (or an X-Profile: 1 header) is answered with the profile of
+its handler instead of its usual body. Streamed bodies (format=ndjson,
+stream=true) are generated inside the profile too, as their encoding is most of
+their cost.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from flask import g, jsonify, request
+
+ENABLED = os.environ.get('ENABLE_PROFILING', '').lower() in ('1', 'true')
+
+# Directory where every raw profile (.prof, for snakeviz/pstats) and its text
+# report are also kept (unset: the report is only returned)
+PROFILE_DIR = os.environ.get('PROFILE_DIR')
+
+# Functions listed per section of the text report
+REPORT_LINES = int(os.environ.get('PROFILE_REPORT_LINES', 40))
+
+# Functions shown in the hotspot section (matched against their file path)
+HOTSPOT_PATTERN = r'pandas|numpy'
+
+# One profiled request at a time: the profiler slows its request down several
+# times, and overlapping profiles would be hard to read
+profile_lock = threading.Lock()
+
+# Whether the current request asks to be profiled
+def requested():
+    if not ENABLED:
+        return False
+    value = request.args.get('profile') or request.headers.get('X-Profile', '')
+    return value.lower() in ('1', 'true')
+
+# Text report: the calls with the most cumulative time, then the pandas/NumPy
+# functions with the most time of their own
+def report(profiler, title):
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    out.write(f'{title}\n\n== Top {REPORT_LINES} calls by cumulative time ==\n')
+    stats.sort_stats('cumulative').print_stats(REPORT_LINES)
+    out.write('\n== pandas / NumPy hotspots by own time ==\n')
+    stats.sort_stats('tottime').print_stats(HOTSPOT_PATTERN, REPORT_LINES)
+    return out.getvalue()
+
+def _profile_name(endpoint):
+    stamp = time.strftime('%Y%m%d-%H%M%S')
+    return f'{stamp}-{os.getpid()}-{endpoint or "unmatched"}'
+
+# Install the request hooks (nothing when profiling is disabled)
+def init_app(app):
+    if not ENABLED:
+        return
+
+    @app.before_request
+    def start_profile():
+        if not requested():
+            return None
+        if not profile_lock.acquire(blocking=False):
+            return jsonify({'error': 'Another request is being profiled, retry shortly'}), 429
+        g.profile_locked = True
+        g.profile_started = time.perf_counter()
+        g.profiler = cProfile.Profile()
+        g.profiler.enable()
+        return None
+
+    @app.after_request
+    def finish_profile(response):
+        profiler = g.pop('profiler', None)
+        if profiler is None:
+            return response
+
+        # A streamed body is only generated while it is sent; drain it here, still
+        # profiling, since the report replaces it anyway
+        streamed = ''
+        if response.is_streamed:
+            size = sum(len(chunk) for chunk in response.iter_encoded())
+            streamed = f', streamed body of {size:,} bytes included'
+        profiler.disable()
+
+        elapsed = time.perf_counter() - g.profile_started
+        title = f'{request.method} {request.full_path} -> {response.status_code} in {elapsed * 1000:.1f} ms{streamed}'
+        text = report(profiler, title)
+        profiled = app.response_class(text, mimetype='text/plain')
+
+        if PROFILE_DIR:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            name = _profile_name(request.endpoint)
+            profiler.dump_stats(os.path.join(PROFILE_DIR, f'{name}.prof'))
+            with open(os.path.join(PROFILE_DIR, f'{name}.txt'), 'w') as f:
+                f.write(text)
+            profiled.headers['X-Profile-File'] = f'{name}.prof'
+        response.close()
+        return profiled
+
+    @app.teardown_request
+    def release_profile(exc):
+        # Still set only when the response was never finished
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+        if g.pop('profile_locked', False):
+            profile_lock.release()
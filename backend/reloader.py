@@ -0,0 +1,64 @@
+"""
+Artifact Watcher
+Background thread that notices new transformed data or a retrained model on
+disk and triggers a rebuild of the Dataset.
+"""
+
+import os
+import threading
+
+import data_store
+import forest_engine
+
+# Files whose change means a new Dataset should be built: the table CSVs, the
+# snapshot pointers written by data_store.write_table, the model pickle and the
+# pointer of its exported forest arrays
+def artifact_paths(data_dir, model_path):
+    paths = [model_path, os.path.join(forest_engine.model_dir(model_path), 'CURRENT')]
+    for table, filename in data_store.TABLE_FILES.items():
+        paths.append(os.path.join(data_dir, filename))
+        paths.append(os.path.join(data_store.snapshot_dir(data_dir, table), 'CURRENT'))
+    return paths
+
+# (mtime, size) of every path, None for missing files
+def fingerprint(paths):
+    stamps = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+# Polls the artifacts every `interval` seconds and calls reload() once they changed
+# and then stayed unchanged for a full interval, so files still being written by
+# the scripts are not picked up half-way. A failed reload is not retried until the
+# artifacts change again.
+class ArtifactWatcher(threading.Thread):
+    def __init__(self, paths, reload, interval, loaded=None):
+        super().__init__(name='artifact-watcher', daemon=True)
+        self.paths = paths
+        self.reload = reload
+        self.interval = interval
+        self.loaded = fingerprint(paths) if loaded is None else loaded
+        self._stop_event = threading.Event()
+
+    def run(self):
+        pending = None
+        while not self._stop_event.wait(self.interval):
+            current = fingerprint(self.paths)
+            if current == self.loaded:
+                pending = None
+                continue
+            if current != pending:
+                pending = current
+                continue
+
+            print("Data artifacts changed, building a new dataset in the background")
+            self.reload()
+            self.loaded = current
+            pending = None
+
+    def stop(self):
+        self._stop_event.set()
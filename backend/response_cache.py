@@ -0,0 +1,61 @@
+"""
+Response Cache
+Bounded LRU cache of rendered API responses, keyed by data version, endpoint
+and normalized query parameters.
+"""
+
+from collections import OrderedDict
+import threading
+
+# Least-recently-used cache of (body, status, mimetype) entries.
+# Keys carry the dataset version, so an entry can never be served against newer
+# data; clear() on reload only releases the memory of the old version's entries.
+class ResponseCache:
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    # Conditional request answered with 304 before any lookup
+    def count_not_modified(self):
+        with self._lock:
+            self.not_modified += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    # Counters for sizing the cache (hit_rate is 0 before the first lookup)
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'not_modified': self.not_modified,
+                'hit_rate': self.hits / lookups if lookups > 0 else 0
+            }
@@ -0,0 +1,93 @@
+"""
+Scatter Sampling
+Bounded, reproducible reductions of the predicted-vs-actual scatter: a stratified
+sample that keeps the outliers, or a 2D histogram.
+"""
+
+import numpy as np
+
+# Share of a sample's budget reserved for the largest |actual - predicted| gaps
+OUTLIER_SHARE = 0.1
+
+# Largest accepted bins= value (bins x bins histogram cells)
+MAX_BINS = 200
+
+# Deterministic 64-bit hash (splitmix64 finalizer) of integer ids: a fixed
+# pseudo-random order, so the same rows are sampled on every call
+def _mix(ids):
+    x = ids.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+# Split budget across strata in proportion to their sizes (largest remainder),
+# giving every stratum at least one row when the budget allows it
+def _allocate(sizes, budget):
+    floor = np.minimum(sizes, 1) if budget >= len(sizes) else np.zeros_like(sizes)
+    spare = sizes - floor
+    rest = budget - int(floor.sum())
+    share = rest * spare / spare.sum() if spare.sum() > 0 else np.zeros(len(sizes))
+    quota = floor + np.floor(share).astype(sizes.dtype)
+    leftover = budget - int(quota.sum())
+    if leftover > 0:
+        order = np.argsort(-(share - np.floor(share)), kind='stable')
+        quota[order[:leftover]] += 1
+    return np.minimum(quota, sizes)
+
+# Sorted row positions of at most max_points rows of df:
+#   - the OUTLIER_SHARE of the budget with the largest |actual - predicted| gap
+#   - the rest stratified over the strata columns (Industry x RoleLevel), each
+#     stratum represented in proportion to its size
+# Within a stratum rows are taken in hashed id order, so a row sampled once stays
+# sampled on repeated calls (and under narrower filters, as far as the quotas allow)
+def stratified_sample(df, max_points, strata=('Industry', 'RoleLevel'),
+                      predicted='PredictedSalary', actual='ActualSalaryYearly', id_column='PostingID'):
+    n_rows = len(df)
+    if n_rows <= max_points:
+        return np.arange(n_rows)
+
+    ids = df[id_column].to_numpy() if id_column in df.columns else np.arange(n_rows)
+    keys = _mix(ids)
+
+    gap = np.abs(df[actual].to_numpy(dtype=float) - df[predicted].to_numpy(dtype=float))
+    n_outliers = int(max_points * OUTLIER_SHARE)
+    # Largest gaps first, ties in hashed order
+    outliers = np.lexsort((keys, -gap))[:n_outliers]
+
+    pool = np.ones(n_rows, dtype=bool)
+    pool[outliers] = False
+    pool_rows = np.flatnonzero(pool)
+
+    strata = [col for col in strata if col in df.columns]
+    if strata:
+        codes = df.iloc[pool_rows].groupby(list(strata), observed=True, sort=False, dropna=False).ngroup().to_numpy()
+    else:
+        codes = np.zeros(len(pool_rows), dtype=np.intp)
+
+    # Rank each row inside its stratum by hashed id, keep ranks below the quota
+    order = np.lexsort((keys[pool_rows], codes))
+    sorted_codes = codes[order]
+    sizes = np.bincount(codes)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank = np.arange(len(order)) - starts[sorted_codes]
+    quota = _allocate(sizes, max_points - len(outliers))
+    sampled = pool_rows[order[rank < quota[sorted_codes]]]
+
+    return np.sort(np.concatenate([outliers, sampled]))
+
+# bins x bins histogram of predicted vs actual salaries over their observed range
+def scatter_histogram(df, bins, predicted='PredictedSalary', actual='ActualSalaryYearly'):
+    x = df[predicted].to_numpy(dtype=float)
+    y = df[actual].to_numpy(dtype=float)
+    if len(x) == 0:
+        return {'bins': bins, 'predicted_edges': [], 'actual_edges': [], 'counts': [], 'total': 0}
+
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins)
+    return {
+        'bins': bins,
+        'predicted_edges': x_edges.tolist(),
+        'actual_edges': y_edges.tolist(),
+        # counts[i][j]: rows with predicted in bin i and actual in bin j
+        'counts': counts.astype(np.int64).tolist(),
+        'total': int(len(x))
+    }
@@ -0,0 +1,175 @@
+"""
+Quantile Sketches
+Mergeable relative-error quantile sketches (DDSketch-style log buckets) of SalaryMid
+per cell of dimension values, built at load and merged per request.
+"""
+
+import pandas as pd
+import numpy as np
+
+# Relative error bound of every sketched quantile (1%)
+RELATIVE_ERROR = 0.01
+
+# Bucket ids: value 0 -> 0, v > 0 -> key(v) + KEY_OFFSET, v < 0 -> -(key(-v) + KEY_OFFSET),
+# with key(v) = ceil(log_gamma(v)) clamped to (-KEY_OFFSET, KEY_OFFSET). Ids then sort in
+# the same order as the values they hold.
+KEY_OFFSET = 4096
+BUCKET_SPAN = 4 * KEY_OFFSET
+
+# Sketches of one value column over every combination of `dims` (one cell per
+# combination present in the data, missing dimension values included).
+# A cell keeps its exact row count, value count, sum, min and max plus the sparse
+# bucket counts of its sketch; all cells' buckets live in one (cell, bucket, count)
+# table, so merging the cells of a filter combination is one bincount.
+# Quantiles are within RELATIVE_ERROR of a value whose rank matches the exact one.
+class QuantileSketches:
+    def __init__(self, df, dims, value_column='SalaryMid', alpha=RELATIVE_ERROR):
+        self.dims = [dim for dim in dims if dim in df.columns]
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self.log_gamma = np.log(self.gamma)
+
+        # Cells: combined dimension codes (0 = missing value) of every row
+        self.dim_values = {}
+        codes = []
+        for dim in self.dims:
+            dim_codes, uniques = pd.factorize(df[dim])
+            self.dim_values[dim] = pd.Index(uniques)
+            codes.append(dim_codes + 1)
+        shape = [len(self.dim_values[dim]) + 1 for dim in self.dims]
+        flat = np.ravel_multi_index(codes, shape) if self.dims else np.zeros(len(df), dtype=np.intp)
+        cell_keys, cell_of_row = np.unique(flat, return_inverse=True)
+        cell_of_row = cell_of_row.reshape(-1)
+        unraveled = np.unravel_index(cell_keys, shape) if self.dims else ()
+        self.cell_codes = dict(zip(self.dims, unraveled))
+        self.n_cells = n_cells = len(cell_keys)
+
+        values = df[value_column].to_numpy(dtype=float)
+        has_value = ~np.isnan(values)
+        cells, values = cell_of_row[has_value], values[has_value]
+
+        self.cell_rows = np.bincount(cell_of_row, minlength=n_cells)
+        self.cell_count = np.bincount(cells, minlength=n_cells)
+        self.cell_sum = np.bincount(cells, weights=values, minlength=n_cells)
+        self.cell_min = np.full(n_cells, np.inf)
+        self.cell_max = np.full(n_cells, -np.inf)
+        np.minimum.at(self.cell_min, cells, values)
+        np.maximum.at(self.cell_max, cells, values)
+
+        # Salary range columns reported next to the SalaryMid statistics
+        self.cell_range_min = self._extreme(df, 'SalaryMin', cell_of_row, np.minimum, np.inf)
+        self.cell_range_max = self._extreme(df, 'SalaryMax', cell_of_row, np.maximum, -np.inf)
+
+        entry_keys, self.entry_count = np.unique(
+            cells.astype(np.int64) * BUCKET_SPAN + self._bucket_ids(values) + BUCKET_SPAN // 2,
+            return_counts=True
+        )
+        self.entry_cell = entry_keys // BUCKET_SPAN
+        self.entry_bucket = entry_keys % BUCKET_SPAN - BUCKET_SPAN // 2
+
+    def _extreme(self, df, column, cell_of_row, ufunc, initial):
+        result = np.full(self.n_cells, initial)
+        if column in df.columns:
+            values = df[column].to_numpy(dtype=float)
+            valid = ~np.isnan(values)
+            ufunc.at(result, cell_of_row[valid], values[valid])
+        return result
+
+    def _bucket_ids(self, values):
+        magnitude = np.abs(values)
+        with np.errstate(divide='ignore'):
+            keys = np.ceil(np.log(magnitude) / self.log_gamma)
+        keys = np.clip(np.nan_to_num(keys, neginf=-KEY_OFFSET), -KEY_OFFSET + 1, KEY_OFFSET - 1).astype(np.int64)
+        return np.where(values > 0, keys + KEY_OFFSET, np.where(values < 0, -(keys + KEY_OFFSET), 0))
+
+    # Value a bucket stands for: the point within relative error of all its values
+    def _bucket_values(self, bucket_ids):
+        keys = np.abs(bucket_ids) - KEY_OFFSET
+        magnitude = 2 * np.power(self.gamma, keys.astype(float)) / (self.gamma + 1)
+        return np.where(bucket_ids == 0, 0.0, np.sign(bucket_ids) * magnitude)
+
+    # Statistics of the cells matching {dim: value} filters, merged per value of
+    # group_by (one row for all matching cells when None; rows with a missing
+    # group_by value are left out, like a pandas groupby).
+    # Returns a DataFrame with the group_by column (if any) and rows, count, sum,
+    # mean, min, max, range_min, range_max and the given quantiles as q<percent>
+    # (e.g. q50), where count/sum/mean/min/max are exact and quantiles sketched.
+    def aggregate(self, filters, group_by=None, quantiles=(0.25, 0.5, 0.75)):
+        selected = np.ones(self.n_cells, dtype=bool)
+        for dim, value in filters.items():
+            code = self.dim_values[dim].get_indexer([value])[0]
+            selected &= self.cell_codes[dim] == code + 1 if code >= 0 else False
+
+        if group_by is not None:
+            selected &= self.cell_codes[group_by] > 0
+            cell_groups = self.cell_codes[group_by]
+        else:
+            cell_groups = np.zeros(self.n_cells, dtype=np.intp)
+
+        cells = np.flatnonzero(selected)
+        group_codes, group_of_cell = np.unique(cell_groups[cells], return_inverse=True)
+        group_of_cell = group_of_cell.reshape(-1)
+        if group_by is None and len(cells) == 0:
+            # A filter combination with no rows still gets its (empty) summary row
+            group_codes, group_of_cell = np.zeros(1, dtype=np.intp), group_of_cell
+        n_groups = len(group_codes)
+
+        rows = np.bincount(group_of_cell, weights=self.cell_rows[cells], minlength=n_groups)
+        count = np.bincount(group_of_cell, weights=self.cell_count[cells], minlength=n_groups)
+        total = np.bincount(group_of_cell, weights=self.cell_sum[cells], minlength=n_groups)
+        extremes = {}
+        for name, cell_values, ufunc, initial in (
+            ('min', self.cell_min, np.minimum, np.inf), ('max', self.cell_max, np.maximum, -np.inf),
+            ('range_min', self.cell_range_min, np.minimum, np.inf), ('range_max', self.cell_range_max, np.maximum, -np.inf)
+        ):
+            merged = np.full(n_groups, initial)
+            ufunc.at(merged, group_of_cell, cell_values[cells])
+            extremes[name] = np.where(np.isfinite(merged), merged, np.nan)
+
+        # Merge the sketches: sum bucket counts per (group, bucket), ordered by both
+        group_of = np.full(self.n_cells, -1, dtype=np.int64)
+        group_of[cells] = group_of_cell
+        in_selection = selected[self.entry_cell]
+        merged_keys, inverse = np.unique(
+            group_of[self.entry_cell[in_selection]] * BUCKET_SPAN + self.entry_bucket[in_selection] + BUCKET_SPAN // 2,
+            return_inverse=True
+        )
+        merged_counts = np.bincount(inverse.reshape(-1), weights=self.entry_count[in_selection], minlength=len(merged_keys))
+        bucket_values = self._bucket_values(merged_keys % BUCKET_SPAN - BUCKET_SPAN // 2)
+        cumulative = np.cumsum(merged_counts)
+        group_start = np.concatenate([[0], np.cumsum(count)[:-1]])
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result = {
+                'rows': rows.astype(np.int64),
+                'count': count.astype(np.int64),
+                'sum': total,
+                'mean': np.where(count > 0, total / count, np.nan)
+            }
+        result.update(extremes)
+        for q in quantiles:
+            result[f'q{round(q * 100):g}'] = self._quantile(q, count, group_start, cumulative, bucket_values,
+                                                           extremes['min'], extremes['max'])
+
+        frame = pd.DataFrame(result)
+        if group_by is not None:
+            frame.insert(0, group_by, self.dim_values[group_by][group_codes - 1])
+        return frame
+
+    # Linearly interpolated q-quantile (pandas' definition) of every group, reading
+    # the ranks floor/ceil(q * (n - 1)) off the merged bucket counts
+    @staticmethod
+    def _quantile(q, count, group_start, cumulative, bucket_values, low, high):
+        result = np.full(len(count), np.nan)
+        has_values = count > 0
+        if not has_values.any():
+            return result
+        position = q * (count[has_values] - 1)
+        start = group_start[has_values]
+        lower = np.searchsorted(cumulative, start + np.floor(position), side='right')
+        upper = np.searchsorted(cumulative, start + np.ceil(position), side='right')
+        lower_value = bucket_values[np.minimum(lower, len(bucket_values) - 1)]
+        upper_value = bucket_values[np.minimum(upper, len(bucket_values) - 1)]
+        value = lower_value + (upper_value - lower_value) * (position - np.floor(position))
+        # Never report a quantile outside the exact min/max
+        result[has_values] = np.clip(value, low[has_values], high[has_values])
+        return result
@@ -0,0 +1,34 @@
+"""
+Streaming Encoders
+Encode a DataFrame as NDJSON or as a chunked JSON array, a batch of rows at a
+time, straight from its column arrays.
+"""
+
+from encoding import dumps, column_values
+
+# Rows encoded per chunk: large enough to amortize the per-chunk overhead, small
+# enough that only one batch of Python objects is alive at a time
+BATCH_ROWS = 5000
+
+# Lists of row dicts, BATCH_ROWS at a time
+def record_batches(df, batch_rows=BATCH_ROWS):
+    names = [str(col) for col in df.columns]
+    for start in range(0, len(df), batch_rows):
+        batch = df.iloc[start:start + batch_rows]
+        columns = [column_values(batch[col]) for col in batch.columns]
+        yield [dict(zip(names, row)) for row in zip(*columns)]
+
+# One JSON object per line
+def ndjson_chunks(df, batch_rows=BATCH_ROWS):
+    for batch in record_batches(df, batch_rows):
+        yield b''.join(dumps(row) + b'\n' for row in batch)
+
+# The same JSON array the non-streaming response carries, in pieces
+def json_array_chunks(df, batch_rows=BATCH_ROWS):
+    yield b'['
+    separator = b''
+    for batch in record_batches(df, batch_rows):
+        # Encode the batch as one array and drop its brackets
+        yield separator + dumps(batch)[1:-1]
+        separator = b','
+    yield b']'
@@ -0,0 +1,142 @@
+"""
+Test Fixtures
+A small set of transformed tables written to a temporary data directory and a
+Flask test client serving them.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+JOB_POSTINGS = pd.DataFrame({
+    'PostingID': [1, 2, 3, 4, 5, 6, 7, 8],
+    'JobTitle': ['Data Analyst', 'Data Analyst', 'Data Analyst', 'Software Engineer',
+                 'Software Engineer', 'Senior Software Engineer', 'Nurse', None],
+    'RoleLevel': ['Mid', 'Mid', 'Entry', 'Mid', 'Mid', 'Senior', 'Mid', 'Mid'],
+    'Company': ['Acme', 'Acme', 'Globex', 'Initech', 'Initech', 'Globex', 'Mercy', 'Acme'],
+    'Location': ['Seattle, WA', 'Seattle, WA', 'Austin, TX', 'Seattle, WA',
+                 'Austin, TX', 'Seattle, WA', 'Austin, TX', 'Austin, TX'],
+    'Country': 'US',
+    'Region': ['WA', 'WA', 'TX', 'WA', 'TX', 'WA', 'TX', 'TX'],
+    'City': ['Seattle', 'Seattle', 'Austin', 'Seattle', 'Austin', 'Seattle', 'Austin', 'Austin'],
+    'EmploymentType': 'Full-time',
+    'CompensationType': ['Yearly', 'Yearly', 'Yearly', 'Yearly', 'Yearly', 'Yearly', 'Hourly', 'Yearly'],
+    'SalaryMin': [60000, 70000, 50000, 110000, 100000, 150000, 40, 80000],
+    'SalaryMax': [80000, 90000, 60000, 130000, 120000, 190000, 50, 90000],
+    'SalaryMid': [70000, 80000, 55000, 120000, 110000, 170000, 45, None],
+    'PostedDate': ['2024-01-05', '2024-01-20', '2024-02-03', '2024-02-10',
+                   '2024-03-01', '2024-03-15', '2024-03-20', None],
+    'Source': 'LinkedIn',
+    'RemoteType': ['Remote', 'On-site', 'Hybrid', 'Remote', 'Remote', 'On-site', 'On-site', 'Hybrid'],
+    'Industry': ['Technology', 'Technology', 'Finance', 'Technology', 'Finance',
+                 'Technology', 'Healthcare', 'Finance']
+})
+
+SKILLS = pd.DataFrame({
+    'PostingID': [1, 1, 2, 3, 4, 4, 5, 6, 6, 7],
+    'Skills': ['SQL', 'Excel', 'SQL', 'Excel', 'Python', 'SQL', 'Python', 'Python', 'Go', 'Nursing']
+})
+
+PREDICTIONS = pd.DataFrame({
+    'PostingID': [1, 2, 3, 4, 5, 6, 7],
+    'PredictedSalary': [72000, 78000, 57000, 118000, 112000, 165000, 93000],
+    'PredictedSalaryLower': [60000, 65000, 48000, 100000, 95000, 140000, 80000],
+    'PredictedSalaryUpper': [84000, 91000, 66000, 136000, 129000, 190000, 106000],
+    'ActualSalaryYearly': [70000, 80000, 55000, 120000, 110000, 170000, 93600],
+    'Industry': ['Technology', 'Technology', 'Finance', 'Technology', 'Finance', 'Technology', 'Healthcare'],
+    'RoleLevel': ['Mid', 'Mid', 'Entry', 'Mid', 'Mid', 'Senior', 'Mid'],
+    'PredictedCompType': ['Yearly', 'Yearly', 'Yearly', 'Yearly', 'Yearly', 'Yearly', 'Hourly'],
+    'PredictedCompTypeConfidence': [0.99, 0.98, 0.97, 0.99, 0.99, 0.99, 0.9],
+    'ConfidenceScore': [0.9, 0.88, 0.85, 0.92, 0.9, 0.93, 0.8],
+    'ModelVersion': 1.0
+})
+
+EMPLOYER_OFFERS = pd.DataFrame({
+    'Role': ['Data Analyst', 'Software Engineer', 'Nurse'],
+    'Location': ['Seattle, WA', 'Austin, TX', 'Austin, TX'],
+    'SalaryOffer': [75000, 105000, 47],
+    'CompensationType': ['Yearly', 'Yearly', 'Hourly'],
+    'PostedDate': ['2024-01-01', '2024-02-01', '2024-03-01'],
+    'Status': 'Active'
+})
+
+TABLES = {
+    'transformed_job_postings.csv': JOB_POSTINGS,
+    'transformed_skills.csv': SKILLS,
+    'transformed_predictions.csv': PREDICTIONS,
+    'transformed_employer_offers.csv': EMPLOYER_OFFERS
+}
+
+# Categorical inputs of the models and skills turned into Has_<skill> features
+MODEL_COLUMNS = ['JobTitle', 'RoleLevel', 'Location', 'Industry', 'RemoteType']
+MODEL_SKILLS = ['SQL', 'Python', 'Excel']
+
+# A model_data dict shaped like the pickle of train_and_predict.py: small forests
+# trained on the fixture postings, with the same feature encoding
+def train_model_data():
+    from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+    from sklearn.preprocessing import LabelEncoder
+
+    df = JOB_POSTINGS.copy()
+    encoders = {}
+    for col in MODEL_COLUMNS:
+        encoders[col] = LabelEncoder()
+        values = df[col].where(df[col].notna(), np.nan).astype(str)
+        df[f'{col}_Encoded'] = encoders[col].fit_transform(values)
+    all_skills = df['PostingID'].map(SKILLS.groupby('PostingID')['Skills'].agg(', '.join)).fillna('')
+    for skill in MODEL_SKILLS:
+        df[f'Has_{skill}'] = all_skills.str.contains(skill).astype(int)
+    features = [f'{col}_Encoded' for col in MODEL_COLUMNS] + [f'Has_{skill}' for skill in MODEL_SKILLS]
+
+    has_salary = df['SalaryMid'].notna()
+    salary_model = RandomForestRegressor(n_estimators=8, random_state=0)
+    salary_model.fit(df.loc[has_salary, features], df.loc[has_salary, 'SalaryMid'])
+    comp_encoder = LabelEncoder()
+    comp_model = RandomForestClassifier(n_estimators=8, random_state=0)
+    comp_model.fit(df[features], comp_encoder.fit_transform(df['CompensationType']))
+
+    return {
+        'salary_model': salary_model,
+        'comp_model': comp_model,
+        'salary_features': features,
+        'comp_features': features,
+        'encoders': encoders,
+        'comp_encoder': comp_encoder,
+        'metrics': {},
+        'trained_date': '2024-04-01T00:00:00'
+    }
+
+@pytest.fixture(scope='session')
+def data_dir(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('data')
+    for name, df in TABLES.items():
+        df.to_csv(directory / name, index=False)
+    return str(directory)
+
+# Where the trained model would be (there is none)
+@pytest.fixture(scope='session')
+def model_path(data_dir):
+    return os.path.join(data_dir, 'salary_model.pkl')
+
+# A Dataset built from the fixture tables
+@pytest.fixture(scope='session')
+def dataset(data_dir, model_path):
+    from dataset import Dataset
+    return Dataset.load(data_dir, model_path)
+
+# The app serving the fixture tables, without reloads or response caching
+@pytest.fixture(scope='session')
+def client(data_dir, model_path):
+    os.environ['DATA_RELOAD_INTERVAL'] = '0'
+    os.environ['RESPONSE_CACHE_SIZE'] = '0'
+    import app
+    app.DATA_DIR = data_dir
+    app.MODEL_PATH = model_path
+    assert app.load_data()
+    return app.app.test_client()
@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+# Run one HTTP request through the ASGI adapter; the body arrives in the given
+# chunks, the way a server passes on a chunked upload. Returns (status, headers, body).
+def asgi_request(method, path, chunks=(), headers=(), query_string=b''):
+    from asgi import AsyncServer
+    from app import app
+
+    scope = {
+        'type': 'http', 'method': method, 'path': path, 'query_string': query_string,
+        'headers': [(name.encode(), value.encode()) for name, value in headers]
+    }
+    messages = [{'type': 'http.request', 'body': chunk, 'more_body': True} for chunk in chunks]
+    messages.append({'type': 'http.request', 'body': b'', 'more_body': False})
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    server = AsyncServer(app, heavy_workers=1, light_workers=1)
+    try:
+        asyncio.run(server(scope, receive, send))
+    finally:
+        server.heavy.shutdown()
+        server.light.shutdown()
+    start = sent[0]
+    body = b''.join(message.get('body', b'') for message in sent[1:])
+    return start['status'], dict(start['headers']), body
+
+# A chunked upload carries no Content-Length header; the adapter sets it from the
+# buffered body, otherwise Flask would see an empty body and answer 400
+def test_post_without_content_length(client):
+    body = json.dumps({'job_title': 'Data Analyst', 'location': 'Seattle, WA', 'role_level': 'Mid'}).encode()
+    status, headers, response = asgi_request(
+        'POST', '/api/predict', chunks=[body[:10], body[10:]], headers=[('content-type', 'application/json')]
+    )
+    assert status == 200
+    assert json.loads(response)['comparable_match'] == 'title+location+level'
+
+def test_post_with_content_length(client):
+    body = json.dumps({'job_title': 'Nurse', 'location': 'Austin, TX'}).encode()
+    status, _, response = asgi_request(
+        'POST', '/api/predict', chunks=[body],
+        headers=[('content-type', 'application/json'), ('content-length', str(len(body)))]
+    )
+    assert status == 200
+    assert json.loads(response)['comparable_match'] == 'title+location'
+
+def test_get_with_query_string(client):
+    status, headers, response = asgi_request('GET', '/api/job-postings', query_string=b'industry=Finance&fields=PostingID')
+    assert status == 200
+    assert headers[b'x-total-count'] == b'3'
+    assert [row['PostingID'] for row in json.loads(response)] == [3, 5, 8]
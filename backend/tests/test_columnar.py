@@ -0,0 +1,26 @@
+import pytest
+
+TABLE_ENDPOINTS = [
+    '/api/job-postings', '/api/predictions', '/api/skills', '/api/employer-offers',
+    '/api/analytics/salary-by-role', '/api/analytics/salary-by-location',
+    '/api/analytics/salary-by-experience-level', '/api/analytics/salary-by-industry',
+    '/api/analytics/salary-distribution', '/api/analytics/salary-trends',
+    '/api/analytics/prediction-gaps', '/api/analytics/benchmarking', '/api/analytics/top-skills'
+]
+
+# Every table endpoint returns the same rows one array per column with format=columnar
+@pytest.mark.parametrize('path', TABLE_ENDPOINTS)
+def test_columnar_matches_records(client, path):
+    rows = client.get(path).get_json()
+    table = client.get(path, query_string={'format': 'columnar'}).get_json()
+    assert isinstance(rows, list)
+    assert table['rows'] == len(rows)
+    assert [dict(zip(table['columns'], values)) for values in zip(*table['data'].values())] == rows
+
+def test_salary_distribution_lists_every_range(client):
+    table = client.get('/api/analytics/salary-distribution', query_string={'format': 'columnar'}).get_json()
+    assert table['columns'] == ['range', 'count']
+    assert table['data']['range'][:3] == ['$0-50K', '$50-75K', '$75-100K']
+    assert table['rows'] == 10
+    # Postings 1-6; the hourly and the missing SalaryMid are outside the range
+    assert sum(table['data']['count']) == 6
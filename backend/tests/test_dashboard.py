@@ -0,0 +1,37 @@
+def test_home_dashboard_matches_the_individual_endpoints(client):
+    response = client.get('/api/dashboard/home?industry=Technology')
+    assert response.status_code == 200
+    page = response.get_json()
+    assert set(page) == {'kpis', 'top_skills', 'salary_by_industry', 'salary_distribution'}
+    assert page['kpis'] == client.get('/api/analytics/overview-kpis?industry=Technology').get_json()
+    assert page['top_skills'] == client.get('/api/analytics/top-skills?industry=Technology').get_json()
+
+def test_failing_widget_is_reported_under_errors(client, monkeypatch):
+    import app
+
+    def missing(ds):
+        raise app.ApiError('ActualSalaryYearly column missing from predictions')
+
+    def broken(ds):
+        raise ValueError('boom')
+
+    monkeypatch.setattr(app, 'prediction_accuracy', missing)
+    monkeypatch.setattr(app, 'prediction_gaps', broken)
+    response = client.get('/api/dashboard/predictions')
+    assert response.status_code == 200
+    page = response.get_json()
+    assert page['accuracy'] is None and page['gaps'] is None
+    assert page['errors'] == {
+        'accuracy': 'ActualSalaryYearly column missing from predictions',
+        'gaps': 'boom'
+    }
+    # The other widgets still render
+    assert page['kpis'] is not None
+    assert len(page['predictions']) == 7
+
+def test_predictions_dashboard_with_remote_type(client):
+    response = client.get('/api/dashboard/predictions?remote_type=Remote')
+    assert response.status_code == 200
+    page = response.get_json()
+    assert 'predictions' not in page.get('errors', {})
+    assert len(page['predictions']) == 7
@@ -0,0 +1,32 @@
+import numpy as np
+
+from conftest import JOB_POSTINGS
+
+def test_load_builds_every_index(dataset):
+    assert len(dataset.job_postings) == len(JOB_POSTINGS)
+    assert dataset.market_index is not None
+
+def test_market_index_groups_by_title_and_location(dataset):
+    market = dataset.market_index.market_data.set_index(['JobTitle', 'Location'])
+    # The posting without a JobTitle forms no group
+    assert len(market) == 6
+    analysts = market.loc[('Data Analyst', 'Seattle, WA')]
+    assert analysts['count'] == 2
+    assert analysts['market_median'] == 75000
+
+def test_market_percentile(dataset):
+    percentile = dataset.market_index.percentile(
+        ['Data Analyst', 'Data Analyst', 'Unknown Role'], ['Seattle, WA', 'Seattle, WA', 'Seattle, WA'], [75000, 90000, 1]
+    )
+    assert percentile[0] == 50
+    assert percentile[1] == 100
+    assert np.isnan(percentile[2])
+
+def test_benchmarking_uses_the_market_index(client):
+    response = client.get('/api/analytics/benchmarking')
+    assert response.status_code == 200
+    offers = {row['Role']: row for row in response.get_json()}
+    assert offers['Data Analyst']['market_median'] == 75000
+    assert offers['Data Analyst']['MarketPercentile'] == 50
+    assert offers['Software Engineer']['GapPct'] == -5000 / 110000 * 100
+    assert offers['Nurse']['MarketPercentile'] == 100
@@ -0,0 +1,25 @@
+# PostingIDs of a job-postings query
+def posting_ids(client, query):
+    response = client.get(f'/api/job-postings?fields=PostingID&{query}')
+    assert response.status_code == 200
+    return [row['PostingID'] for row in response.get_json()]
+
+def test_date_range_is_inclusive(client):
+    assert posting_ids(client, 'date_from=2024-02-01&date_to=2024-03-01') == [3, 4, 5]
+    assert posting_ids(client, 'date_from=2024-03-15') == [6, 7]
+    assert posting_ids(client, 'date_to=2024-01-31') == [1, 2]
+
+def test_date_range_combines_with_filters(client):
+    assert posting_ids(client, 'industry=Technology&date_from=2024-02-01') == [4, 6]
+
+def test_unparseable_date_is_rejected(client):
+    for query in ['date_from=someday', 'date_to=2024-13-45']:
+        response = client.get(f'/api/job-postings?{query}')
+        assert response.status_code == 400, query
+        assert 'error' in response.get_json()
+
+def test_salary_trends_by_month(client):
+    trends = client.get('/api/analytics/salary-trends').get_json()
+    assert [row['YearMonth'] for row in trends] == ['2024-01', '2024-02', '2024-03', 'NaT']
+    assert [row['count'] for row in trends] == [2, 2, 3, 0]
+    assert trends[1]['median'] == 87500
@@ -0,0 +1,20 @@
+def test_filters_select_job_postings(client):
+    response = client.get('/api/job-postings', query_string={'industry': 'Technology', 'remote_type': 'Remote'})
+    assert response.status_code == 200
+    assert sorted(row['PostingID'] for row in response.get_json()) == [1, 4]
+
+def test_unknown_filter_value_matches_nothing(client):
+    response = client.get('/api/job-postings', query_string={'industry': 'Mining'})
+    assert response.status_code == 200
+    assert response.get_json() == []
+
+# The predictions table has no RemoteType or CompensationType column: those filters
+# are ignored there, the others still apply
+def test_predictions_ignore_filters_on_missing_columns(client):
+    response = client.get('/api/predictions', query_string={'remote_type': 'Remote'})
+    assert response.status_code == 200
+    assert len(response.get_json()) == 7
+
+    response = client.get('/api/predictions', query_string={'industry': 'Technology', 'compensation_type': 'Yearly'})
+    assert response.status_code == 200
+    assert sorted(row['PostingID'] for row in response.get_json()) == [1, 2, 4, 6]
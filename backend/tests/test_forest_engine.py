@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+
+from conftest import JOB_POSTINGS, MODEL_COLUMNS, train_model_data
+from forest_engine import TreeEnsemble, compile_model
+from predictor import SalaryPredictor
+
+def random_features(seed, n_rows=300, n_features=6):
+    rng = np.random.default_rng(seed)
+    # Small integer codes like the encoded categoricals, plus a continuous column
+    X = rng.integers(0, 12, (n_rows, n_features)).astype(float)
+    X[:, -1] = rng.normal(0, 1, n_rows)
+    return X
+
+def test_flattened_regressor_predicts_like_sklearn():
+    X = random_features(1)
+    y = X[:, 0] * 1000 + X[:, 1] ** 2 * 50 + np.random.default_rng(2).normal(0, 100, len(X))
+    for max_depth in (None, 3):
+        model = RandomForestRegressor(n_estimators=12, max_depth=max_depth, random_state=0).fit(X, y)
+        forest = TreeEnsemble.from_sklearn(model)
+        X_test = random_features(3, n_rows=200)
+        np.testing.assert_allclose(forest.predict(X_test), model.predict(X_test), rtol=1e-12)
+
+def test_flattened_classifier_predicts_like_sklearn():
+    X = random_features(4)
+    y = np.array(['Hourly', 'Yearly', 'Daily'])[(X[:, 0] + X[:, 2]).astype(int) % 3]
+    model = RandomForestClassifier(n_estimators=12, random_state=0).fit(X, y)
+    forest = TreeEnsemble.from_sklearn(model)
+    X_test = random_features(5, n_rows=200)
+    assert list(forest.classes) == list(model.classes_)
+    np.testing.assert_allclose(forest.predict_proba(X_test), model.predict_proba(X_test), rtol=1e-12)
+
+# The model pickle's encoders, for checking the predictor's encoding against them
+@pytest.fixture(scope='module')
+def model_data():
+    return train_model_data()
+
+@pytest.fixture(scope='module')
+def predictor(model_data):
+    return SalaryPredictor(compile_model(model_data))
+
+# Columns of the predictor's feature matrix as a frame with the training feature names
+def feature_frame(predictor, rows):
+    X, unknown_fields = predictor.features(rows)
+    return pd.DataFrame(X, columns=predictor.feature_names), unknown_fields
+
+def test_known_values_encode_like_the_training_encoders(predictor, model_data):
+    posting = JOB_POSTINGS.iloc[0]
+    row = {field: posting[column] for field, column in
+           zip(['job_title', 'role_level', 'location', 'industry', 'remote_type'], MODEL_COLUMNS)}
+    row['skills'] = ['SQL', 'Excel']
+    X, unknown_fields = feature_frame(predictor, [row])
+    assert unknown_fields == [[]]
+    for field, column in zip(row, MODEL_COLUMNS):
+        assert X.loc[0, f'{column}_Encoded'] == model_data['encoders'][column].transform([row[field]])[0]
+    assert (X.loc[0, 'Has_SQL'], X.loc[0, 'Has_Excel'], X.loc[0, 'Has_Python']) == (1, 1, 0)
+
+    # Scores match the pickled scikit-learn forest on the same features
+    result = predictor.predict([row])
+    expected = model_data['salary_model'].predict(X[model_data['salary_features']])
+    assert result['predicted_salary'][0] == round(expected[0], 2)
+
+def test_missing_and_unseen_values_fall_back_to_the_nan_code(predictor, model_data):
+    titles = model_data['encoders']['JobTitle']
+    nan_code = titles.transform(['nan'])[0]
+    rows = [
+        {'job_title': None, 'role_level': 'Mid'},
+        {'job_title': 'nan', 'role_level': 'Mid'},
+        {'job_title': 'Astronaut', 'role_level': 'Mid'},
+        # RoleLevel was never missing in training, so an unseen level has no 'nan' code
+        {'job_title': 'Nurse', 'role_level': 'Intern'}
+    ]
+    X, unknown_fields = feature_frame(predictor, rows)
+    assert list(X['JobTitle_Encoded'][:3]) == [nan_code] * 3
+    assert X.loc[3, 'RoleLevel_Encoded'] == -1
+    assert unknown_fields[0] == unknown_fields[1] == ['location', 'industry', 'remote_type']
+    assert unknown_fields[2] == ['job_title', 'location', 'industry', 'remote_type']
+    assert unknown_fields[3] == ['role_level', 'location', 'industry', 'remote_type']
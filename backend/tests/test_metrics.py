@@ -0,0 +1,40 @@
+from flask import g
+
+import metrics
+
+# Run a view inside a request with metrics on; returns the request's counters
+def measured(monkeypatch, path, view):
+    import app
+    monkeypatch.setattr(metrics, 'ENABLED', True)
+    with app.app.test_request_context(path):
+        g.metrics = metrics.RequestMetrics()
+        response = view()
+        assert response.status_code == 200
+        return g.metrics, response.get_json()
+
+def test_top_skills_rows_are_counted_as_returned(client, monkeypatch):
+    import app
+    state, skills = measured(monkeypatch, '/api/analytics/top-skills?limit=3', app.get_top_skills)
+    assert len(skills) == 3
+    assert state.rows_returned == 3
+
+    state, page = measured(monkeypatch, '/api/dashboard/salary-overview?industry=Technology',
+                           app.get_salary_overview_dashboard)
+    assert state.rows_returned == sum(len(page[name]) for name in
+                                      ('salary_by_industry', 'salary_by_experience_level', 'top_skills'))
+
+# Only the index's candidate rows count as scanned; an unfiltered request scans none
+def test_filter_pass_counts_candidate_rows(client, monkeypatch):
+    import app
+    state, _ = measured(monkeypatch, '/api/analytics/top-skills?industry=Finance', app.get_top_skills)
+    assert state.rows_scanned == 3
+    state, _ = measured(monkeypatch, '/api/analytics/top-skills', app.get_top_skills)
+    assert state.rows_scanned == 0
+
+def test_top_skills_columnar(client):
+    response = client.get('/api/analytics/top-skills?limit=2&format=columnar')
+    assert response.get_json() == {
+        'columns': ['skill', 'frequency', 'average_salary'],
+        'data': {'skill': ['SQL', 'Python'], 'frequency': [3, 3], 'average_salary': [90000, 400000 / 3]},
+        'rows': 2
+    }
@@ -0,0 +1,58 @@
+import os
+import pickle
+
+import numpy as np
+
+from conftest import train_model_data
+from dataset import Dataset
+from forest_engine import compile_model, load_exported, load_model, model_dir, save_model
+
+# A trained model pickle in its own directory
+def write_model(directory):
+    model_data = train_model_data()
+    model_path = os.path.join(directory, 'salary_model.pkl')
+    with open(model_path, 'wb') as f:
+        pickle.dump(model_data, f)
+    return model_path, model_data
+
+def test_dataset_without_model(dataset, client):
+    assert dataset.model_available is False
+    assert dataset.predictor is None
+    health = client.get('/api/health').get_json()
+    assert health['model_loaded'] is False
+    assert health['model_in_memory'] is False
+
+def test_model_is_opened_by_the_first_prediction(data_dir, tmp_path):
+    model_path, _ = write_model(tmp_path)
+    ds = Dataset.load(data_dir, model_path)
+    assert ds.model_available
+    assert not ds.model_loaded
+
+    predictor = ds.predictor
+    assert ds.model_loaded
+    assert predictor is not None
+    assert ds.predictor is predictor
+
+def test_exported_forest_is_memory_mapped(tmp_path):
+    model_path, model_data = write_model(tmp_path)
+    compiled = compile_model(model_data)
+    save_model(model_dir(model_path), compiled)
+
+    model = load_model(model_path)
+    forest = model['salary_forest']
+    assert all(isinstance(getattr(forest, name), np.memmap) for name in ('feature', 'threshold', 'value'))
+    assert model['salary_features'] == compiled['salary_features']
+
+    X = np.random.default_rng(0).integers(0, 4, (20, len(compiled['salary_features'])))
+    assert np.array_equal(forest.predict(X), compiled['salary_forest'].predict(X))
+    assert np.array_equal(model['comp_forest'].predict_proba(X), compiled['comp_forest'].predict_proba(X))
+
+def test_export_older_than_the_pickle_is_ignored(tmp_path):
+    model_path, model_data = write_model(tmp_path)
+    save_model(model_dir(model_path), compile_model(model_data))
+    later = os.path.getmtime(model_path) + 60
+    os.utime(model_path, (later, later))
+
+    assert load_exported(model_path) is None
+    # The pickle is flattened in memory instead
+    assert not isinstance(load_model(model_path)['salary_forest'].threshold, np.memmap)
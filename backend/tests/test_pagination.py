@@ -0,0 +1,52 @@
+from pagination import encode_cursor
+
+# Follow X-Next-Cursor from the first page to the last
+def walk_pages(client, url):
+    pages = []
+    response = client.get(url)
+    while True:
+        assert response.status_code == 200
+        pages.append(response.get_json())
+        cursor = response.headers.get('X-Next-Cursor')
+        if cursor is None:
+            return response, pages
+        response = client.get(f'{url}&cursor={cursor}')
+
+def test_cursor_pages_cover_sorted_rows_once(client):
+    response, pages = walk_pages(client, '/api/job-postings?limit=3&sort=-SalaryMid&fields=PostingID')
+    assert response.headers['X-Total-Count'] == '8'
+    assert [len(rows) for rows in pages] == [3, 3, 2]
+    assert [row['PostingID'] for rows in pages for row in rows] == [6, 4, 5, 2, 1, 3, 7, 8]
+    assert all(list(row) == ['PostingID'] for rows in pages for row in rows)
+
+def test_offset_and_limit(client):
+    response = client.get('/api/employer-offers?offset=1&limit=1')
+    assert response.status_code == 200
+    assert [row['Role'] for row in response.get_json()] == ['Software Engineer']
+    assert response.headers['X-Total-Count'] == '3'
+    assert 'X-Next-Cursor' in response.headers
+
+def test_no_paging_parameters_return_every_row(client):
+    response = client.get('/api/skills')
+    assert len(response.get_json()) == 10
+    assert 'X-Next-Cursor' not in response.headers
+
+def test_cursor_for_another_sort_is_rejected(client):
+    cursor = client.get('/api/job-postings?limit=2&sort=SalaryMid').headers['X-Next-Cursor']
+    response = client.get(f'/api/job-postings?limit=2&sort=-SalaryMid&cursor={cursor}')
+    assert response.status_code == 400
+    assert 'sort' in response.get_json()['error']
+
+def test_cursor_from_before_a_reload_is_rejected(client):
+    import app
+    cursor = encode_cursor(app.dataset.version - 1, 2, '')
+    response = client.get(f'/api/job-postings?limit=2&cursor={cursor}')
+    assert response.status_code == 400
+    assert 'reloaded' in response.get_json()['error']
+
+def test_invalid_paging_parameters_are_rejected(client):
+    for query in ['cursor=not-a-cursor', 'limit=2&offset=2&cursor=abc', 'limit=-1', 'offset=x',
+                  'sort=Salary', 'fields=PostingID,Nope']:
+        response = client.get(f'/api/job-postings?{query}')
+        assert response.status_code == 400, query
+        assert 'error' in response.get_json()
@@ -0,0 +1,29 @@
+# Without a trained model, predictions are the comparable postings' median +/-15%
+def test_predict_falls_back_to_comparables(client):
+    body = {'job_title': 'Data Analyst', 'location': 'Seattle, WA', 'role_level': 'Mid'}
+    response = client.post('/api/predict', json=body)
+    assert response.status_code == 200
+    prediction = response.get_json()
+    assert prediction['comparable_match'] == 'title+location+level'
+    assert prediction['comparable_count'] == 2
+    assert prediction['predicted_salary'] == 75000
+    assert prediction['predicted_lower'] == 75000 * 0.85
+
+def test_predict_batch_keeps_input_order(client):
+    rows = [{'job_title': 'Nurse', 'location': 'Austin, TX'}, {'job_title': 'Astronaut'}]
+    response = client.post('/api/predict/batch', json={'rows': rows})
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert payload['count'] == 2
+    assert [p['comparable_match'] for p in payload['predictions']] == ['title+location', 'global']
+
+def test_predict_rejects_malformed_rows(client):
+    assert client.post('/api/predict', json=['not', 'an', 'object']).status_code == 400
+    assert client.post('/api/predict/batch', json=[{'job_title': 'Nurse'}, 'x']).status_code == 400
+
+def test_comparables_fall_back_level_by_level(dataset):
+    comparables = dataset.comparables_index
+    assert comparables.lookup('Data Analyst', 'Seattle, WA', 'Mid') == (75000, 2, 'title+location+level')
+    assert comparables.lookup('Data Analyst', 'Austin, TX', 'Senior') == (55000, 1, 'title+location')
+    assert comparables.lookup('Software Engineer', 'Denver, CO') == (115000, 2, 'title')
+    assert comparables.lookup('Astronaut') == (80000, 7, 'global')
@@ -0,0 +1,33 @@
+from flask import Flask
+
+import profiling
+
+def encode_rows():
+    for i in range(3):
+        yield f'{{"row": {i}}}\n'
+
+def profiled_app(monkeypatch):
+    monkeypatch.setattr(profiling, 'ENABLED', True)
+    monkeypatch.setattr(profiling, 'PROFILE_DIR', None)
+    app = Flask(__name__)
+
+    @app.route('/rows')
+    def rows():
+        return app.response_class(encode_rows(), mimetype='application/x-ndjson')
+
+    profiling.init_app(app)
+    return app.test_client()
+
+# The generator of a streamed body runs inside the profile
+def test_streamed_body_is_profiled(monkeypatch):
+    client = profiled_app(monkeypatch)
+    response = client.get('/rows', query_string={'profile': '1'})
+    assert response.status_code == 200
+    text = response.get_data(as_text=True)
+    assert 'streamed body of 33 bytes included' in text
+    assert 'encode_rows' in text
+    assert not profiling.profile_lock.locked()
+
+def test_unprofiled_request_streams(monkeypatch):
+    client = profiled_app(monkeypatch)
+    assert client.get('/rows').get_data(as_text=True).count('\n') == 3
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from sampling import stratified_sample, scatter_histogram, MAX_BINS
+
+# 1000 predictions over 2 industries x 3 levels of very different sizes, with
+# ten rows whose gap dwarfs every other one
+def predictions_frame():
+    rng = np.random.default_rng(3)
+    n_rows = 1000
+    industry = np.where(np.arange(n_rows) < 900, 'Technology', 'Finance')
+    level = rng.choice(['Entry', 'Mid', 'Senior'], n_rows, p=[0.1, 0.6, 0.3])
+    actual = rng.uniform(40000, 200000, n_rows)
+    predicted = actual + rng.normal(0, 5000, n_rows)
+    predicted[::100] += 300000
+    return pd.DataFrame({
+        'PostingID': rng.permutation(n_rows) + 1,
+        'Industry': industry,
+        'RoleLevel': level,
+        'PredictedSalary': predicted,
+        'ActualSalaryYearly': actual
+    })
+
+def test_sample_keeps_outliers_and_every_stratum():
+    df = predictions_frame()
+    rows = stratified_sample(df, 100)
+    assert len(rows) == 100
+    assert np.all(np.diff(rows) > 0)
+
+    # The ten largest gaps fill the outlier share
+    assert set(np.arange(0, 1000, 100)) <= set(rows)
+
+    sample = df.iloc[rows]
+    strata = df.groupby(['Industry', 'RoleLevel']).size()
+    sampled = sample.groupby(['Industry', 'RoleLevel']).size()
+    assert set(sampled.index) == set(strata.index)
+    # Proportional: the large Technology/Mid stratum gets the most points
+    assert sampled.idxmax() == ('Technology', 'Mid')
+
+def test_sample_is_reproducible_and_bounded():
+    df = predictions_frame()
+    assert np.array_equal(stratified_sample(df, 50), stratified_sample(df, 50))
+    # Row order does not matter: the same PostingIDs are picked after a shuffle
+    shuffled = df.sample(frac=1, random_state=1)
+    assert set(df.iloc[stratified_sample(df, 50)]['PostingID']) == \
+        set(shuffled.iloc[stratified_sample(shuffled, 50)]['PostingID'])
+    assert np.array_equal(stratified_sample(df, 5000), np.arange(1000))
+
+def test_histogram_counts_every_row():
+    df = predictions_frame()
+    histogram = scatter_histogram(df, 8)
+    counts = np.array(histogram['counts'])
+    assert counts.shape == (8, 8)
+    assert counts.sum() == histogram['total'] == 1000
+    assert len(histogram['predicted_edges']) == len(histogram['actual_edges']) == 9
+
+def test_predictions_max_points(client):
+    response = client.get('/api/predictions?max_points=3')
+    assert response.status_code == 200
+    assert response.headers['X-Sampled-From'] == '7'
+    rows = response.get_json()
+    assert len(rows) == 3
+    assert rows == client.get('/api/predictions?max_points=3').get_json()
+
+def test_predictions_bins(client):
+    response = client.get('/api/predictions?bins=4&industry=Technology')
+    assert response.status_code == 200
+    histogram = response.get_json()
+    assert histogram['total'] == 4
+    assert sum(map(sum, histogram['counts'])) == 4
+
+def test_invalid_sampling_parameters_are_rejected(client):
+    for query in ['max_points=0', 'max_points=many', 'bins=0', f'bins={MAX_BINS + 1}']:
+        response = client.get(f'/api/predictions?{query}')
+        assert response.status_code == 400, query
@@ -0,0 +1,53 @@
+import gc
+import os
+import runpy
+
+import pytest
+
+from conftest import BACKEND_DIR
+from memory import process_memory
+
+class FakeLog:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, message):
+        self.messages.append(message)
+
+class FakeServer:
+    def __init__(self):
+        self.log = FakeLog()
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/smaps_rollup'), reason='needs /proc/self/smaps_rollup')
+def test_process_memory_splits_shared_and_private_pages():
+    stats = process_memory()
+    assert stats['pid'] == os.getpid()
+    assert stats['rss'] > 0
+    assert 0 < stats['pss'] <= stats['rss']
+    assert stats['shared'] + stats['private'] == stats['rss']
+
+def test_health_reports_process_memory(client):
+    process = client.get('/api/health').get_json()['process']
+    assert process['pid'] == os.getpid()
+
+# The master hooks of gunicorn.conf.py preload the dataset's model and freeze it,
+# and forked workers start no watcher while reloads are disabled
+def test_gunicorn_config_preloads_the_app(client, monkeypatch):
+    import app
+    monkeypatch.setenv('PRELOADED_SERVER', '1')
+    config = runpy.run_path(os.path.join(BACKEND_DIR, 'gunicorn.conf.py'))
+    assert config['preload_app'] is True
+    assert config['workers'] >= 1
+
+    server = FakeServer()
+    try:
+        config['when_ready'](server)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+    assert app.dataset.model_loaded
+    assert 'preloaded' in server.log.messages[0]
+
+    config['post_fork'](server, None)
+    assert app.artifact_watcher is None
+
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sketches import QuantileSketches, RELATIVE_ERROR
+
+def salaries_frame():
+    rng = np.random.default_rng(11)
+    n_rows = 5000
+    salary = rng.lognormal(11.3, 0.5, n_rows)
+    salary[rng.random(n_rows) < 0.05] = np.nan
+    return pd.DataFrame({
+        'Industry': rng.choice(['Technology', 'Finance', 'Healthcare', None], n_rows),
+        'RemoteType': rng.choice(['Remote', 'On-site', 'Hybrid'], n_rows),
+        'SalaryMid': salary
+    })
+
+# Merged sketches against groupby on the matching rows: quantiles within the
+# relative error bound, everything else exact
+def test_aggregate_matches_exact_statistics():
+    df = salaries_frame()
+    sketches = QuantileSketches(df, ['Industry', 'RemoteType'])
+
+    for filters in [{}, {'RemoteType': 'Remote'}, {'Industry': 'Finance', 'RemoteType': 'Hybrid'}]:
+        rows = df
+        for col, value in filters.items():
+            rows = rows[rows[col] == value]
+        stats = sketches.aggregate(filters, 'Industry').set_index('Industry')
+        exact = rows.groupby('Industry')['SalaryMid']
+
+        assert set(stats.index) == set(exact.groups)
+        for industry, values in exact:
+            cell = stats.loc[industry]
+            assert cell['rows'] == len(values)
+            assert cell['count'] == values.count()
+            assert cell['mean'] == pytest.approx(values.mean())
+            assert cell['min'] == values.min() and cell['max'] == values.max()
+            for q in (0.25, 0.5, 0.75):
+                assert cell[f'q{round(q * 100)}'] == pytest.approx(values.quantile(q), rel=RELATIVE_ERROR * 1.01)
+
+def test_unknown_filter_value_gives_an_empty_summary():
+    sketches = QuantileSketches(salaries_frame(), ['Industry', 'RemoteType'])
+    summary = sketches.aggregate({'Industry': 'Mining'}).iloc[0]
+    assert summary['rows'] == 0
+    assert np.isnan(summary['q50'])
+
+def test_salary_summary_sketch_against_exact(client):
+    for query in ['remote_type=Remote', 'remote_type=On-site&industry=Technology']:
+        sketched = client.get(f'/api/analytics/salary-summary?{query}').get_json()
+        exact = client.get(f'/api/analytics/salary-summary?{query}&exact=true').get_json()
+        for key in ['average', 'min', 'max', 'count']:
+            assert sketched[key] == pytest.approx(exact[key]), key
+        for key in ['median', 'percentile_25', 'percentile_75']:
+            assert sketched[key] == pytest.approx(exact[key], rel=RELATIVE_ERROR * 1.01), key
+
+def test_salary_by_industry_sketch_against_exact(client):
+    sketched = client.get('/api/analytics/salary-by-industry?remote_type=Remote').get_json()
+    exact = client.get('/api/analytics/salary-by-industry?remote_type=Remote&exact=true').get_json()
+    assert [row['Industry'] for row in sketched] == [row['Industry'] for row in exact]
+    for s, e in zip(sketched, exact):
+        assert s['count'] == e['count']
+        assert s['median'] == pytest.approx(e['median'], rel=RELATIVE_ERROR * 1.01)
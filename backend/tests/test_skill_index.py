@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from indexes import SkillIndex
+
+# Ranking of the original top-skills implementation: value_counts() of the skill
+# rows whose PostingID is among the selected postings (all skill rows if none are)
+def baseline_ranking(job_postings, skills, rows):
+    posting_ids = job_postings['PostingID'].iloc[rows].unique()
+    selected = skills[skills['PostingID'].isin(posting_ids)] if len(posting_ids) > 0 else skills
+    return list(selected['Skills'].value_counts().index)
+
+def test_ranking_matches_value_counts_with_ties():
+    rng = np.random.default_rng(7)
+    job_postings = pd.DataFrame({'PostingID': np.arange(400), 'SalaryMid': rng.uniform(40000, 200000, 400)})
+    # Few skill rows over many skills, so most counts are tied
+    skills = pd.DataFrame({
+        'PostingID': rng.integers(0, 450, 600),
+        'Skills': rng.choice([f'Skill {i}' for i in range(120)], 600)
+    })
+    index = SkillIndex(job_postings, skills)
+
+    selections = [np.arange(400), rng.choice(400, 150, replace=False), rng.choice(400, 20, replace=False), np.arange(0)]
+    for rows in selections:
+        rows = np.sort(rows)
+        frequency, _ = index.skill_stats(rows)
+        ranked = [index.skill_names[code] for code in index.ranking(frequency, rows)]
+        assert ranked == baseline_ranking(job_postings, skills, rows)
+
+def test_first_rows_follow_first_appearance():
+    job_postings = pd.DataFrame({'PostingID': [1, 2, 3], 'SalaryMid': [50000, 90000, 90000]})
+    skills = pd.DataFrame({'PostingID': [3, 1, 2, 3, 2], 'Skills': ['Go', 'SQL', 'Rust', 'SQL', 'Go']})
+    index = SkillIndex(job_postings, skills)
+
+    for rows in [np.arange(3), np.array([0, 1]), np.arange(0)]:
+        posting_ids = job_postings['PostingID'].iloc[rows]
+        selected = skills[skills['PostingID'].isin(posting_ids)] if len(rows) > 0 else skills
+        frequency, _ = index.skill_stats(rows)
+        first = index.first_rows(rows)
+        seen = [code for code in np.argsort(first, kind='stable') if frequency[code] > 0]
+        assert [index.skill_names[code] for code in seen] == list(selected['Skills'].unique())
+
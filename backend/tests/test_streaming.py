@@ -0,0 +1,45 @@
+import json
+
+import pandas as pd
+
+from streaming import json_array_chunks, ndjson_chunks
+
+def test_ndjson_has_one_row_per_line(client):
+    expected = client.get('/api/skills').get_json()
+    for response in [client.get('/api/skills?format=ndjson'),
+                     client.get('/api/skills', headers={'Accept': 'application/x-ndjson'})]:
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        lines = response.get_data(as_text=True).splitlines()
+        assert [json.loads(line) for line in lines] == expected
+
+def test_chunked_array_matches_the_plain_response(client):
+    expected = client.get('/api/employer-offers').get_json()
+    response = client.get('/api/employer-offers?stream=true')
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert json.loads(response.get_data(as_text=True)) == expected
+
+def test_streaming_keeps_paging_headers(client):
+    response = client.get('/api/skills?format=ndjson&limit=4&sort=Skills')
+    assert response.headers['X-Total-Count'] == '10'
+    assert 'X-Next-Cursor' in response.headers
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row['Skills'] for row in rows] == ['Excel', 'Excel', 'Go', 'Nursing']
+
+# Several batches still form one valid array / one line per row, including categoricals
+def test_encoders_split_rows_into_batches():
+    df = pd.DataFrame({'id': range(7), 'level': pd.Categorical(['Mid', 'Senior'] * 3 + ['Mid'])})
+    records = df.to_dict('records')
+
+    chunks = list(json_array_chunks(df, batch_rows=3))
+    assert len(chunks) == 5
+    assert json.loads(b''.join(chunks)) == records
+
+    chunks = list(ndjson_chunks(df, batch_rows=3))
+    assert len(chunks) == 3
+    assert [json.loads(line) for line in b''.join(chunks).splitlines()] == records
+
+def test_empty_selection_streams_an_empty_array(client):
+    response = client.get('/api/skills?posting_id=99&stream=true')
+    assert json.loads(response.get_data(as_text=True)) == []
@@ -80,6 +80,19 @@ export const getTopSkills = (filters = {}) => {
   return api.get('/analytics/top-skills', { params: filters })
 }
 
+// Dashboard pages (every widget of a page in one response)
+export const getHomeDashboard = (filters = {}) => {
+  return api.get('/dashboard/home', { params: filters })
+}
+
+export const getSalaryOverviewDashboard = (filters = {}) => {
+  return api.get('/dashboard/salary-overview', { params: filters })
+}
+
+export const getPredictionsDashboard = (filters = {}) => {
+  return api.get('/dashboard/predictions', { params: filters })
+}
+
 // Filters
 export const getIndustries = () => {
   return api.get('/filters/industries')
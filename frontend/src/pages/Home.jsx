@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react'
 import KPICard from '../components/KPICard'
 import FilterBar from '../components/FilterBar'
-import { getOverviewKPIs, getTopSkills, getSalaryByIndustry, getSalaryDistribution } from '../api/api'
+import { getHomeDashboard } from '../api/api'
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, LineChart, Line, Cell } from 'recharts'
 import './Home.css'
 
@@ -20,30 +20,18 @@ function Home() {
   const loadData = async () => {
     setLoading(true)
     try {
-      const [kpisRes, skillsRes, industryRes, distributionRes] = await Promise.all([
-        getOverviewKPIs(filters).catch(err => {
-          console.error('Error loading KPIs:', err)
-          return { data: null }
-        }),
-        getTopSkills(filters).catch(err => {
-          console.error('Error loading skills:', err)
-          return { data: [] }
-        }),
-        getSalaryByIndustry(filters).catch(err => {
-          console.error('Error loading industries:', err)
-          return { data: [] }
-        }),
-        getSalaryDistribution(filters).catch(err => {
-          console.error('Error loading distribution:', err)
-          return { data: [] }
-        })
-      ])
+      // All widgets come from one request sharing a single filter pass on the server
+      const res = await getHomeDashboard(filters)
+      const data = res.data || {}
+      if (data.errors) {
+        console.error('Error loading widgets:', data.errors)
+      }
       
-      setKpis(kpisRes.data)
+      setKpis(data.kpis || null)
       // Slice is ONLY for display (top 10) - backend calculations use ALL real data
-      setTopSkills(skillsRes.data?.slice(0, 10) || [])
-      setSalaryByIndustry(industryRes.data?.slice(0, 10) || [])
-      setSalaryDistribution(distributionRes.data || [])
+      setTopSkills(data.top_skills?.slice(0, 10) || [])
+      setSalaryByIndustry(data.salary_by_industry?.slice(0, 10) || [])
+      setSalaryDistribution(data.salary_distribution || [])
     } catch (error) {
       console.error('Error loading data:', error)
       // Show error message to user
@@ -1,10 +1,13 @@
 import React, { useState, useEffect } from 'react'
 import FilterBar from '../components/FilterBar'
 import KPICard from '../components/KPICard'
-import { getPredictionAccuracy, getPredictionGaps, getPredictions, getPredictionKPIs } from '../api/api'
+import { getPredictionsDashboard } from '../api/api'
 import { ScatterChart, Scatter, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, BarChart, Bar, Cell, ComposedChart, Line } from 'recharts'
 import './Predictions.css'
 
+// Upper bound on points plotted in the predicted vs actual scatter
+const MAX_SCATTER_POINTS = 1000
+
 function Predictions() {
   const [filters, setFilters] = useState({})
   const [kpis, setKpis] = useState(null)
@@ -21,29 +24,18 @@ function Predictions() {
   const loadData = async () => {
     setLoading(true)
     try {
-      const [kpisRes, accuracyRes, gapsRes, predictionsRes] = await Promise.all([
-        getPredictionKPIs(filters).catch(err => {
-          console.error('Error loading KPIs:', err)
-          return { data: null }
-        }),
-        getPredictionAccuracy(filters).catch(err => {
-          console.error('Error loading accuracy:', err)
-          return { data: null }
-        }),
-        getPredictionGaps(filters).catch(err => {
-          console.error('Error loading gaps:', err)
-          return { data: [] }
-        }),
-        getPredictions(filters).catch(err => {
-          console.error('Error loading predictions:', err)
-          return { data: [] }
-        })
-      ])
+      // All widgets come from one request sharing a single filter pass on the server;
+      // the scatter is a stratified sample (keeps outliers, same points on every load)
+      const res = await getPredictionsDashboard({ ...filters, max_points: MAX_SCATTER_POINTS })
+      const data = res.data || {}
+      if (data.errors) {
+        console.error('Error loading widgets:', data.errors)
+      }
       
-      setKpis(kpisRes.data)
-      setAccuracy(accuracyRes.data)
-      setGaps(gapsRes.data || [])
-      setPredictions(predictionsRes.data || [])
+      setKpis(data.kpis || null)
+      setAccuracy(data.accuracy || null)
+      setGaps(data.gaps || [])
+      setPredictions(data.predictions || [])
     } catch (error) {
       console.error('Error loading data:', error)
       setError(error.message || 'Failed to load data')
@@ -104,7 +96,6 @@ function Predictions() {
       parseFloat(p.PredictedSalary) <= 500000 &&
       parseFloat(p.ActualSalaryYearly) <= 500000
     )
-    .slice(0, 1000)  // Limit to 1000 points for performance
     .map(p => {
       const predicted = parseFloat(p.PredictedSalary)
       const actual = parseFloat(p.ActualSalaryYearly)
@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react'
 import FilterBar from '../components/FilterBar'
 import KPICard from '../components/KPICard'
-import { getSalaryByIndustry, getSalaryByExperienceLevel, getTopSkills, getSalaryInsightsKPIs } from '../api/api'
+import { getSalaryOverviewDashboard } from '../api/api'
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, ScatterChart, Scatter, Cell } from 'recharts'
 import './SalaryOverview.css'
 
@@ -20,17 +20,17 @@ function SalaryOverview() {
   const loadData = async () => {
     setLoading(true)
     try {
-      const [kpisRes, industryRes, experienceLevelRes, skillsRes] = await Promise.all([
-        getSalaryInsightsKPIs(filters),
-        getSalaryByIndustry(filters),
-        getSalaryByExperienceLevel(filters),
-        getTopSkills(filters)
-      ])
+      // All widgets come from one request sharing a single filter pass on the server
+      const res = await getSalaryOverviewDashboard(filters)
+      const data = res.data || {}
+      if (data.errors) {
+        console.error('Error loading widgets:', data.errors)
+      }
       
-      setKpis(kpisRes.data)
-      setSalaryByIndustry(industryRes.data)
-      setSalaryByExperienceLevel(experienceLevelRes.data)
-      setTopSkills(skillsRes.data)
+      setKpis(data.kpis || null)
+      setSalaryByIndustry(data.salary_by_industry || [])
+      setSalaryByExperienceLevel(data.salary_by_experience_level || [])
+      setTopSkills(data.top_skills || [])
     } catch (error) {
       console.error('Error loading data:', error)
     } finally {
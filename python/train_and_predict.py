@@ -6,9 +6,15 @@ from sklearn.preprocessing import LabelEncoder
 from sklearn.metrics import mean_absolute_error, mean_absolute_percentage_error, r2_score
 import pickle
 import os
+import sys
 import json
 from datetime import datetime
 
+# Columnar snapshot writer shared with the backend
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+from data_store import write_table
+from forest_engine import compile_model, save_model, model_dir
+
 np.random.seed(42)
 
 # Convert all salaries to yearly units (HOURLY * 2080, MONTHLY * 12, YEARLY unchanged)
@@ -307,6 +313,19 @@ def generate_predictions(df, salary_model, comp_model, feature_cols, encoders, c
     
     return predictions
 
+# Verify the flattened forests reproduce sklearn's predictions on a sample of rows
+def check_exported_model(compiled_model, salary_model, comp_model, X, sample_size=1000):
+    X_sample = X.iloc[:sample_size]
+    salary_match = np.allclose(
+        compiled_model['salary_forest'].predict(X_sample.to_numpy()), salary_model.predict(X_sample)
+    )
+    comp_match = np.allclose(
+        compiled_model['comp_forest'].predict_proba(X_sample.to_numpy()), comp_model.predict_proba(X_sample)
+    )
+    if not (salary_match and comp_match):
+        raise ValueError("ERROR: Exported forest predictions differ from the trained models.")
+    print(f"  Exported forests match sklearn on {len(X_sample)} rows")
+
 # Main training pipeline: load data, normalize salaries, cap outliers, train models, generate predictions
 def main():
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -382,6 +401,10 @@ def main():
     print(f"\n[OK] Predictions saved to: {predictions_path}")
     print(f"  Generated {len(predictions_df)} predictions")
     
+    # Refresh the backend's columnar snapshot of the predictions table
+    write_table(os.path.join(base_dir, 'data'), 'predictions', predictions_df)
+    print(f"[OK] Predictions snapshot refreshed")
+    
     # Save trained models with encoders and metadata
     model_data = {
         'salary_model': salary_model,
@@ -402,6 +425,12 @@ def main():
         pickle.dump(model_data, f)
     print(f"[OK] Models saved to: {model_path}")
     
+    # Export both forests as flat node arrays for the backend's inference engine
+    compiled_model = compile_model(model_data)
+    check_exported_model(compiled_model, salary_model, comp_model, df_encoded[salary_features].fillna(0))
+    forest_dir = save_model(model_dir(model_path), compiled_model)
+    print(f"[OK] Forest arrays exported to: {forest_dir}")
+    
     # Save top 20 most important features for each model
     importance_data = {
         'salary_model': {
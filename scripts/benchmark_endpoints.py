@@ -0,0 +1,265 @@
+"""
+Endpoint Benchmark
+Times every /api route of backend/app.py across filter combinations, records the
+results as JSON and flags regressions against an earlier run.
+
+    python scripts/benchmark_endpoints.py --data-dir data/synthetic --output benchmarks/baseline.json
+    python scripts/benchmark_endpoints.py --data-dir data/synthetic --baseline benchmarks/baseline.json
+    python scripts/benchmark_endpoints.py --url http://localhost:5000
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(BASE_DIR, 'backend')
+
+# Routes benchmarked once, without filters
+UNFILTERED_ROUTES = ('/api/health', '/api/metrics', '/api/filters/')
+
+# Bulk tables are benchmarked one page at a time (the full table can be millions of rows)
+PAGED_ROUTES = {
+    '/api/job-postings': {'limit': '1000'},
+    '/api/skills': {'limit': '1000'},
+    '/api/employer-offers': {'limit': '1000'},
+    '/api/predictions': {'max_points': '1000'}
+}
+
+# Rows sent to /api/predict/batch
+BATCH_ROWS = 1000
+
+# The Flask app of backend/app.py, imported into this process without the artifact
+# watcher (serving data_dir when given, else data/)
+def import_app(data_dir=None, use_cache=True):
+    if data_dir:
+        os.environ['DASHBOARD_DATA_DIR'] = os.path.abspath(data_dir)
+    os.environ['DATA_RELOAD_INTERVAL'] = '0'
+    if not use_cache:
+        os.environ['RESPONSE_CACHE_SIZE'] = '0'
+    sys.path.insert(0, BACKEND_DIR)
+    os.chdir(BACKEND_DIR)
+    import app as dashboard
+    return dashboard.app
+
+# (path, method) of every /api route the app registers, in registration order
+def discover_routes(app):
+    routes = []
+    for rule in app.url_map.iter_rules():
+        if not rule.rule.startswith('/api/'):
+            continue
+        for method in sorted(rule.methods - {'HEAD', 'OPTIONS'}):
+            routes.append((rule.rule, method))
+    return routes
+
+# Requests against the app in this process (Flask test client)
+class InProcessClient:
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    # (status, body bytes, seconds)
+    def request(self, method, path, query=None, body=None):
+        started = time.perf_counter()
+        response = self.client.open(path, method=method, query_string=query or {}, json=body)
+        data = response.get_data()
+        return response.status_code, data, time.perf_counter() - started
+
+# Requests against a running server
+class HttpClient:
+    def __init__(self, url):
+        self.url = url.rstrip('/')
+
+    def request(self, method, path, query=None, body=None):
+        url = self.url + path + ('?' + urllib.parse.urlencode(query) if query else '')
+        data = json.dumps(body).encode() if body is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        req = urllib.request.Request(url, data=data, method=method, headers=headers)
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req) as response:
+                payload = response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            payload = e.read()
+            status = e.code
+        return status, payload, time.perf_counter() - started
+
+def _json(client, path, query=None):
+    status, data, _ = client.request('GET', path, query)
+    if status != 200:
+        return None
+    try:
+        return json.loads(data)
+    except ValueError:
+        return None
+
+# Filter combinations to run every filterable route with, using values present in
+# the data: the largest industry, a role level and remote type
+def filter_combinations(client):
+    industries = _json(client, '/api/analytics/salary-by-industry') or []
+    if isinstance(industries, list) and industries and 'Industry' in industries[0]:
+        industry = max(industries, key=lambda row: row.get('count') or 0)['Industry']
+    else:
+        industry = (_json(client, '/api/filters/industries') or [None])[0]
+    levels = _json(client, '/api/filters/experience-levels') or []
+    level = 'Senior' if 'Senior' in levels else (levels[0] if levels else None)
+
+    combinations = [
+        {},
+        {'industry': industry},
+        {'experience_level': level},
+        {'industry': industry, 'experience_level': level},
+        {'remote_type': 'Remote'},
+        {'compensation_type': 'Yearly', 'remote_type': 'Hybrid'},
+        {'industry': industry, 'experience_level': level, 'compensation_type': 'Yearly', 'remote_type': 'On-site'}
+    ]
+    return [{name: value for name, value in combo.items() if value} for combo in combinations]
+
+# Request bodies for the POST routes, built from postings in the data
+def prediction_bodies(client):
+    postings = _json(client, '/api/job-postings', {'limit': str(BATCH_ROWS)}) or []
+    rows = [{
+        'job_title': posting.get('JobTitle'),
+        'location': posting.get('Location'),
+        'role_level': posting.get('RoleLevel'),
+        'industry': posting.get('Industry'),
+        'remote_type': posting.get('RemoteType')
+    } for posting in postings] or [{'job_title': 'Software Engineer', 'location': 'Seattle, WA', 'role_level': 'Mid'}]
+    return {'/api/predict': rows[0], '/api/predict/batch': rows}
+
+# Every (method, path, query, body) case to time
+def benchmark_cases(client, routes):
+    combinations = filter_combinations(client)
+    bodies = prediction_bodies(client)
+    cases = []
+    for path, method in routes:
+        if method == 'POST':
+            cases.append((method, path, {}, bodies.get(path, {})))
+        elif path.startswith(UNFILTERED_ROUTES):
+            cases.append((method, path, {}, None))
+        else:
+            for combo in combinations:
+                cases.append((method, path, dict(PAGED_ROUTES.get(path, {}), **combo), None))
+    return cases
+
+def run_case(client, method, path, query, body, repeat, warmup):
+    for _ in range(warmup):
+        client.request(method, path, query, body)
+    timings = []
+    for _ in range(repeat):
+        status, data, seconds = client.request(method, path, query, body)
+        timings.append(seconds * 1000)
+    timings.sort()
+    return {
+        'method': method,
+        'route': path,
+        'query': query,
+        'status': status,
+        'bytes': len(data),
+        'runs': repeat,
+        'min_ms': round(timings[0], 3),
+        'median_ms': round(statistics.median(timings), 3),
+        'p95_ms': round(timings[min(len(timings) - 1, int(round(0.95 * (len(timings) - 1))))], 3),
+        'mean_ms': round(statistics.fmean(timings), 3)
+    }
+
+def _case_key(result):
+    return (result['method'], result['route'], json.dumps(result['query'], sort_keys=True))
+
+# Cases whose median got slower than the baseline's by more than tolerance
+# (relative) and min_delta_ms (absolute)
+def regressions(results, baseline, tolerance, min_delta_ms):
+    previous = {_case_key(result): result for result in baseline['results']}
+    slower = []
+    for result in results:
+        before = previous.get(_case_key(result))
+        if before is None:
+            continue
+        delta = result['median_ms'] - before['median_ms']
+        if delta > min_delta_ms and result['median_ms'] > before['median_ms'] * (1 + tolerance):
+            slower.append((result, before))
+    return slower
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _describe(query):
+    return '&'.join(f'{name}={value}' for name, value in query.items()) or '-'
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every /api route of the dashboard backend')
+    parser.add_argument('--data-dir', help='transformed tables to load in-process (default data/)')
+    parser.add_argument('--url', help='benchmark a running server instead of an in-process app')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per case (default 5)')
+    parser.add_argument('--warmup', type=int, default=1, help='untimed runs per case (default 1)')
+    parser.add_argument('--route', action='append', help='only routes starting with this prefix (repeatable)')
+    parser.add_argument('--with-cache', action='store_true', help='keep the response cache on (in-process only)')
+    parser.add_argument('--output', help='results file (default benchmarks/<timestamp>.json)')
+    parser.add_argument('--baseline', help='earlier results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative slowdown (default 0.2)')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0, help='ignore slowdowns below this (default 1ms)')
+    args = parser.parse_args()
+
+    # Against a running server the routes still come from this checkout's app
+    app = import_app(None if args.url else args.data_dir, args.with_cache)
+    client = HttpClient(args.url) if args.url else InProcessClient(app)
+    routes = discover_routes(app)
+    if args.route:
+        routes = [(path, method) for path, method in routes if path.startswith(tuple(args.route))]
+    cases = benchmark_cases(client, routes)
+
+    print("=" * 60)
+    print(f"Benchmarking {len(routes)} routes, {len(cases)} cases, {args.repeat} runs each")
+    print("=" * 60)
+    results = []
+    for method, path, query, body in cases:
+        result = run_case(client, method, path, query, body, args.repeat, args.warmup)
+        results.append(result)
+        print(f"  {result['median_ms']:9.2f} ms  p95 {result['p95_ms']:9.2f} ms  {result['status']}  "
+              f"{result['bytes']:>10,} B  {method} {path} {_describe(query)}")
+
+    report = {
+        'meta': {
+            'created': datetime.now().isoformat(),
+            'commit': git_commit(),
+            'target': args.url or os.path.abspath(args.data_dir or os.path.join(BASE_DIR, 'data')),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'response_cache': bool(args.with_cache)
+        },
+        'results': results
+    }
+
+    output = args.output or os.path.join(BASE_DIR, 'benchmarks', datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n[OK] Results saved to: {output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        slower = regressions(results, baseline, args.tolerance, args.min_delta_ms)
+        if slower:
+            print(f"\n[REGRESSION] {len(slower)} cases slower than {args.baseline}:")
+            for result, before in slower:
+                print(f"  {before['median_ms']:9.2f} -> {result['median_ms']:9.2f} ms  "
+                      f"{result['method']} {result['route']} {_describe(result['query'])}")
+            sys.exit(1)
+        print(f"[OK] No regressions against {args.baseline}")
+
+if __name__ == '__main__':
+    main()
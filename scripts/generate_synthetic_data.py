@@ -0,0 +1,285 @@
+"""
+Synthetic Dataset Generator
+Writes transformed_*.csv files with the same schema as transform_real_data.py and
+train_and_predict.py at any scale (100k, 1M, 10M postings), for benchmarking.
+Vocabularies (titles, locations, industries, skills) come from the real data when
+it is present, with long-tailed frequencies like the real ones.
+
+    python scripts/generate_synthetic_data.py --postings 1M --output data/synthetic/1m
+"""
+
+import pandas as pd
+import numpy as np
+import argparse
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, 'data')
+MAPPINGS_DIR = os.path.join(BASE_DIR, 'Real Data', 'mappings')
+
+# Columnar snapshot writer shared with the backend
+sys.path.insert(0, os.path.join(BASE_DIR, 'backend'))
+from data_store import TABLE_FILES, build_from_csv
+
+# Used when the real data is not available
+FALLBACK_TITLES = [
+    'Software Engineer', 'Senior Software Engineer', 'Data Analyst', 'Registered Nurse',
+    'Sales Representative', 'Project Manager', 'Account Executive', 'Customer Service Representative',
+    'Junior Accountant', 'Marketing Manager', 'Lead Mechanical Engineer', 'Administrative Assistant',
+    'Warehouse Associate', 'Financial Analyst', 'Principal Data Scientist', 'HR Generalist'
+]
+FALLBACK_LOCATIONS = [
+    'New York, NY', 'Los Angeles, CA', 'Chicago, IL', 'Houston, TX', 'Phoenix, AZ', 'Philadelphia, PA',
+    'San Antonio, TX', 'San Diego, CA', 'Dallas, TX', 'Seattle, WA', 'Denver, CO', 'Boston, MA',
+    'Atlanta, GA', 'Miami, FL', 'Portland, OR', 'Austin, TX'
+]
+FALLBACK_INDUSTRIES = [
+    'IT Services and IT Consulting', 'Hospitals and Health Care', 'Staffing and Recruiting',
+    'Financial Services', 'Retail', 'Software Development', 'Manufacturing', 'Construction',
+    'Higher Education', 'Insurance'
+]
+FALLBACK_SKILLS = [
+    'Information Technology', 'Sales', 'Management', 'Manufacturing', 'Health Care Provider',
+    'Engineering', 'Other', 'Business Development', 'Finance', 'Accounting/Auditing', 'Marketing'
+]
+
+# Title variants that stretch the real titles to larger vocabularies
+TITLE_SUFFIXES = [' II', ' III', ' - Remote', ' (Contract)', ' - Night Shift', ' Specialist', ' - Hybrid', ' Trainee']
+
+# Same rule as transform_real_data.py: role level inferred from the title
+SENIOR_WORDS = ['senior', 'sr', 'lead', 'principal', 'staff', 'architect']
+JUNIOR_WORDS = ['junior', 'jr', 'entry', 'associate', 'intern', 'trainee']
+WEST_STATES = ['CA', 'WA', 'OR', 'NV', 'AZ', 'UT', 'CO', 'WY', 'MT', 'ID', 'AK', 'HI']
+
+LEVEL_PAY = {'Junior': 0.75, 'Mid': 1.0, 'Senior': 1.35}
+REMOTE_TYPES = (['On-site', 'Hybrid', 'Remote'], [0.7, 0.15, 0.15])
+EMPLOYMENT_TYPES = (['Full-time', 'Contract', 'Part-time', 'Internship'], [0.85, 0.07, 0.05, 0.03])
+SOURCES = (['LinkedIn', 'Indeed', 'Company Website'], [0.8, 0.12, 0.08])
+HOURLY_SHARE = 0.05
+COMPANY_WORDS = ['Summit', 'Pioneer', 'Harbor', 'Granite', 'Evergreen', 'Atlas', 'Beacon', 'Cedar', 'Northwind', 'Blue Ridge']
+COMPANY_SUFFIXES = ['Inc.', 'LLC', 'Group', 'Partners', 'Systems', 'Health', 'Labs', 'Holdings']
+
+# "100k", "1M", "10m" or plain numbers
+def parse_count(value):
+    value = value.strip().lower().replace('_', '')
+    multiplier = {'k': 1_000, 'm': 1_000_000}.get(value[-1:], 1)
+    number = value[:-1] if multiplier > 1 else value
+    try:
+        return int(float(number) * multiplier)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'Invalid count: {value}')
+
+def _read_column(path, column):
+    if not os.path.exists(path):
+        return []
+    values = pd.read_csv(path, usecols=[column])[column].dropna().astype(str).str.strip()
+    return [value for value in values.unique() if value]
+
+# Long-tailed (Zipf-like) selection probabilities over n values, in random order
+def zipf_weights(rng, n, exponent=1.05):
+    weights = 1.0 / (np.arange(n) + 10.0) ** exponent
+    rng.shuffle(weights)
+    return weights / weights.sum()
+
+# Value lists and per-value weights/pay factors of every generated dimension.
+# n_titles distinct titles (default: a tenth of the postings, at least the real ones)
+def load_vocabulary(rng, n_postings, n_titles=None):
+    offers_path = os.path.join(DATA_DIR, TABLE_FILES['employer_offers'])
+    titles = _read_column(offers_path, 'Role') or FALLBACK_TITLES
+    n_titles = n_titles or max(len(titles), n_postings // 10)
+    locations = _read_column(offers_path, 'Location') or FALLBACK_LOCATIONS
+    industries = _read_column(os.path.join(MAPPINGS_DIR, 'industries.csv'), 'industry_name') or FALLBACK_INDUSTRIES
+
+    # Skill frequencies as in the real skills table when it is there
+    skills_path = os.path.join(DATA_DIR, TABLE_FILES['skills'])
+    if os.path.exists(skills_path):
+        counts = pd.read_csv(skills_path, usecols=['Skills'])['Skills'].dropna().astype(str).value_counts()
+        skills, skill_weights = counts.index.tolist(), (counts / counts.sum()).to_numpy()
+    else:
+        skills = FALLBACK_SKILLS
+        skill_weights = zipf_weights(rng, len(skills), exponent=0.8)
+
+    # Grow (or cut) the title list to the requested cardinality
+    vocabulary = list(titles)
+    for suffix in TITLE_SUFFIXES:
+        if len(vocabulary) >= n_titles:
+            break
+        vocabulary.extend(f'{title}{suffix}' for title in titles)
+    round_number = 2
+    while len(vocabulary) < n_titles:
+        vocabulary.extend(f'{title} {round_number}' for title in titles)
+        round_number += 1
+    titles = np.array(vocabulary[:n_titles], dtype=object)
+
+    lowered = pd.Series(titles).str.lower()
+    senior = lowered.str.contains('|'.join(SENIOR_WORDS))
+    junior = lowered.str.contains('|'.join(JUNIOR_WORDS))
+    levels = np.where(senior, 'Senior', np.where(junior, 'Junior', 'Mid')).astype(object)
+
+    locations = np.array(locations, dtype=object)
+    states = pd.Series(locations).str.extract(r',\s*([A-Z]{2})$')[0].fillna('')
+    regions = np.where(states.isin(WEST_STATES), 'West', 'East').astype(object)
+
+    return {
+        'titles': titles,
+        'title_levels': levels,
+        # Typical yearly pay of each title before level/industry/location effects
+        'title_pay': rng.lognormal(np.log(65000), 0.35, len(titles)),
+        'title_weights': zipf_weights(rng, len(titles)),
+        'locations': locations,
+        'location_regions': regions,
+        'location_pay': rng.lognormal(0, 0.12, len(locations)),
+        'location_weights': zipf_weights(rng, len(locations), exponent=1.1),
+        'industries': np.array(industries, dtype=object),
+        'industry_pay': rng.lognormal(0, 0.15, len(industries)),
+        'industry_weights': zipf_weights(rng, len(industries), exponent=0.9),
+        'skills': np.array(skills, dtype=object),
+        'skill_weights': np.asarray(skill_weights, dtype=float),
+        'companies': np.array([f'{word} {name} {suffix}' for word in COMPANY_WORDS
+                               for name in ('Solutions', 'Industries', 'Care', 'Logistics', 'Digital')
+                               for suffix in COMPANY_SUFFIXES], dtype=object)
+    }
+
+def _pick(rng, choices, size):
+    values, weights = choices
+    return np.array(values, dtype=object)[rng.choice(len(values), size=size, p=weights)]
+
+# One chunk of the four tables for PostingIDs first_id .. first_id + size - 1.
+# Employer offers keep the first posting of every (title, location) pair not in seen_pairs.
+def generate_chunk(rng, vocab, first_id, size, start_date, n_days, seen_pairs):
+    posting_ids = np.arange(first_id, first_id + size, dtype=np.int64)
+    title_idx = rng.choice(len(vocab['titles']), size=size, p=vocab['title_weights'])
+    location_idx = rng.choice(len(vocab['locations']), size=size, p=vocab['location_weights'])
+    industry_idx = rng.choice(len(vocab['industries']), size=size, p=vocab['industry_weights'])
+    levels = vocab['title_levels'][title_idx]
+    level_pay = pd.Series(levels).map(LEVEL_PAY).to_numpy(dtype=float)
+
+    yearly = (vocab['title_pay'][title_idx] * level_pay * vocab['industry_pay'][industry_idx]
+              * vocab['location_pay'][location_idx] * rng.lognormal(0, 0.2, size))
+    yearly = np.clip(yearly, 18000, 600000)
+    hourly = rng.random(size) < HOURLY_SHARE
+    salary_mid = np.where(hourly, yearly / 2080, yearly)
+    spread = rng.uniform(0.05, 0.25, size)
+    dates = start_date + pd.to_timedelta(rng.integers(0, n_days, size), unit='D')
+    industries = vocab['industries'][industry_idx]
+    compensation = np.where(hourly, 'Hourly', 'Yearly').astype(object)
+    locations = vocab['locations'][location_idx]
+
+    job_postings = pd.DataFrame({
+        'PostingID': posting_ids,
+        'JobTitle': vocab['titles'][title_idx],
+        'RoleLevel': levels,
+        'Company': vocab['companies'][rng.integers(0, len(vocab['companies']), size)],
+        'Location': locations,
+        'Country': 'US',
+        'Region': vocab['location_regions'][location_idx],
+        'City': locations,
+        'EmploymentType': _pick(rng, EMPLOYMENT_TYPES, size),
+        'CompensationType': compensation,
+        'SalaryMin': (salary_mid * (1 - spread)).astype(np.int64),
+        'SalaryMax': (salary_mid * (1 + spread)).astype(np.int64),
+        'SalaryMid': salary_mid.astype(np.int64),
+        'PostedDate': dates.strftime('%Y-%m-%d'),
+        'Source': _pick(rng, SOURCES, size),
+        'RemoteType': _pick(rng, REMOTE_TYPES, size),
+        'Industry': industries
+    })
+
+    # 1-6 distinct skills per posting, about 1.7 on average
+    skill_counts = np.minimum(1 + rng.poisson(0.7, size), 6)
+    skills = pd.DataFrame({
+        'PostingID': np.repeat(posting_ids, skill_counts),
+        'Skills': vocab['skills'][rng.choice(len(vocab['skills']), size=int(skill_counts.sum()), p=vocab['skill_weights'])]
+    }).drop_duplicates()
+
+    actual = np.round(yearly)
+    predicted = np.round(actual * rng.lognormal(0, 0.15, size))
+    interval = np.round(1.96 * predicted * rng.uniform(0.05, 0.2, size))
+    comp_confidence = np.round(rng.uniform(0.6, 1.0, size), 3)
+    predictions = pd.DataFrame({
+        'PostingID': posting_ids,
+        'PredictedSalary': predicted.astype(np.int64),
+        'PredictedSalaryLower': np.maximum(predicted - interval, 0).astype(np.int64),
+        'PredictedSalaryUpper': (predicted + interval).astype(np.int64),
+        'ActualSalaryYearly': actual.astype(np.int64),
+        'Industry': industries,
+        'RoleLevel': levels,
+        'PredictedCompType': compensation,
+        'PredictedCompTypeConfidence': comp_confidence,
+        'ConfidenceScore': np.round((comp_confidence + rng.uniform(0.5, 0.95, size)) / 2, 3),
+        'ModelVersion': 1.0
+    })
+
+    pair_keys = title_idx.astype(np.int64) * len(vocab['locations']) + location_idx
+    _, first_rows = np.unique(pair_keys, return_index=True)
+    first_rows = np.sort(first_rows)
+    new_pairs = first_rows[~np.isin(pair_keys[first_rows], seen_pairs)]
+    offers = job_postings.iloc[new_pairs]
+    employer_offers = pd.DataFrame({
+        'Role': offers['JobTitle'].to_numpy(),
+        'Location': offers['Location'].to_numpy(),
+        'SalaryOffer': offers['SalaryMid'].to_numpy(),
+        'CompensationType': offers['CompensationType'].to_numpy(),
+        'PostedDate': offers['PostedDate'].to_numpy(),
+        'Status': 'Active'
+    })
+
+    return {
+        'job_postings': job_postings,
+        'skills': skills,
+        'predictions': predictions,
+        'employer_offers': employer_offers
+    }, np.union1d(seen_pairs, pair_keys[new_pairs])
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic transformed_*.csv files for benchmarking')
+    parser.add_argument('--postings', type=parse_count, default=parse_count('100k'),
+                        help='number of job postings, e.g. 100k, 1M, 10M (default 100k)')
+    parser.add_argument('--output', default=os.path.join(DATA_DIR, 'synthetic'),
+                        help='output directory (default data/synthetic)')
+    parser.add_argument('--titles', type=parse_count, default=None,
+                        help='distinct job titles (default: postings / 10, at least the real titles)')
+    parser.add_argument('--start-date', default='2023-01-01')
+    parser.add_argument('--end-date', default='2024-12-31')
+    parser.add_argument('--chunk-size', type=parse_count, default=parse_count('500k'))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-snapshot', action='store_true', help='skip writing the columnar snapshots')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    vocab = load_vocabulary(rng, args.postings, args.titles)
+    start_date = pd.Timestamp(args.start_date)
+    n_days = max((pd.Timestamp(args.end_date) - start_date).days + 1, 1)
+
+    print("=" * 60)
+    print(f"Generating {args.postings:,} synthetic postings into {args.output}")
+    print(f"  {len(vocab['titles']):,} titles, {len(vocab['locations']):,} locations, "
+          f"{len(vocab['industries']):,} industries, {len(vocab['skills']):,} skills")
+    print("=" * 60)
+
+    os.makedirs(args.output, exist_ok=True)
+    paths = {table: os.path.join(args.output, filename) for table, filename in TABLE_FILES.items()}
+    rows_written = dict.fromkeys(TABLE_FILES, 0)
+    seen_pairs = np.empty(0, dtype=np.int64)
+    first_id = 1_000_000
+
+    for start in range(0, args.postings, args.chunk_size):
+        size = min(args.chunk_size, args.postings - start)
+        tables, seen_pairs = generate_chunk(rng, vocab, first_id + start, size, start_date, n_days, seen_pairs)
+        for table, df in tables.items():
+            df.to_csv(paths[table], mode='w' if start == 0 else 'a', header=start == 0, index=False)
+            rows_written[table] += len(df)
+        print(f"  [OK] {start + size:,} / {args.postings:,} postings")
+
+    for table, rows in rows_written.items():
+        print(f"  [OK] {TABLE_FILES[table]}: {rows:,} rows")
+
+    if not args.no_snapshot:
+        print("\nWriting columnar snapshots...")
+        build_from_csv(args.output)
+
+    print(f"\nServe it with: DASHBOARD_DATA_DIR={args.output} python backend/app.py")
+
+if __name__ == '__main__':
+    main()
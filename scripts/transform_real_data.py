@@ -7,6 +7,7 @@ Processes ALL rows - nothing left behind
 import pandas as pd
 import numpy as np
 import os
+import sys
 from datetime import datetime
 
 # Set paths
@@ -14,6 +15,10 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 REAL_DATA_DIR = os.path.join(BASE_DIR, 'Real Data')
 OUTPUT_DIR = os.path.join(BASE_DIR, 'data')
 
+# Columnar snapshot writer shared with the backend
+sys.path.insert(0, os.path.join(BASE_DIR, 'backend'))
+from data_store import write_table
+
 print("=" * 60)
 print("TRANSFORMING REAL DATA - NO SYNTHETIC DATA")
 print("=" * 60)
@@ -390,6 +395,14 @@ print(f"   [OK] Created empty transformed_predictions.csv (will be filled by ML
 employer_offers_df.to_csv(os.path.join(OUTPUT_DIR, 'transformed_employer_offers.csv'), index=False)
 print(f"   [OK] Saved transformed_employer_offers.csv ({len(employer_offers_df):,} rows - ALL REAL DATA)")
 
+# Columnar snapshots so the backend can start without re-parsing the CSVs
+print("\n12. Writing columnar snapshots for the backend...")
+write_table(OUTPUT_DIR, 'job_postings', job_postings_df)
+write_table(OUTPUT_DIR, 'skills', skills_df)
+write_table(OUTPUT_DIR, 'predictions', predictions_df)
+write_table(OUTPUT_DIR, 'employer_offers', employer_offers_df)
+print(f"   [OK] Snapshots saved to {os.path.join(OUTPUT_DIR, 'snapshot')}")
+
 print("\n" + "=" * 60)
 print("[SUCCESS] DATA TRANSFORMATION COMPLETE!")
 print("=" * 60)